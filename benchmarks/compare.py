@@ -0,0 +1,47 @@
+"""Compare two benchmark result files produced by ``run.py``.
+
+Usage::
+
+    python benchmarks/compare.py baseline.json current.json [--threshold 1.1]
+
+Prints the median-time ratio (current / baseline) for every benchmark present
+in both runs, matched by file name and benchmark name. Exits with status 1 if
+any ratio exceeds the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _index(report: dict[str, Any]) -> dict[tuple[str, str], dict[str, Any]]:
+    return {(Path(r["file"]).name, r["benchmark"]): r for r in report["results"]}
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("baseline", type=Path)
+    p.add_argument("current", type=Path)
+    p.add_argument("--threshold", type=float, default=1.1,
+                   help="flag benchmarks slower than baseline by this factor")
+    args = p.parse_args(argv)
+
+    base = _index(json.loads(args.baseline.read_text()))
+    cur = _index(json.loads(args.current.read_text()))
+    regressed = False
+    for key in sorted(base.keys() & cur.keys()):
+        b, c = base[key], cur[key]
+        ratio = c["median_s"] / b["median_s"] if b["median_s"] else float("inf")
+        mem = c["peak_bytes"] / b["peak_bytes"] if b["peak_bytes"] else float("inf")
+        flag = " REGRESSION" if ratio > args.threshold else ""
+        regressed |= bool(flag)
+        print(f"{key[0]:30s} {key[1]:14s} time x{ratio:6.2f}  memory x{mem:6.2f}{flag}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
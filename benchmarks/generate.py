@@ -0,0 +1,282 @@
+"""Synthetic PTIR5 file generator for benchmarks.
+
+Writes HDF5 files with the PTIR5 layout (MEASUREMENTS, BACKGROUNDS, TREE)
+at configurable scale, so scaling behaviour can be measured on files much
+larger than the test fixtures.
+
+Usage::
+
+    python benchmarks/generate.py out.ptir --spectra 2000 --cubes 4 \\
+        --cube-shape 400x128x128 --chunks pixel --compression gzip:4
+"""
+
+from __future__ import annotations
+
+import argparse
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_NODE_CHUNKS = (100, 16)
+
+
+@dataclass
+class GeneratorConfig:
+    """Shape of a synthetic file. See ``--help`` for the meaning of each field."""
+
+    spectra: int = 100
+    spectrum_points: int = 1024
+    images: int = 0
+    image_shape: tuple[int, int] = (256, 256)
+    cubes: int = 1
+    cube_shape: tuple[int, int, int] = (200, 32, 32)
+    stacks: int = 0
+    stack_shape: tuple[int, int, int, int] = (10, 256, 256, 4)
+    generated_per_cube: int = 2
+    backgrounds: int = 1
+    chunks: str = "none"
+    compression: str = "none"
+    tree_depth: int = 2
+    tree_fanout: int = 4
+    metadata_attrs: int = 20
+    seed: int = 0
+
+
+def _parse_shape(text: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in text.lower().split("x"))
+
+
+def _compression_kwargs(spec: str) -> dict[str, Any]:
+    if spec == "none":
+        return {}
+    if spec == "lzf":
+        return {"compression": "lzf", "shuffle": True}
+    if spec.startswith("gzip"):
+        _, _, level = spec.partition(":")
+        return {"compression": "gzip", "compression_opts": int(level or 4), "shuffle": True}
+    raise ValueError(f"Unknown compression {spec!r} (use none, lzf or gzip[:N])")
+
+
+def _chunk_shape(spec: str, shape: tuple[int, ...]) -> tuple[int, ...] | bool | None:
+    """Chunk layout for a DATA array: none, auto, plane, pixel, or an explicit AxBxC."""
+    if spec == "none":
+        return None
+    if spec == "auto":
+        return True
+    if spec == "plane":
+        return (1, *shape[1:]) if len(shape) > 1 else shape
+    if spec == "pixel":
+        if len(shape) == 3:
+            return (shape[0], min(8, shape[1]), min(8, shape[2]))
+        if len(shape) == 4:
+            return (shape[0], min(8, shape[1]), min(8, shape[2]), shape[3])
+        return shape
+    explicit = _parse_shape(spec)
+    if len(explicit) != len(shape):
+        return None
+    return tuple(min(c, s) for c, s in zip(explicit, shape, strict=True))
+
+
+def _set_str(attrs: Any, key: str, value: str) -> None:
+    attrs[key] = np.bytes_(value.encode("utf-8"))
+
+
+def _set_num(attrs: Any, key: str, value: float) -> None:
+    # PTIR Studio stores scalars as length-1 arrays.
+    attrs[key] = np.array([value], dtype=np.float32)
+
+
+def _write_metadata(group: h5py.Group, type_: str, label: str, cfg: GeneratorConfig) -> None:
+    _set_str(group.attrs, "TYPE", type_)
+    _set_str(group.attrs, "Label", label)
+    for i in range(cfg.metadata_attrs):
+        if i % 2:
+            _set_num(group.attrs, f"Param{i:04d}", float(i))
+        else:
+            _set_str(group.attrs, f"Param{i:04d}", f"value-{i}")
+    channel = group.create_group("Channel")
+    _set_str(channel.attrs, "Units", "mV")
+    _set_str(channel.attrs, "Label", "Channel 1")
+
+
+def _write_data(
+    group: h5py.Group,
+    data: np.ndarray[Any, Any],
+    cfg: GeneratorConfig,
+) -> None:
+    chunks = _chunk_shape(cfg.chunks, data.shape) if data.ndim > 1 else None
+    kwargs = _compression_kwargs(cfg.compression) if chunks is not None else {}
+    group.create_dataset("DATA", data=data, chunks=chunks, **kwargs)
+
+
+def _guid_bytes(guids: list[str]) -> np.ndarray[Any, Any]:
+    raw = b"".join(uuid.UUID(g).bytes_le for g in guids)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(guids), 16)
+
+
+def _write_nodes(group: h5py.Group, guids: list[str]) -> None:
+    nodes = _guid_bytes(guids) if guids else np.zeros((0, 16), dtype=np.uint8)
+    group.create_dataset("NODES", data=nodes, chunks=_NODE_CHUNKS, maxshape=(None, 16))
+
+
+def _write_tree(
+    h5: h5py.File,
+    leaves: list[tuple[str, str, str]],
+    cfg: GeneratorConfig,
+    new_guid: Callable[[], str],
+) -> None:
+    """Distribute *leaves* (guid, type, label) over a folder tree of the given depth/fanout."""
+    tree = h5.create_group("TREE")
+    _set_str(tree.attrs, "TYPE", "ROOT")
+    for guid, type_, label in leaves:
+        node = tree.create_group(guid)
+        _set_str(node.attrs, "TYPE", type_)
+        _set_str(node.attrs, "Label", label)
+
+    def build(level: int, items: list[str], name: str) -> list[str]:
+        if level >= cfg.tree_depth or len(items) <= 1:
+            return items
+        fanout = max(1, cfg.tree_fanout)
+        per = -(-len(items) // fanout)
+        children: list[str] = []
+        for i in range(fanout):
+            part = items[i * per : (i + 1) * per]
+            if not part:
+                break
+            folder_guid = new_guid()
+            folder = tree.create_group(folder_guid)
+            _set_str(folder.attrs, "TYPE", "FOLDER")
+            _set_str(folder.attrs, "Label", f"{name}.{i}")
+            _write_nodes(folder, build(level + 1, part, f"{name}.{i}"))
+            children.append(folder_guid)
+        return children
+
+    _write_nodes(tree, build(0, [guid for guid, _, _ in leaves], "Folder"))
+
+
+def generate(path: str | Path, cfg: GeneratorConfig) -> Path:
+    """Write a synthetic PTIR5 file to *path* and return it."""
+    path = Path(path)
+    rng = np.random.default_rng(cfg.seed)
+    leaves: list[tuple[str, str, str]] = []
+
+    def new_guid() -> str:
+        return str(uuid.UUID(bytes=rng.bytes(16), version=4))
+
+    with h5py.File(path, "w") as h5:
+        _set_str(h5.attrs, "DocType", "PTIR5")
+        measurements = h5.create_group("MEASUREMENTS")
+        backgrounds = h5.create_group("BACKGROUNDS")
+
+        for i in range(cfg.spectra):
+            guid = new_guid()
+            g = measurements.create_group(guid)
+            _write_metadata(g, "OPTIRSpectrum", f"Spectrum {i}", cfg)
+            _set_num(g.attrs, "XStart", 800.0 + (i % 3))
+            _set_num(g.attrs, "XIncrement", 2.0)
+            _write_data(g, rng.random(cfg.spectrum_points, dtype=np.float32), cfg)
+            leaves.append((guid, "OPTIRSpectrum", f"Spectrum {i}"))
+
+        for i in range(cfg.images):
+            guid = new_guid()
+            g = measurements.create_group(guid)
+            _write_metadata(g, "OPTIRImage", f"Image {i}", cfg)
+            _set_num(g.attrs, "ImageWidth", 100.0)
+            _set_num(g.attrs, "ImageHeight", 100.0)
+            _write_data(g, rng.random(cfg.image_shape, dtype=np.float32), cfg)
+            leaves.append((guid, "OPTIRImage", f"Image {i}"))
+
+        for i in range(cfg.cubes):
+            guid = new_guid()
+            g = measurements.create_group(guid)
+            _write_metadata(g, "OPTIRHyperspectra", f"Hyperspectra {i}", cfg)
+            _set_num(g.attrs, "XStart", 800.0)
+            _set_num(g.attrs, "XIncrement", 2.0)
+            _set_num(g.attrs, "ImageWidth", 50.0)
+            _set_num(g.attrs, "ImageHeight", 50.0)
+            _write_data(g, rng.random(cfg.cube_shape, dtype=np.float32), cfg)
+            gen = g.create_group("GENERATED")
+            for j in range(cfg.generated_per_cube):
+                child = gen.create_group(new_guid())
+                if j % 2:
+                    _write_metadata(child, "GeneratedImage", f"Band {j}", cfg)
+                    data = rng.random(cfg.cube_shape[1:], dtype=np.float32)
+                else:
+                    _write_metadata(child, "GeneratedSpectrum", f"ROI {j}", cfg)
+                    _set_num(child.attrs, "XStart", 800.0)
+                    _set_num(child.attrs, "XIncrement", 2.0)
+                    data = rng.random(cfg.cube_shape[0], dtype=np.float32)
+                _write_data(child, data, cfg)
+            leaves.append((guid, "OPTIRHyperspectra", f"Hyperspectra {i}"))
+
+        for i in range(cfg.stacks):
+            guid = new_guid()
+            g = measurements.create_group(guid)
+            _write_metadata(g, "CameraImageStack", f"Stack {i}", cfg)
+            _set_str(g.attrs, "PixelFormat", "Bgra32")
+            _set_num(g.attrs, "ImageWidth", 500.0)
+            _set_num(g.attrs, "ImageHeight", 500.0)
+            data = rng.integers(0, 255, cfg.stack_shape, dtype=np.uint8)
+            _write_data(g, data, cfg)
+            leaves.append((guid, "CameraImageStack", f"Stack {i}"))
+
+        for i in range(cfg.backgrounds):
+            g = backgrounds.create_group(new_guid())
+            _write_metadata(g, "OPTIRSpectrum", f"Background {i}", cfg)
+            _set_num(g.attrs, "XStart", 800.0)
+            _set_num(g.attrs, "XIncrement", 2.0)
+            _write_data(g, rng.random(cfg.spectrum_points, dtype=np.float32), cfg)
+
+        _write_tree(h5, leaves, cfg, new_guid)
+    return path
+
+
+def config_dict(cfg: GeneratorConfig) -> dict[str, Any]:
+    return asdict(cfg)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = GeneratorConfig()
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("output", type=Path)
+    p.add_argument("--spectra", type=int, default=defaults.spectra)
+    p.add_argument("--spectrum-points", type=int, default=defaults.spectrum_points)
+    p.add_argument("--images", type=int, default=defaults.images)
+    p.add_argument("--image-shape", type=_parse_shape, default=defaults.image_shape,
+                   help="HxW")
+    p.add_argument("--cubes", type=int, default=defaults.cubes)
+    p.add_argument("--cube-shape", type=_parse_shape, default=defaults.cube_shape,
+                   help="POINTSxHxW")
+    p.add_argument("--stacks", type=int, default=defaults.stacks)
+    p.add_argument("--stack-shape", type=_parse_shape, default=defaults.stack_shape,
+                   help="FRAMESxHxWxBPP")
+    p.add_argument("--generated-per-cube", type=int, default=defaults.generated_per_cube)
+    p.add_argument("--backgrounds", type=int, default=defaults.backgrounds)
+    p.add_argument("--chunks", default=defaults.chunks,
+                   help="none, auto, plane, pixel, or an explicit AxBxC shape")
+    p.add_argument("--compression", default=defaults.compression,
+                   help="none, lzf, or gzip[:LEVEL] (chunked datasets only)")
+    p.add_argument("--tree-depth", type=int, default=defaults.tree_depth)
+    p.add_argument("--tree-fanout", type=int, default=defaults.tree_fanout)
+    p.add_argument("--metadata-attrs", type=int, default=defaults.metadata_attrs,
+                   help="extra attributes written on every measurement")
+    p.add_argument("--seed", type=int, default=defaults.seed)
+    return p
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = vars(build_parser().parse_args(argv))
+    output = args.pop("output")
+    path = generate(output, GeneratorConfig(**args))
+    print(f"wrote {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Benchmark runner for ptir5.
+
+Times file opening, structure traversal, metadata loading and data reads on
+real or synthetic files, records peak traced memory per benchmark, and
+writes the results as JSON so runs can be compared over time.
+
+Usage::
+
+    python benchmarks/run.py --preset medium --output results.json
+    python benchmarks/run.py my_file.ptir --repeat 5
+    python benchmarks/compare.py baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+from generate import GeneratorConfig, config_dict, generate
+
+import ptir5
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PRESETS: dict[str, GeneratorConfig] = {
+    "small": GeneratorConfig(spectra=200, cubes=1, cube_shape=(200, 32, 32)),
+    "medium": GeneratorConfig(
+        spectra=2000, images=20, cubes=4, cube_shape=(400, 64, 64), stacks=1,
+        stack_shape=(20, 256, 256, 4), tree_depth=3, metadata_attrs=50,
+    ),
+    "large": GeneratorConfig(
+        spectra=10000, images=100, cubes=8, cube_shape=(800, 128, 128), stacks=4,
+        stack_shape=(50, 512, 512, 4), tree_depth=4, tree_fanout=6, metadata_attrs=100,
+    ),
+    "chunked": GeneratorConfig(
+        spectra=500, cubes=4, cube_shape=(400, 64, 64), chunks="pixel",
+        compression="gzip:4",
+    ),
+}
+
+_SPECTRUM_SAMPLES = 100
+_IMAGE_SAMPLES = 20
+
+
+def _cubes(f: ptir5.PTIR5File) -> list[ptir5.FloatHypercube3D]:
+    return [m for m in f.measurements if isinstance(m, ptir5.FloatHypercube3D)]
+
+
+def bench_open(path: Path) -> Callable[[], Any]:
+    def run() -> None:
+        ptir5.open(path).close()
+    return run
+
+
+def bench_measurements(path: Path) -> Callable[[], Any]:
+    def run() -> int:
+        with ptir5.open(path) as f:
+            return len(f.measurements)
+    return run
+
+
+def bench_tree(path: Path) -> Callable[[], Any]:
+    def run() -> int:
+        with ptir5.open(path) as f:
+            tree = f.tree
+            return 0 if tree is None else sum(len(leaves) for _, _, leaves in tree.walk())
+    return run
+
+
+def bench_labels(path: Path) -> Callable[[], Any]:
+    def run() -> int:
+        with ptir5.open(path) as f:
+            return sum(len(m.label) for m in f.measurements)
+    return run
+
+
+def bench_metadata(path: Path) -> Callable[[], Any]:
+    def run() -> int:
+        with ptir5.open(path) as f:
+            return sum(len(dict(m.metadata)) for m in f.measurements)
+    return run
+
+
+def bench_read_spectrum(path: Path) -> Callable[[], Any]:
+    def run() -> float:
+        rng = np.random.default_rng(0)
+        total = 0.0
+        with ptir5.open(path) as f:
+            for m in _cubes(f):
+                h, w = m.pixel_height, m.pixel_width
+                for _ in range(_SPECTRUM_SAMPLES):
+                    x, y = int(rng.integers(w)), int(rng.integers(h))
+                    total += float(m.read_spectrum(x, y)[0])
+        return total
+    return run
+
+
+def bench_read_image(path: Path) -> Callable[[], Any]:
+    def run() -> float:
+        total = 0.0
+        with ptir5.open(path) as f:
+            for m in _cubes(f):
+                step = max(1, m.num_points // _IMAGE_SAMPLES)
+                for i in range(0, m.num_points, step):
+                    total += float(m.read_image(i)[0, 0])
+        return total
+    return run
+
+
+def bench_full_data(path: Path) -> Callable[[], Any]:
+    def run() -> int:
+        nbytes = 0
+        with ptir5.open(path) as f:
+            for m in f.measurements:
+                nbytes += m.data.nbytes
+        return nbytes
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[Path], Callable[[], Any]]] = {
+    "open": bench_open,
+    "measurements": bench_measurements,
+    "tree": bench_tree,
+    "labels": bench_labels,
+    "metadata": bench_metadata,
+    "read_spectrum": bench_read_spectrum,
+    "read_image": bench_read_image,
+    "full_data": bench_full_data,
+}
+
+
+def time_benchmark(fn: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """Run *fn* *repeat* times; return timings plus peak traced memory of one extra run."""
+    times: list[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    # Memory is measured in a separate run because tracing slows execution.
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "times_s": times,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+    }
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "ptir5": ptir5.__version__,
+        "h5py": h5py.__version__,
+        "hdf5": h5py.version.hdf5_version,
+        "numpy": np.__version__,
+    }
+
+
+def run(
+    files: list[tuple[Path, dict[str, Any] | None]],
+    names: list[str],
+    repeat: int,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for path, _ in files:
+        for name in names:
+            entry = {"file": str(path), "benchmark": name, "repeat": repeat}
+            entry.update(time_benchmark(BENCHMARKS[name](path), repeat))
+            print(
+                f"{path.name:40s} {name:14s} median {entry['median_s'] * 1e3:10.2f} ms"
+                f"  peak {entry['peak_bytes'] / 1e6:8.1f} MB",
+                file=sys.stderr,
+            )
+            results.append(entry)
+    return {
+        "environment": _environment(),
+        "files": [
+            {"path": str(p), "size_bytes": p.stat().st_size, "generator": cfg}
+            for p, cfg in files
+        ],
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("files", nargs="*", type=Path, help="existing .ptir files to benchmark")
+    p.add_argument("--preset", action="append", choices=sorted(PRESETS), default=[],
+                   help="generate a synthetic file from a preset (repeatable)")
+    p.add_argument("--benchmark", action="append", choices=sorted(BENCHMARKS),
+                   help="benchmarks to run (default: all)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--workdir", type=Path, help="where to write generated files")
+    p.add_argument("--output", type=Path, help="JSON output path (default: stdout)")
+    args = p.parse_args(argv)
+
+    if not args.files and not args.preset:
+        args.preset = ["small"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or Path(tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        files: list[tuple[Path, dict[str, Any] | None]] = [(f, None) for f in args.files]
+        for preset in args.preset:
+            cfg = PRESETS[preset]
+            print(f"generating preset {preset!r}...", file=sys.stderr)
+            files.append((generate(workdir / f"{preset}.ptir", cfg), config_dict(cfg)))
+        report = run(files, args.benchmark or list(BENCHMARKS), args.repeat)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
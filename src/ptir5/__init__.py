@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
+from ptir5 import compute, processing
+from ptir5._blockio import DEFAULT_CACHE_SIZE
+from ptir5._reader import DEFAULT_MAX_PRELOAD
 from ptir5._version import __version__
+from ptir5.collection import Collection, PoolStats
 from ptir5.enums import DataShape, MeasurementType, PixelFormat
 from ptir5.exceptions import (
     FileClosedError,
@@ -13,6 +17,7 @@ from ptir5.exceptions import (
     PTIR5Error,
 )
 from ptir5.file import PTIR5File
+from ptir5.index import GuidIndex, IndexEntry
 from ptir5.metadata import MetadataView
 from ptir5.models import (
     ByteImage2D,
@@ -38,13 +43,26 @@ from ptir5.models import (
     RamanHyperspectra,
     RamanSpectrum,
 )
+from ptir5.profiling import ProfileReport, profile_open
+from ptir5.refs import MeasurementRef, close_cached_files
+from ptir5.stats import MeasurementStats
+from ptir5.storage import StorageInfo, StorageSummary
+from ptir5.tracing import IOEvent, Trace, add_io_hook, remove_io_hook, trace
 from ptir5.tree import TreeFolder, TreeLeaf, TreeRoot
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from ptir5._reader import Source
 
 
-def open(path: str | Path) -> PTIR5File:
+def open(
+    path: Source,
+    *,
+    profile: bool = False,
+    block_size: int | None = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    preload: bool | Literal["auto"] = False,
+    max_preload: int | None = DEFAULT_MAX_PRELOAD,
+) -> PTIR5File:
     """Open a PTIR5 file for reading.
 
     Use as a context manager::
@@ -52,15 +70,43 @@ def open(path: str | Path) -> PTIR5File:
         with ptir5.open("sample.ptir") as f:
             for m in f.measurements:
                 print(m.label)
+
+    *path* may also be a seekable binary file-like object (an fsspec file,
+    an archive member, ...). With *block_size*, its reads are coalesced into
+    aligned blocks held in an LRU cache of *cache_size* bytes, which turns
+    HDF5's many small metadata reads into a few large ones.
+
+    *path* may also be the file's contents as ``bytes`` (or any byte buffer),
+    opened in memory. ``preload=True`` reads a path or file object into
+    memory up front so later reads never touch the disk; ``preload="auto"``
+    does so only for small files that fit. Otherwise, in-memory images larger
+    than *max_preload* bytes or than the memory available raise
+    :class:`PTIR5Error`.
+
+    With ``profile=True`` the whole structure is loaded eagerly and a
+    phase-by-phase :class:`ProfileReport` is available as ``f.profile``.
     """
-    return PTIR5File(path)
+    return PTIR5File(
+        path,
+        profile=profile,
+        block_size=block_size,
+        cache_size=cache_size,
+        preload=preload,
+        max_preload=max_preload,
+    )
 
 
 __all__ = [
     "__version__",
     "open",
+    "profile_open",
+    # Submodules
+    "compute",
+    "processing",
     # File
     "PTIR5File",
+    "Collection",
+    "PoolStats",
     # Enums
     "DataShape",
     "MeasurementType",
@@ -93,10 +139,29 @@ __all__ = [
     "CameraImageStack",
     "FLPTIRImageStack",
     "PTSRSImageStack",
+    # References
+    "MeasurementRef",
+    "close_cached_files",
+    # Profiling
+    "ProfileReport",
+    # Statistics
+    "MeasurementStats",
+    # Storage layout
+    "StorageInfo",
+    "StorageSummary",
+    # Tracing
+    "IOEvent",
+    "Trace",
+    "add_io_hook",
+    "remove_io_hook",
+    "trace",
     # Metadata
     "MetadataView",
     # Tree
     "TreeRoot",
     "TreeFolder",
     "TreeLeaf",
+    # Index
+    "GuidIndex",
+    "IndexEntry",
 ]
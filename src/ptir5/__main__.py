@@ -0,0 +1,3 @@
+from ptir5.cli import main
+
+raise SystemExit(main())
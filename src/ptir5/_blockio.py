@@ -0,0 +1,155 @@
+"""Block cache for reading HDF5 through slow file-like objects.
+
+HDF5 issues many small reads (superblock, object headers, B-tree nodes,
+attribute heaps) at scattered offsets. Over an object store or an archive
+member each of those is a round trip. :class:`BlockCachedFile` rounds small
+reads out to aligned blocks, fetches each run of missing blocks with one
+underlying read, and keeps recent blocks in an LRU. Large reads (bulk
+dataset data) bypass the cache so they neither thrash it nor get copied
+twice.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+from typing import IO, Any
+
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+# Reads spanning more than this many blocks go straight to the source.
+_BYPASS_BLOCKS = 4
+
+
+class BlockCachedFile(io.RawIOBase):
+    """Read-only, seekable view of *raw* with an LRU cache of aligned blocks."""
+
+    def __init__(
+        self,
+        raw: IO[bytes],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        super().__init__()
+        self._raw = raw
+        self._block_size = block_size
+        self._max_blocks = max(1, cache_size // block_size)
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pos = 0
+        raw.seek(0, io.SEEK_END)
+        self._size = raw.tell()
+        self.hits = 0
+        self.misses = 0
+        self.source_reads = 0
+        self.source_bytes = 0
+
+    @property
+    def raw(self) -> IO[bytes]:
+        return self._raw
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        return self._pos
+
+    def _read_source(self, offset: int, size: int) -> bytes:
+        self._raw.seek(offset)
+        data = self._raw.read(size)
+        self.source_reads += 1
+        self.source_bytes += len(data)
+        return data
+
+    def _fetch(self, first: int, last: int) -> list[bytes]:
+        """Return blocks first..last, loading missing runs with one source read each.
+
+        The blocks are collected before the LRU is trimmed, so a read spanning
+        more blocks than the cache holds still gets all of them.
+        """
+        bs = self._block_size
+        blocks: list[bytes] = []
+        block = first
+        while block <= last:
+            if block in self._blocks:
+                self._blocks.move_to_end(block)
+                self.hits += 1
+                blocks.append(self._blocks[block])
+                block += 1
+                continue
+            run_end = block
+            while run_end + 1 <= last and run_end + 1 not in self._blocks:
+                run_end += 1
+            data = self._read_source(block * bs, (run_end - block + 1) * bs)
+            for i in range(block, run_end + 1):
+                self.misses += 1
+                chunk = data[(i - block) * bs : (i - block + 1) * bs]
+                self._blocks[i] = chunk
+                blocks.append(chunk)
+            block = run_end + 1
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        return blocks
+
+    def readinto(self, buffer: Any) -> int:
+        out = memoryview(buffer).cast("B")
+        n = min(len(out), self._size - self._pos)
+        if n <= 0:
+            return 0
+        bs = self._block_size
+        with self._lock:
+            pos = self._pos
+            first, last = pos // bs, (pos + n - 1) // bs
+            if last - first + 1 > _BYPASS_BLOCKS:
+                data = self._read_source(pos, n)
+                out[: len(data)] = data
+                self._pos += len(data)
+                return len(data)
+            written = 0
+            for block, data in enumerate(self._fetch(first, last), first):
+                start = pos + written - block * bs
+                take = min(len(data) - start, n - written)
+                if take <= 0:
+                    break
+                out[written : written + take] = data[start : start + take]
+                written += take
+            self._pos += written
+            return written
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters: block hits and misses, source reads and bytes, cached blocks."""
+        with self._lock:
+            return {
+                "block_size": self._block_size,
+                "cached_blocks": len(self._blocks),
+                "hits": self.hits,
+                "misses": self.misses,
+                "source_reads": self.source_reads,
+                "source_bytes": self.source_bytes,
+            }
+
+    def close(self) -> None:
+        self._blocks.clear()
+        super().close()
@@ -0,0 +1,90 @@
+"""Block-grid helpers for reading datasets in chunk-aligned pieces."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Upper bound on the size of one default block. Blocks grow along the leading
+# axis in whole chunks (or whole planes for contiguous data) until they reach it.
+_TARGET_BLOCK_BYTES = 4 * 1024 * 1024
+
+
+def default_block_shape(
+    shape: tuple[int, ...],
+    itemsize: int,
+    chunks: tuple[int, ...] | None,
+    target_bytes: int = _TARGET_BLOCK_BYTES,
+) -> tuple[int, ...]:
+    """Pick a block shape aligned to *chunks* (or to whole planes if contiguous)."""
+    if not shape:
+        return ()
+    if chunks is not None:
+        base = [min(c, s) for c, s in zip(chunks, shape, strict=True)]
+    elif len(shape) == 1:
+        base = [shape[0]]
+    else:
+        base = [1, *shape[1:]]
+    base = [max(1, b) for b in base]
+    base_bytes = math.prod(base) * itemsize
+    factor = max(1, target_bytes // max(1, base_bytes))
+    base[0] = min(max(1, shape[0]), base[0] * factor)
+    return tuple(base)
+
+
+def validate_block_shape(block_shape: tuple[int, ...], shape: tuple[int, ...]) -> None:
+    """Raise ValueError if *block_shape* cannot tile an array of *shape*."""
+    if len(block_shape) != len(shape):
+        raise ValueError(
+            f"Block shape {block_shape} does not match dataset rank {len(shape)}"
+        )
+    if any(b < 1 for b in block_shape):
+        raise ValueError(f"Block shape must be positive, got {block_shape}")
+
+
+def iter_blocks(
+    shape: tuple[int, ...], block_shape: tuple[int, ...]
+) -> Iterator[tuple[slice, ...]]:
+    """Yield slice tuples covering *shape* in C order, one per block."""
+    if any(s == 0 for s in shape):
+        return
+    ranges = [range(0, s, b) for s, b in zip(shape, block_shape, strict=True)]
+    for starts in itertools.product(*ranges):
+        yield tuple(
+            slice(start, min(start + b, s))
+            for start, b, s in zip(starts, block_shape, shape, strict=True)
+        )
+
+
+def block_count(shape: tuple[int, ...], block_shape: tuple[int, ...]) -> int:
+    """Number of blocks :func:`iter_blocks` yields for *shape*."""
+    if any(s == 0 for s in shape):
+        return 0
+    return math.prod(-(-s // b) for s, b in zip(shape, block_shape, strict=True))
+
+
+def shared_block_shape(
+    shape: tuple[int, ...],
+    itemsize: int,
+    grids: tuple[tuple[int, ...] | None, ...],
+    target_bytes: int = _TARGET_BLOCK_BYTES,
+) -> tuple[int, ...]:
+    """Block shape made of whole chunks of every grid in *grids*, where affordable.
+
+    Used when copying between two chunk layouts so that each source and each
+    destination chunk is touched once. If the common multiple would exceed
+    *target_bytes*, only the last grid (the destination) is kept aligned.
+    """
+    present = [g for g in grids if g is not None]
+    if not shape or not present:
+        return default_block_shape(shape, itemsize, None, target_bytes)
+    base = [
+        min(s, math.lcm(*(min(g[i], s) for g in present))) for i, s in enumerate(shape)
+    ]
+    if math.prod(base) * itemsize > target_bytes:
+        base = [min(c, s) for c, s in zip(present[-1], shape, strict=True)]
+    return default_block_shape(shape, itemsize, tuple(base), target_bytes)
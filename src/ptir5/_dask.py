@@ -0,0 +1,55 @@
+"""Dask array construction for measurement DATA (optional ``dask`` extra)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ptir5._blocks import default_block_shape
+from ptir5._lazy import DatasetProxy
+
+if TYPE_CHECKING:
+    from ptir5.models import Measurement
+
+
+def _import_dask_array() -> Any:
+    try:
+        import dask.array as da
+    except ImportError as exc:
+        raise ImportError(
+            "to_dask() requires dask; install it with `pip install ptir5[dask]`"
+        ) from exc
+    return da
+
+
+def native_chunks(proxy: DatasetProxy) -> tuple[int, ...]:
+    """HDF5 chunk shape, or whole-plane blocks for contiguous datasets."""
+    if proxy.chunks is not None:
+        return tuple(min(c, s) for c, s in zip(proxy.chunks, proxy.shape, strict=True))
+    return default_block_shape(proxy.shape, proxy.dtype.itemsize, None)
+
+
+def to_dask(m: Measurement, chunks: Any = "auto") -> Any:
+    """Wrap the DATA dataset of *m* in a lazy ``dask.array.Array``.
+
+    ``chunks="native"`` uses the HDF5 chunk grid exactly. ``"auto"`` lets Dask
+    pick a size but keeps block edges on multiples of the HDF5 chunks. Any
+    other value is passed to :func:`dask.array.from_array` unchanged.
+    """
+    da = _import_dask_array()
+    from dask.base import tokenize
+
+    proxy = DatasetProxy.for_measurement(m)
+    if isinstance(chunks, str) and chunks == "native":
+        chunks = native_chunks(proxy)
+    # Live-reader proxies are only valid in this process, so key them by reader too.
+    source = proxy.path if proxy.picklable else (proxy.path, id(m._reader))
+    name = f"ptir5-{m.guid}-{tokenize(source, m._hdf5_path, chunks)}"
+    return da.from_array(
+        proxy,
+        chunks=chunks,
+        name=name,
+        lock=False,
+        fancy=False,
+        asarray=True,
+        inline_array=True,
+    )
@@ -0,0 +1,92 @@
+"""Picklable array proxy used to back lazy (Dask/xarray) arrays."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ptir5.refs import cached_reader
+
+if TYPE_CHECKING:
+    from ptir5._reader import HDF5Reader
+    from ptir5.models import Measurement
+    from ptir5.refs import MeasurementRef
+
+
+class DatasetProxy:
+    """Array-like view of an HDF5 dataset that reopens the file on demand.
+
+    Only the file path and dataset path are pickled, so every process that
+    indexes the proxy reads through its own cached handle. A proxy bound to
+    a live *reader* (for files opened from file-like objects or bytes) reads through
+    that reader and cannot be pickled.
+    """
+
+    __slots__ = ("_path", "_data_path", "_reader", "shape", "dtype", "chunks")
+
+    def __init__(self, path: str, data_path: str, reader: HDF5Reader | None = None) -> None:
+        self._reader = reader
+        if reader is None:
+            path = os.path.abspath(path)
+            reader = cached_reader(path)
+        self._path = path
+        self._data_path = data_path
+        self.shape: tuple[int, ...] = reader.dataset_shape(data_path)
+        self.dtype: np.dtype[Any] = reader.dataset_dtype(data_path)
+        self.chunks: tuple[int, ...] | None = reader.dataset_chunks(data_path)
+
+    @classmethod
+    def from_ref(cls, ref: MeasurementRef) -> DatasetProxy:
+        """Proxy for the DATA dataset of the measurement behind *ref*."""
+        if ref.shape is None:
+            raise ValueError(f"Measurement {ref.guid} has no DATA dataset")
+        return cls(ref.path, f"{ref.hdf5_path}/DATA")
+
+    @classmethod
+    def for_measurement(cls, m: Measurement, data_path: str | None = None) -> DatasetProxy:
+        """Proxy for a dataset of *m* (DATA by default), path-based where possible."""
+        reader = m._reader
+        if data_path is None:
+            data_path = f"{m._hdf5_path}/DATA"
+            if not reader.has_dataset(data_path):
+                raise ValueError(f"Measurement {m.guid} has no DATA dataset")
+        return cls(reader.path, data_path, None if reader.reopenable else reader)
+
+    @property
+    def picklable(self) -> bool:
+        return self._reader is None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def __getitem__(self, key: Any) -> np.ndarray[Any, Any]:
+        if not isinstance(key, tuple):
+            key = (key,)
+        reader = self._reader if self._reader is not None else cached_reader(self._path)
+        return reader.read_dataset_slice(self._data_path, key)
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        if self._reader is not None:
+            raise TypeError(
+                f"cannot pickle a proxy for {self._path}, which was not opened from a path; "
+                "open it from a path to use it in other processes"
+            )
+        return (self._path, self._data_path, self.shape, self.dtype, self.chunks)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        self._path, self._data_path, self.shape, self.dtype, self.chunks = state
+        self._reader = None
+
+    def __repr__(self) -> str:
+        return f"DatasetProxy({self._path!r}, {self._data_path!r}, shape={self.shape})"
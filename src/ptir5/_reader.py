@@ -2,49 +2,400 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import itertools
+import math
+import os
+import time
 import uuid
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import h5py  # type: ignore[import-untyped]
 import numpy as np
 
-from ptir5.exceptions import FileClosedError, InvalidMeasurementError
+from ptir5 import _filters
+from ptir5 import tracing as _tracing
+from ptir5._blockio import DEFAULT_CACHE_SIZE, BlockCachedFile
+from ptir5._blocks import default_block_shape, iter_blocks
+from ptir5.exceptions import FileClosedError, InvalidMeasurementError, PTIR5Error
 from ptir5.metadata import MetadataView, _convert_value
+from ptir5.storage import StorageInfo
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
+    from typing import IO, TypeAlias
+
+    from ptir5.collection import HandlePool
+    from ptir5.storage import StorageLayout
+
+    Source: TypeAlias = str | Path | IO[bytes] | bytes | bytearray | memoryview
+
+_F = TypeVar("_F", bound="Callable[..., Any]")
+
+# preload="auto" loads files up to this size into memory.
+AUTO_PRELOAD_SIZE = 64 * 1024 * 1024
+# Default upper bound on any in-memory image, whatever *preload* says.
+DEFAULT_MAX_PRELOAD = 2 * 1024 * 1024 * 1024
+
+_image_names = itertools.count()
 
 
 _KNOWN_SUBGROUPS = frozenset({"Channel", "ParticleData", "ROIData", "Palette"})
 
+# Incremented in the child after every fork(). Readers compare it against the
+# value recorded when their handle was opened, which costs one integer
+# comparison per call instead of an os.getpid() syscall.
+_fork_generation = 0
+
+# Handles inherited from the parent process. They are kept referenced so the
+# child never closes (and never flushes) the parent's HDF5 objects.
+_inherited_handles: list[h5py.File] = []
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _traced(op: str) -> Callable[[_F], _F]:
+    """Report calls of a ``(self, path, ...)`` reader method as :class:`IOEvent` s.
+
+    With no hooks registered the wrapper only checks an empty tuple.
+    """
+
+    def decorate(fn: _F) -> _F:
+        @functools.wraps(fn)
+        def wrapper(self: HDF5Reader, path: str, *args: Any) -> Any:
+            if not _tracing._hooks:
+                return fn(self, path, *args)
+            t0 = time.perf_counter()
+            result = fn(self, path, *args)
+            elapsed = time.perf_counter() - t0
+            _tracing.emit(self._describe(op, path, args, result, elapsed))
+            return result
+
+        return cast("_F", wrapper)
+
+    return decorate
+
+
+_DIGEST_SIZE = 16
+# Fixed, so digests of unchunked data do not depend on the library's read block size.
+_DIGEST_BLOCK_BYTES = 4 * 1024 * 1024
+
+_LAYOUTS: dict[int, StorageLayout] = {
+    h5py.h5d.CONTIGUOUS: "contiguous",
+    h5py.h5d.CHUNKED: "chunked",
+    h5py.h5d.COMPACT: "compact",
+    h5py.h5d.VIRTUAL: "virtual",
+}
+
+_FILTER_NAMES = {
+    h5py.h5z.FILTER_DEFLATE: "gzip",
+    h5py.h5z.FILTER_SHUFFLE: "shuffle",
+    h5py.h5z.FILTER_FLETCHER32: "fletcher32",
+    h5py.h5z.FILTER_SZIP: "szip",
+    h5py.h5z.FILTER_NBIT: "nbit",
+    h5py.h5z.FILTER_SCALEOFFSET: "scaleoffset",
+    h5py.h5z.FILTER_LZF: "lzf",
+}
+
+
+def _filter_ids(ds: h5py.Dataset) -> tuple[int, ...]:
+    plist = ds.id.get_create_plist()
+    return tuple(plist.get_filter(i)[0] for i in range(plist.get_nfilters()))
+
+
+def storage_info(path: str, ds: h5py.Dataset) -> StorageInfo:
+    """Describe how *ds* is stored; *path* is recorded as given."""
+    dsid = ds.id
+    plist = dsid.get_create_plist()
+    layout = _LAYOUTS.get(plist.get_layout(), "contiguous")
+    filters: list[str] = []
+    for i in range(plist.get_nfilters()):
+        code, _, _, name = plist.get_filter(i)
+        filters.append(_FILTER_NAMES.get(code) or name.decode(errors="replace"))
+    num_chunks = dsid.get_num_chunks() if layout == "chunked" else 0
+    offset = dsid.get_offset() if layout == "contiguous" else None
+    return StorageInfo(
+        path=path,
+        layout=layout,
+        shape=tuple(ds.shape),
+        dtype=str(ds.dtype),
+        chunks=ds.chunks,
+        filters=tuple(filters),
+        compression=ds.compression,
+        compression_opts=ds.compression_opts,
+        logical_bytes=int(ds.size) * ds.dtype.itemsize,
+        stored_bytes=int(dsid.get_storage_size()),
+        num_chunks=int(num_chunks),
+        offset=offset,
+    )
+
+
+def _describe_fileobj(fileobj: Any) -> str:
+    for attr in ("path", "name"):
+        value = getattr(fileobj, attr, None)
+        if isinstance(value, str | bytes | os.PathLike):
+            return os.fsdecode(value)
+    return f"<{type(fileobj).__name__}>"
+
+
+def _available_memory() -> int | None:
+    """Bytes of memory available to new allocations, if the platform says."""
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _preload_problem(name: str, size: int, max_preload: int | None) -> str | None:
+    """Why an in-memory image of *size* bytes would be unsafe, or None if it is fine."""
+    if max_preload is not None and size > max_preload:
+        return (
+            f"{name} is {size} bytes, above the in-memory limit of {max_preload} bytes; "
+            "raise max_preload (or pass None) to load it anyway"
+        )
+    available = _available_memory()
+    if available is not None and size > available:
+        return f"{name} is {size} bytes but only {available} bytes of memory are available"
+    return None
+
+
+def _resolve_preload(
+    name: str, size: int, preload: bool | Literal["auto"], max_preload: int | None
+) -> bool:
+    """Apply the ``preload="auto"`` size heuristic and the memory caps."""
+    if not preload:
+        return False
+    problem = _preload_problem(name, size, max_preload)
+    if preload == "auto":
+        return size <= AUTO_PRELOAD_SIZE and problem is None
+    if problem is not None:
+        raise PTIR5Error(problem)
+    return True
+
+
+def _open_image(image: bytes | bytearray | memoryview) -> h5py.File:
+    """Open an HDF5 file image with the core driver; HDF5 keeps its own copy."""
+    fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+    fapl.set_fapl_core(backing_store=False)
+    fapl.set_file_image(image)
+    # HDF5 needs a name unique among open files; nothing is ever written to it.
+    name = f"ptir5-image-{next(_image_names)}".encode()
+    return h5py.File(h5py.h5f.open(name, h5py.h5f.ACC_RDONLY, fapl=fapl))
+
 
 class HDF5Reader:
-    """Thin wrapper around an h5py.File for read-only PTIR5 access."""
+    """Thin wrapper around an h5py.File for read-only PTIR5 access.
+
+    A reader inherited across ``fork()`` transparently reopens its file in
+    the child on first use, since HDF5 handles must not be shared between
+    processes. A :meth:`suspend`-ed reader likewise reopens on its next read.
+
+    *source* may also be a seekable binary file-like object, read through
+    h5py's file-object support. With *block_size*, reads from it go through a
+    :class:`~ptir5._blockio.BlockCachedFile` holding up to *cache_size* bytes.
+    Such readers cannot be reopened, so they are neither suspended nor usable
+    after ``fork()``.
+
+    *source* may also be the file's bytes, opened as an HDF5 file image with
+    the ``core`` driver. ``preload=True`` loads a path or file-like source
+    into memory the same way; ``preload="auto"`` does so only for files up to
+    :data:`AUTO_PRELOAD_SIZE` that fit. Otherwise images larger than
+    *max_preload* or than the available memory raise :class:`PTIR5Error`.
+    Preloaded paths are reloaded on reopen; byte and file-like sources are
+    not reopenable.
+    """
+
+    __slots__ = (
+        "_h5",
+        "_path",
+        "_generation",
+        "_pool",
+        "_suspended",
+        "_fileobj",
+        "_reopenable",
+        "_preload",
+        "_in_memory",
+    )
+
+    def __init__(
+        self,
+        source: Source,
+        *,
+        block_size: int | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        preload: bool | Literal["auto"] = False,
+        max_preload: int | None = DEFAULT_MAX_PRELOAD,
+    ) -> None:
+        self._fileobj: IO[bytes] | None = None
+        self._reopenable = False
+        self._preload = False
+        self._in_memory = True
+        if isinstance(source, str | os.PathLike):
+            self._path = str(source)
+            self._reopenable = True
+            if preload:
+                size = os.path.getsize(self._path)
+                self._preload = _resolve_preload(self._path, size, preload, max_preload)
+            self._in_memory = self._preload
+            self._h5: h5py.File | None = self._open_path()
+        elif isinstance(source, bytes | bytearray | memoryview):
+            size = memoryview(source).nbytes
+            self._path = f"<memory: {size} bytes>"
+            _resolve_preload(self._path, size, True, max_preload)
+            self._h5 = _open_image(source)
+        else:
+            self._path = _describe_fileobj(source)
+            if preload:
+                size = source.seek(0, io.SEEK_END)
+                preload = _resolve_preload(self._path, size, preload, max_preload)
+            if preload:
+                source.seek(0)
+                self._h5 = _open_image(source.read())
+            else:
+                fileobj: IO[bytes] = source
+                if block_size is not None:
+                    fileobj = BlockCachedFile(source, block_size, cache_size)  # type: ignore[assignment]
+                self._fileobj = fileobj
+                self._in_memory = False
+                self._h5 = h5py.File(fileobj, "r")
+        self._generation = _fork_generation
+        self._pool: HandlePool | None = None
+        self._suspended = False
+
+    def _open_path(self) -> h5py.File:
+        if self._preload:
+            return h5py.File(self._path, "r", driver="core", backing_store=False)
+        return h5py.File(self._path, "r")
 
-    __slots__ = ("_h5",)
+    @property
+    def path(self) -> str:
+        """File path, or a description of the file-like object the reader wraps."""
+        return self._path
 
-    def __init__(self, path: str | Path) -> None:
-        self._h5: h5py.File | None = h5py.File(str(path), "r")
+    @property
+    def reopenable(self) -> bool:
+        """Whether the file can be opened again by path (False for file-like and byte sources)."""
+        return self._reopenable
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether the whole file is held in memory (byte sources and preloads)."""
+        return self._in_memory
+
+    @property
+    def block_cache(self) -> BlockCachedFile | None:
+        fileobj = self._fileobj
+        return fileobj if isinstance(fileobj, BlockCachedFile) else None
 
     @property
     def is_open(self) -> bool:
-        return self._h5 is not None
+        return self._h5 is not None or self._suspended
 
     def close(self) -> None:
+        self._suspended = False
+        if self._pool is not None:
+            self._pool.discard(self)
+        self._release()
+        cache = self.block_cache
+        if cache is not None:
+            cache.close()
+
+    def _release(self) -> None:
         if self._h5 is not None:
-            self._h5.close()
+            if self._generation == _fork_generation:
+                self._h5.close()
+            else:
+                _inherited_handles.append(self._h5)
             self._h5 = None
 
+    def suspend(self) -> None:
+        """Close the HDF5 handle but stay usable; the next read reopens the file.
+
+        Does nothing for file-like and byte sources, which cannot be reopened.
+        """
+        if self._h5 is not None and self.reopenable:
+            self._release()
+            self._suspended = True
+
+    def attach_pool(self, pool: HandlePool) -> None:
+        """Report every handle use to *pool*, which may :meth:`suspend` this reader."""
+        self._pool = pool
+        if self._h5 is not None:
+            pool.touch(self)
+
     def _file(self) -> h5py.File:
-        if self._h5 is None:
-            raise FileClosedError("PTIR5 file is closed")
+        h5 = self._h5
+        if h5 is None:
+            if not self._suspended:
+                raise FileClosedError("PTIR5 file is closed")
+            h5 = self._resume()
+        elif self._generation != _fork_generation:
+            h5 = self._reopen_after_fork(h5)
+        if self._pool is not None:
+            self._pool.touch(self)
+        return h5
+
+    def _resume(self) -> h5py.File:
+        self._h5 = self._open_path()
+        self._generation = _fork_generation
+        self._suspended = False
+        return self._h5
+
+    def _reopen_after_fork(self, inherited: h5py.File) -> h5py.File:
+        _inherited_handles.append(inherited)
+        if not self.reopenable:
+            self._h5 = None
+            raise PTIR5Error(
+                f"{self._path} was not opened from a path and cannot be used "
+                "after fork(); open it again in the child process"
+            )
+        self._h5 = self._open_path()
+        self._generation = _fork_generation
         return self._h5
 
+    def _describe(
+        self, op: str, path: str, args: tuple[Any, ...], result: Any, elapsed: float
+    ) -> _tracing.IOEvent:
+        guid = _tracing.guid_from_path(path)
+        if not isinstance(result, np.ndarray) or not op.startswith("read_dataset"):
+            return _tracing.IOEvent(op, path, guid, elapsed)
+        ds = self._file()[path]
+        selection = args[0] if args and op == "read_dataset_slice" else None
+        return _tracing.IOEvent(
+            op,
+            path,
+            guid,
+            elapsed,
+            bytes_read=result.nbytes,
+            elements=result.size,
+            chunks_touched=_tracing.chunks_touched(ds.shape, ds.chunks, selection),
+        )
+
     # -- Group access -------------------------------------------------------
 
+    @_traced("lookup")
     def has_group(self, path: str) -> bool:
         return path in self._file() and isinstance(self._file()[path], h5py.Group)
 
+    @_traced("list")
     def list_subgroups(self, path: str) -> list[str]:
         """Return names of sub-groups (not datasets) under *path*."""
         grp = self._file()[path]
@@ -52,6 +403,7 @@ class HDF5Reader:
 
     # -- Attribute reading --------------------------------------------------
 
+    @_traced("read_attrs")
     def read_type(self, path: str) -> str:
         """Read the TYPE attribute from a group."""
         raw = self._file()[path].attrs["TYPE"]
@@ -62,6 +414,7 @@ class HDF5Reader:
             )
         return val
 
+    @_traced("read_attrs")
     def read_label(self, path: str) -> str:
         """Read the Label attribute, returning '' if missing."""
         grp = self._file()[path]
@@ -75,11 +428,34 @@ class HDF5Reader:
         return val
 
     def build_metadata_view(self, path: str) -> MetadataView:
-        """Create a MetadataView that lazily loads all attributes from *path*."""
+        """Create a MetadataView that lazily loads attributes from *path*."""
         def load() -> dict[str, Any]:
             return self._read_all_attrs(path)
-        return MetadataView(load)
 
+        def load_key(key: str) -> tuple[bool, Any]:
+            return self.read_attr(path, key)
+
+        return MetadataView(load, load_key)
+
+    @_traced("read_attrs")
+    def read_attr(self, path: str, key: str) -> tuple[bool, Any]:
+        """Read and convert one metadata key, returning ``(found, value)``.
+
+        Keys are resolved like :meth:`_read_all_attrs` flattens them:
+        ``"Channel.Units"`` reads ``Units`` from the ``Channel`` sub-group
+        (which takes precedence over a direct attribute of the same name).
+        """
+        grp = self._file()[path]
+        sub_name, dot, sub_key = key.partition(".")
+        if dot and sub_name in _KNOWN_SUBGROUPS and sub_name in grp:
+            sub = grp[sub_name]
+            if isinstance(sub, h5py.Group) and sub_key in sub.attrs:
+                return True, _convert_value(sub.attrs[sub_key])
+        if key in grp.attrs:
+            return True, _convert_value(grp.attrs[key])
+        return False, None
+
+    @_traced("read_attrs")
     def _read_all_attrs(self, path: str) -> dict[str, Any]:
         """Read all attributes from a group and its known sub-groups."""
         grp = self._file()[path]
@@ -106,11 +482,13 @@ class HDF5Reader:
             )
         return ds
 
+    @_traced("read_dataset")
     def read_dataset(self, path: str) -> np.ndarray[Any, Any]:
         """Read an entire dataset as a numpy array."""
         result: Any = self._get_dataset(path)[()]
         return result  # type: ignore[no-any-return]
 
+    @_traced("read_dataset_slice")
     def read_dataset_slice(
         self, path: str, slices: tuple[int | slice, ...]
     ) -> np.ndarray[Any, Any]:
@@ -118,14 +496,145 @@ class HDF5Reader:
         result: Any = self._get_dataset(path)[slices]
         return result  # type: ignore[no-any-return]
 
+    @_traced("read_dataset_slice")
+    def read_dataset_slice_into(
+        self, path: str, slices: tuple[int | slice, ...], out: np.ndarray[Any, Any]
+    ) -> np.ndarray[Any, Any]:
+        """Read a slice of a dataset into the C-contiguous array *out*; return *out*."""
+        self._get_dataset(path).read_direct(out, source_sel=slices)
+        return out
+
+    @_traced("read_dataset_into")
+    def read_dataset_into(
+        self, path: str, out: np.ndarray[Any, Any], dest: tuple[int | slice, ...]
+    ) -> np.ndarray[Any, Any]:
+        """Read an entire dataset straight into ``out[dest]``; return that view."""
+        ds = self._get_dataset(path)
+        if ds.size:
+            ds.read_direct(out, dest_sel=dest)
+        view: np.ndarray[Any, Any] = out[dest]
+        return view
+
+    def read_dataset_parallel(self, path: str, workers: int) -> np.ndarray[Any, Any]:
+        """Read an entire dataset, decoding its chunks on *workers* threads.
+
+        Falls back to :meth:`read_dataset` for datasets that are not chunked,
+        are not plain numeric, or use a filter :mod:`ptir5._filters` cannot
+        decode.
+        """
+        ds = self._get_dataset(path)
+        filters = _filter_ids(ds)
+        if (
+            ds.chunks is None
+            or ds.dtype.kind not in "biuf"
+            or not set(filters) <= _filters.SUPPORTED
+        ):
+            return self.read_dataset(path)
+        return self._read_chunks(path, workers, filters)
+
+    @_traced("read_dataset_chunks")
+    def _read_chunks(
+        self, path: str, workers: int, filters: tuple[int, ...]
+    ) -> np.ndarray[Any, Any]:
+        ds = self._get_dataset(path)
+        dsid = ds.id
+        shape: tuple[int, ...] = ds.shape
+        chunks: tuple[int, ...] = ds.chunks
+        dtype = ds.dtype
+        count = math.prod(chunks)
+        grid = list(iter_blocks(shape, chunks))
+        if dsid.get_num_chunks() == len(grid):
+            out = np.empty(shape, dtype=dtype)
+        else:
+            out = np.full(shape, ds.fillvalue, dtype=dtype)
+
+        def fetch(sel: tuple[slice, ...]) -> None:
+            try:
+                mask, raw = dsid.read_direct_chunk(tuple(s.start for s in sel))
+            except RuntimeError:
+                return  # never written: keep the fill value
+            buf = _filters.decode_chunk(raw, filters, mask, dtype.itemsize)
+            block = np.frombuffer(buf, dtype=dtype, count=count).reshape(chunks)
+            out[sel] = block[tuple(slice(0, s.stop - s.start) for s in sel)]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(fetch, grid):
+                pass
+        return out
+
+    def dataset_digest(self, path: str, workers: int) -> bytes:
+        """BLAKE2b digest of a dataset's stored content, hashed in blocks on *workers* threads.
+
+        Chunked datasets hash each raw chunk as stored, with its filter mask,
+        so nothing is decompressed; unwritten chunks hash as absent. Other
+        layouts hash their data in chunk-sized blocks. The digest also covers
+        dtype, shape, chunk shape, filters and fill value, so it changes with
+        the storage layout even when the values do not.
+        """
+        ds = self._get_dataset(path)
+        shape: tuple[int, ...] = ds.shape
+        chunks: tuple[int, ...] | None = ds.chunks
+        header = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        fill = np.asarray(ds.fillvalue, dtype=ds.dtype)
+        for part in (ds.dtype.str, shape, chunks, _filter_ids(ds), fill.tobytes()):
+            header.update(repr(part).encode())
+        dsid = ds.id
+
+        def raw_chunk(sel: tuple[slice, ...]) -> bytes:
+            try:
+                mask, raw = dsid.read_direct_chunk(tuple(s.start for s in sel))
+            except RuntimeError:
+                return b"\x00" * _DIGEST_SIZE  # never written
+            h = hashlib.blake2b(mask.to_bytes(4, "little"), digest_size=_DIGEST_SIZE)
+            h.update(raw)
+            return h.digest()
+
+        def block(sel: tuple[slice, ...]) -> bytes:
+            data = np.ascontiguousarray(ds[sel])
+            return hashlib.blake2b(data.data, digest_size=_DIGEST_SIZE).digest()
+
+        if chunks is not None:
+            grid, fn = iter_blocks(shape, chunks), raw_chunk
+        else:
+            blocks = default_block_shape(shape, ds.dtype.itemsize, None, _DIGEST_BLOCK_BYTES)
+            grid, fn = iter_blocks(shape, blocks), block
+        if workers == 1:
+            for d in map(fn, grid):
+                header.update(d)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for d in pool.map(fn, grid):
+                    header.update(d)
+        return header.digest()
+
+    @_traced("dataset_info")
     def dataset_shape(self, path: str) -> tuple[int, ...]:
         shape: Any = self._get_dataset(path).shape
         return shape  # type: ignore[no-any-return]
 
+    @_traced("dataset_info")
     def dataset_dtype(self, path: str) -> np.dtype[Any]:
         dtype: Any = self._get_dataset(path).dtype
         return dtype  # type: ignore[no-any-return]
 
+    @_traced("dataset_info")
+    def dataset_chunks(self, path: str) -> tuple[int, ...] | None:
+        """Return the HDF5 chunk shape, or None for contiguous/compact layouts."""
+        chunks: Any = self._get_dataset(path).chunks
+        return chunks  # type: ignore[no-any-return]
+
+    @_traced("dataset_info")
+    def dataset_storage(self, path: str) -> StorageInfo:
+        """Return the layout, filters and allocated size of a dataset."""
+        return storage_info(path, self._get_dataset(path))
+
+    @_traced("list")
+    def list_datasets(self, path: str) -> list[str]:
+        """Return names of datasets (not sub-groups) under *path*."""
+        grp = self._file()[path]
+        return [k for k in grp if isinstance(grp[k], h5py.Dataset)]
+
+    @_traced("lookup")
     def has_dataset(self, path: str) -> bool:
         return path in self._file() and isinstance(self._file()[path], h5py.Dataset)
 
@@ -0,0 +1,111 @@
+"""JSON records and read timing shared by :mod:`ptir5.repack`, the server and batch runs."""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ptir5.enums import DataShape
+from ptir5.file import PTIR5File, _with_generated
+from ptir5.tree import TreeFolder
+
+if TYPE_CHECKING:
+    from ptir5.models import Measurement
+    from ptir5.tree import TreeLeaf
+
+STACKED = (DataShape.FLOAT_HYPERCUBE_3D, DataShape.BYTE_IMAGE_STACK_3D)
+
+
+def jsonable(value: Any) -> Any:
+    """Plain Python value for a NumPy array or scalar, or for bytes."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
+
+
+def finite(value: Any) -> Any:
+    """JSON-ready copy of *value* with NaN and infinities as None; JSON has no literal."""
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        mask = np.isfinite(value)
+        if mask.all():
+            return value.tolist()
+        cells = value.astype(object)
+        cells[~mask] = None
+        return cells.tolist()
+    value = jsonable(value)
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: finite(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [finite(v) for v in value]
+    return value
+
+
+def dumps(value: Any) -> str:
+    """Strict JSON for *value*: NumPy values converted, non-finite floats as ``null``."""
+    return json.dumps(finite(value), allow_nan=False)
+
+
+def tree_json(node: TreeFolder | TreeLeaf) -> dict[str, Any]:
+    if isinstance(node, TreeFolder):
+        return {"name": node.name, "children": [tree_json(c) for c in node.children]}
+    return {"name": node.name, "guid": node.guid}
+
+
+def measurement_json(m: Measurement) -> dict[str, Any]:
+    data_path = f"{m._hdf5_path}/DATA"
+    has_data = m._reader.has_dataset(data_path)
+    return {
+        "guid": m.guid,
+        "type": str(m.measurement_type),
+        "data_shape": m.data_shape.value,
+        "label": m.label,
+        "shape": list(m._reader.dataset_shape(data_path)) if has_data else None,
+        "dtype": m._reader.dataset_dtype(data_path).str if has_data else None,
+        "generated": [c.guid for c in m.generated],
+    }
+
+
+def data_measurements(f: PTIR5File) -> list[Measurement]:
+    """Measurements, backgrounds and their GENERATED items that have a DATA dataset."""
+    items = _with_generated((*f.measurements, *f.backgrounds))
+    return [m for m in items if m._reader.has_dataset(f"{m._hdf5_path}/DATA")]
+
+
+def time_reads(path: str, samples: int, seed: int = 0) -> dict[str, float]:
+    """Time random pixel spectra and whole planes/images read from a fresh handle."""
+    rng = random.Random(seed)
+    totals: dict[str, float] = {}
+    with PTIR5File(path) as f:
+        for m in data_measurements(f):
+            data_path = f"{m._hdf5_path}/DATA"
+            shape = m._reader.dataset_shape(data_path)
+            patterns: dict[str, list[tuple[Any, ...]]]
+            if m.data_shape in STACKED and len(shape) >= 3:
+                patterns = {
+                    "spectra": [
+                        (slice(None), rng.randrange(shape[1]), rng.randrange(shape[2]))
+                        for _ in range(samples)
+                    ],
+                    "planes": [(rng.randrange(shape[0]),) for _ in range(samples)],
+                }
+            elif len(shape) >= 2:
+                patterns = {"images": [(slice(None),)]}
+            else:
+                continue
+            for name, selections in patterns.items():
+                t0 = time.perf_counter()
+                for sel in selections:
+                    m._reader.read_dataset_slice(data_path, sel)
+                totals[name] = totals.get(name, 0.0) + time.perf_counter() - t0
+    return totals
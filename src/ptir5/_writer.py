@@ -0,0 +1,92 @@
+"""HDF5 writing for tools that produce new PTIR5 files (see :mod:`ptir5.repack`).
+
+Like :mod:`ptir5._reader`, this is a thin h5py layer; everything above it
+works with paths, shapes and numpy arrays. The library itself never writes
+to an existing file.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import h5py  # type: ignore[import-untyped]
+
+from ptir5._blocks import iter_blocks, shared_block_shape
+from ptir5._reader import storage_info
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ptir5.storage import StorageInfo
+
+# Upper bound on one copy block; large enough to cover a whole chunk column.
+_COPY_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class DatasetLayout:
+    """Storage options for one rewritten dataset."""
+
+    chunks: tuple[int, ...]
+    compression: str | None = None
+    compression_opts: int | None = None
+    shuffle: bool = False
+
+
+def _copy_attrs(src: h5py.HLObject, dst: h5py.HLObject) -> None:
+    """Copy every attribute with its original HDF5 type and shape."""
+    for name in src.attrs:
+        dtype = src.attrs.get_id(name).dtype
+        dst.attrs.create(name, src.attrs[name], dtype=dtype)
+
+
+def _rewrite(
+    src: h5py.Dataset, parent: h5py.Group, name: str, layout: DatasetLayout
+) -> h5py.Dataset:
+    dst = parent.create_dataset(
+        name,
+        shape=src.shape,
+        dtype=src.dtype,
+        chunks=layout.chunks,
+        compression=layout.compression,
+        compression_opts=layout.compression_opts,
+        shuffle=layout.shuffle,
+    )
+    _copy_attrs(src, dst)
+    block = shared_block_shape(
+        tuple(src.shape), src.dtype.itemsize, (src.chunks, layout.chunks), _COPY_BLOCK_BYTES
+    )
+    for sel in iter_blocks(tuple(src.shape), block):
+        dst[sel] = src[sel]
+    return dst
+
+
+def rewrite_file(
+    src_path: str, dst_path: str, layouts: Mapping[str, DatasetLayout]
+) -> tuple[list[StorageInfo], list[StorageInfo]]:
+    """Copy *src_path* to *dst_path*, rewriting the datasets named in *layouts*.
+
+    Groups and attributes are recreated as they are; every other dataset is
+    copied verbatim with ``H5Ocopy``. Rewritten datasets are streamed block
+    by block. Returns the storage of each rewritten dataset before and after.
+    """
+    before: list[StorageInfo] = []
+    after: list[StorageInfo] = []
+    with h5py.File(src_path, "r") as src, h5py.File(dst_path, "w") as dst:
+        _copy_attrs(src, dst)
+
+        def visit(path: str, obj: Any) -> None:
+            parent_path, _, name = path.rpartition("/")
+            parent = dst[parent_path] if parent_path else dst
+            if isinstance(obj, h5py.Group):
+                _copy_attrs(obj, parent.create_group(name))
+            elif path in layouts:
+                before.append(storage_info(path, obj))
+                after.append(storage_info(path, _rewrite(obj, parent, name, layouts[path])))
+            else:
+                src.copy(obj, parent, name=name)
+
+        src.visititems(visit)
+    return before, after
+
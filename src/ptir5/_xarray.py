@@ -0,0 +1,122 @@
+"""xarray conversion for measurements (optional ``xarray`` extra).
+
+Imported lazily by :meth:`Measurement.to_xarray`, so xarray is only needed
+when the conversion is used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+try:
+    import xarray as xr
+    from xarray.backends import BackendArray
+    from xarray.core import indexing
+except ImportError as exc:
+    raise ImportError(
+        "to_xarray() requires xarray; install it with `pip install ptir5[xarray]`"
+    ) from exc
+
+from ptir5._lazy import DatasetProxy
+from ptir5.enums import DataShape
+
+if TYPE_CHECKING:
+    from ptir5.models import Measurement
+
+
+_DIMS: dict[DataShape, tuple[str, ...]] = {
+    DataShape.FLOAT_SPECTRUM_1D: ("wavenumber",),
+    DataShape.FLOAT_IMAGE_2D: ("y", "x"),
+    DataShape.BYTE_IMAGE_2D: ("y", "x", "channel"),
+    DataShape.FLOAT_HYPERCUBE_3D: ("wavenumber", "y", "x"),
+    DataShape.BYTE_IMAGE_STACK_3D: ("frame", "y", "x", "channel"),
+}
+
+
+class _ProxyBackendArray(BackendArray):
+    """Lazily indexed array over a :class:`DatasetProxy` (slices and ints only)."""
+
+    def __init__(self, proxy: DatasetProxy) -> None:
+        self.proxy = proxy
+        self.shape = proxy.shape
+        self.dtype = proxy.dtype
+
+    def __getitem__(self, key: Any) -> Any:
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.BASIC, self._raw_getitem
+        )
+
+    def _raw_getitem(self, key: tuple[Any, ...]) -> np.ndarray[Any, Any]:
+        return self.proxy[key]
+
+
+def _axis_coords(m: Measurement, dims: tuple[str, ...], shape: tuple[int, ...]) -> dict[str, Any]:
+    """Physical coordinates: wavenumber from XStart/XIncrement, x/y pixel centres in microns."""
+    md = m.metadata
+    coords: dict[str, Any] = {}
+    if dims[0] in ("wavenumber", "frame") and "XStart" in md:
+        n = shape[0]
+        values = np.arange(n, dtype=np.float64) * float(md.get("XIncrement", 1.0))
+        values += float(md["XStart"])
+        coords["wavenumber"] = (dims[0], values)
+    width_um = float(md.get("ImageWidth", 0.0))
+    height_um = float(md.get("ImageHeight", 0.0))
+    if "x" in dims and width_um > 0:
+        n = shape[dims.index("x")]
+        coords["x_um"] = ("x", (np.arange(n, dtype=np.float64) + 0.5) * (width_um / n))
+    if "y" in dims and height_um > 0:
+        n = shape[dims.index("y")]
+        coords["y_um"] = ("y", (np.arange(n, dtype=np.float64) + 0.5) * (height_um / n))
+    return coords
+
+
+def _with_indexes(obj: Any) -> Any:
+    """Index non-dimension coordinates so ``.sel`` works in physical units."""
+    for name in ("wavenumber", "x_um", "y_um"):
+        if name in obj.coords and name not in obj.indexes:
+            obj = obj.set_xindex(name)
+    return obj
+
+
+def to_xarray(m: Measurement, lazy: bool = True, dataset: bool = False) -> Any:
+    """Convert *m* to an ``xarray.DataArray`` (or ``Dataset`` if *dataset*)."""
+    proxy = DatasetProxy.for_measurement(m)
+    dims = _DIMS[m.data_shape]
+    if len(dims) != proxy.ndim:
+        dims = tuple(f"dim_{i}" for i in range(proxy.ndim))
+    coords = _axis_coords(m, dims, proxy.shape)
+    attrs = dict(m.metadata)
+
+    variables: dict[str, Any] = {"DATA": _variable(dims, proxy, lazy)}
+    if dataset:
+        reader = m._reader
+        for name in reader.list_datasets(m._hdf5_path):
+            aux_path = f"{m._hdf5_path}/{name}"
+            if name == "DATA":
+                continue
+            aux_dims = _match_dims(reader.dataset_shape(aux_path), dims, proxy.shape)
+            if aux_dims is not None:
+                aux = DatasetProxy.for_measurement(m, aux_path)
+                variables[name] = _variable(aux_dims, aux, lazy)
+        return _with_indexes(xr.Dataset(variables, coords=coords, attrs=attrs))
+    da = xr.DataArray(variables["DATA"], coords=coords, name="DATA", attrs=attrs)
+    return _with_indexes(da)
+
+
+def _variable(dims: tuple[str, ...], proxy: DatasetProxy, lazy: bool) -> Any:
+    values: Any = indexing.LazilyIndexedArray(_ProxyBackendArray(proxy)) if lazy else proxy[()]
+    return xr.Variable(dims, values)
+
+
+def _match_dims(
+    shape: tuple[int, ...], dims: tuple[str, ...], data_shape: tuple[int, ...]
+) -> tuple[str, ...] | None:
+    """Map an auxiliary dataset onto DATA's dims (per-frame or per-pixel arrays)."""
+    sizes = dict(zip(dims, data_shape, strict=True))
+    if len(shape) == 1 and dims[0] in ("wavenumber", "frame") and shape[0] == data_shape[0]:
+        return (dims[0],)
+    if len(shape) == 2 and "y" in sizes and shape == (sizes["y"], sizes["x"]):
+        return ("y", "x")
+    return None
@@ -0,0 +1,231 @@
+"""asyncio facade over the synchronous ptir5 API.
+
+h5py performs blocking I/O, so every call that may touch the file runs on a
+bounded thread pool. Calls against one file are serialized with an
+:class:`asyncio.Lock`, so a single handle is never used from two threads at
+once and a slow file cannot occupy more than one worker. Other files keep
+making progress on the remaining workers.
+
+Usage::
+
+    from ptir5 import aio
+
+    async with await aio.open("sample.ptir") as f:
+        for m in await f.measurements():
+            data = await m.read()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ptir5.file import PTIR5File
+from ptir5.models import ByteImageStack3D, FloatHypercube3D
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from concurrent.futures import Executor, Future
+    from pathlib import Path
+
+    import numpy as np
+
+    from ptir5.enums import DataShape, MeasurementType
+    from ptir5.models import Measurement
+    from ptir5.tree import TreeRoot
+
+_T = TypeVar("_T")
+
+_DEFAULT_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+_EXHAUSTED = object()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=_DEFAULT_MAX_WORKERS, thread_name_prefix="ptir5-aio"
+            )
+        return _default_executor
+
+
+async def _wait_uncancellable(cf: Future[Any]) -> None:
+    """Wait for *cf* to finish, ignoring further cancellation requests."""
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    cf.add_done_callback(lambda _: loop.call_soon_threadsafe(done.set))
+    while not done.is_set():
+        try:
+            await done.wait()
+        except asyncio.CancelledError:
+            continue
+
+
+async def open(path: str | Path, *, executor: Executor | None = None) -> AsyncPTIR5File:
+    """Open a PTIR5 file without blocking the event loop.
+
+    *executor* defaults to a shared, bounded thread pool.
+    """
+    pool = executor if executor is not None else _get_default_executor()
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(pool, PTIR5File, path)
+    return AsyncPTIR5File(f, pool)
+
+
+class AsyncPTIR5File:
+    """Async wrapper around a :class:`~ptir5.PTIR5File`."""
+
+    __slots__ = ("_file", "_executor", "_lock")
+
+    def __init__(self, file: PTIR5File, executor: Executor | None = None) -> None:
+        self._file = file
+        self._executor = executor if executor is not None else _get_default_executor()
+        self._lock = asyncio.Lock()
+
+    @property
+    def file(self) -> PTIR5File:
+        """The underlying synchronous file. Do not use it concurrently."""
+        return self._file
+
+    @property
+    def path(self) -> str:
+        return self._file.path
+
+    @property
+    def is_open(self) -> bool:
+        return self._file.is_open
+
+    async def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run ``fn(*args)`` on the executor, serialized with other calls on this file.
+
+        If the awaiting task is cancelled before the call starts, it never
+        runs. If it is already running it cannot be interrupted, so the lock
+        stays held until it finishes and the cancellation is then re-raised.
+        """
+        async with self._lock:
+            cf = self._executor.submit(fn, *args)
+            try:
+                return await asyncio.wrap_future(cf)
+            except asyncio.CancelledError:
+                if not cf.cancel():
+                    await _wait_uncancellable(cf)
+                raise
+
+    def _wrap(self, m: Measurement) -> AsyncMeasurement:
+        return AsyncMeasurement(m, self)
+
+    async def measurements(self) -> tuple[AsyncMeasurement, ...]:
+        items = await self.run(lambda: self._file.measurements)
+        return tuple(self._wrap(m) for m in items)
+
+    async def backgrounds(self) -> tuple[AsyncMeasurement, ...]:
+        items = await self.run(lambda: self._file.backgrounds)
+        return tuple(self._wrap(m) for m in items)
+
+    async def get_measurement(self, guid: str) -> AsyncMeasurement:
+        return self._wrap(await self.run(self._file.get_measurement, guid))
+
+    async def get_background(self, guid: str) -> AsyncMeasurement:
+        return self._wrap(await self.run(self._file.get_background, guid))
+
+    async def tree(self) -> TreeRoot | None:
+        return await self.run(lambda: self._file.tree)
+
+    async def close(self) -> None:
+        await self.run(self._file.close)
+
+    async def __aenter__(self) -> AsyncPTIR5File:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        state = "open" if self.is_open else "closed"
+        return f"<AsyncPTIR5File {self.path!r} ({state})>"
+
+
+class AsyncMeasurement:
+    """Async wrapper around a :class:`~ptir5.Measurement`.
+
+    Properties that need no I/O are exposed directly; anything that reads
+    the file is a coroutine.
+    """
+
+    __slots__ = ("_measurement", "_owner")
+
+    def __init__(self, measurement: Measurement, owner: AsyncPTIR5File) -> None:
+        self._measurement = measurement
+        self._owner = owner
+
+    @property
+    def measurement(self) -> Measurement:
+        """The underlying synchronous measurement. Do not use it concurrently."""
+        return self._measurement
+
+    @property
+    def guid(self) -> str:
+        return self._measurement.guid
+
+    @property
+    def measurement_type(self) -> MeasurementType | str:
+        return self._measurement.measurement_type
+
+    @property
+    def data_shape(self) -> DataShape:
+        return self._measurement.data_shape
+
+    @property
+    def generated(self) -> tuple[AsyncMeasurement, ...]:
+        return tuple(AsyncMeasurement(g, self._owner) for g in self._measurement.generated)
+
+    async def label(self) -> str:
+        return await self._owner.run(lambda: self._measurement.label)
+
+    async def metadata(self) -> dict[str, Any]:
+        """Load all metadata attributes into a plain dict."""
+        return await self._owner.run(lambda: dict(self._measurement.metadata))
+
+    async def read(self) -> np.ndarray[Any, Any]:
+        """Read the full DATA dataset."""
+        return await self._owner.run(lambda: self._measurement.data)
+
+    async def read_spectrum(self, x: int, y: int) -> np.ndarray[Any, Any]:
+        m = self._measurement
+        if not isinstance(m, FloatHypercube3D):
+            raise TypeError(f"{type(m).__name__} has no read_spectrum()")
+        return await self._owner.run(m.read_spectrum, x, y)
+
+    async def read_image(self, index: int) -> np.ndarray[Any, Any]:
+        m = self._measurement
+        if not isinstance(m, FloatHypercube3D | ByteImageStack3D):
+            raise TypeError(f"{type(m).__name__} has no read_image()")
+        return await self._owner.run(m.read_image, index)
+
+    async def iter_tiles(
+        self, tile_shape: tuple[int, ...] | None = None
+    ) -> AsyncIterator[tuple[tuple[slice, ...], np.ndarray[Any, Any]]]:
+        """Async counterpart of :meth:`Measurement.iter_tiles`.
+
+        Each tile is read by its own executor call, so other requests on the
+        same file can interleave between tiles. Leaving the loop early closes
+        the underlying iterator on the executor as well.
+        """
+        it = self._measurement.iter_tiles(tile_shape)
+        try:
+            while True:
+                item = await self._owner.run(next, it, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            await self._owner.run(it.close)
+
+    def __repr__(self) -> str:
+        return f"<AsyncMeasurement {self._measurement!r}>"
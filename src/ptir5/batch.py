@@ -0,0 +1,255 @@
+"""Batch inspection and export of many PTIR5 files, one JSON record per file.
+
+Backs the ``ls``, ``tree``, ``info``, ``stats``, ``export`` and ``bench``
+commands of :mod:`ptir5.cli`. :func:`iter_paths` expands files, directories
+and glob patterns lazily, and :func:`run` applies one of the :data:`TASKS`
+to each file on a process pool, yielding records as files finish with only
+a bounded number in flight, so thousands of inputs stream through without
+being listed up front::
+
+    for record in batch.run("info", batch.iter_paths(["scans/**/*.ptir"]), workers=8):
+        print(record["path"], record["stored_bytes"])
+
+A file that cannot be processed yields ``{"path": ..., "error": ...}``
+instead of stopping the run.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from glob import iglob
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ptir5._records import data_measurements, dumps, measurement_json, time_reads, tree_json
+from ptir5.file import PTIR5File, _with_generated
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from ptir5.models import Measurement
+
+Record = dict[str, Any]
+
+
+def iter_paths(patterns: Iterable[str | Path], suffix: str = ".ptir") -> Iterator[str]:
+    """Expand *patterns* lazily: globs (``**`` recurses), directories and plain paths.
+
+    Directories yield the *suffix* files below them. Plain paths are passed
+    through even if missing, so :func:`run` reports them. Each path is
+    yielded once.
+    """
+    seen: set[str] = set()
+    for pattern in patterns:
+        text = str(pattern)
+        if any(c in text for c in "*?["):
+            matches: Iterable[str] = iglob(text, recursive=True)
+        elif os.path.isdir(text):
+            matches = (
+                os.path.join(root, name)
+                for root, _, names in os.walk(text)
+                for name in sorted(names)
+                if name.endswith(suffix)
+            )
+        else:
+            matches = (text,)
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                yield match
+
+
+# -- Per-file tasks ----------------------------------------------------------------
+# Module-level functions of (path, **options) -> record, so process pools can pickle them.
+
+
+def ls_file(path: str) -> Record:
+    """Measurements and backgrounds with type, label, shape and dtype."""
+    with PTIR5File(path) as f:
+        return {
+            "path": path,
+            "measurements": [measurement_json(m) for m in _with_generated(f.measurements)],
+            "backgrounds": [measurement_json(m) for m in f.backgrounds],
+        }
+
+
+def tree_file(path: str) -> Record:
+    """The document tree, as served by ``/files/{file}/tree``."""
+    with PTIR5File(path) as f:
+        tree = f.tree
+        return {
+            "path": path,
+            "tree": None if tree is None else [tree_json(c) for c in tree.children],
+        }
+
+
+def info_file(path: str) -> Record:
+    """Counts by type and the storage summary totals."""
+    with PTIR5File(path) as f:
+        items = list(_with_generated(f.measurements))
+        summary = f.storage_summary()
+        return {
+            "path": path,
+            "file_bytes": summary.file_bytes,
+            "measurements": len(f.measurements),
+            "generated": len(items) - len(f.measurements),
+            "backgrounds": len(f.backgrounds),
+            "types": dict(Counter(str(m.measurement_type) for m in items)),
+            "has_tree": f.has_tree,
+            "datasets": len(summary.datasets),
+            "logical_bytes": summary.logical_bytes,
+            "stored_bytes": summary.stored_bytes,
+            "compression_ratio": summary.compression_ratio,
+            "layouts": summary.layouts(),
+            "filters": summary.filters(),
+        }
+
+
+def stats_file(path: str, bins: int = 64, per_plane: bool = False, cache: bool = False) -> Record:
+    """:meth:`Measurement.stats` of every DATA dataset, without ``per_plane`` by default."""
+    with PTIR5File(path) as f:
+        rows = []
+        for m in data_measurements(f):
+            stats = m.stats(bins=bins, cache=cache).to_dict()
+            if not per_plane:
+                del stats["per_plane"]
+            rows.append({"guid": m.guid, "type": str(m.measurement_type), **stats})
+        return {"path": path, "measurements": rows}
+
+
+def export_file(path: str, out_dir: str, overwrite: bool = False) -> Record:
+    """Write each DATA as ``<out_dir>/<file stem>/<guid>.npy`` with a ``<guid>.json`` sidecar.
+
+    Arrays are written tile by tile into a memory-mapped ``.npy``, so no
+    measurement is held in memory whole. The sidecar has the type, label
+    and metadata.
+    """
+    target = Path(out_dir) / Path(path).stem
+    target.mkdir(parents=True, exist_ok=True)
+    written: list[str] = []
+    total = 0
+    with PTIR5File(path) as f:
+        for m in data_measurements(f):
+            npy, sidecar = target / f"{m.guid}.npy", target / f"{m.guid}.json"
+            if not overwrite and (npy.exists() or sidecar.exists()):
+                raise FileExistsError(f"{npy} already exists (use overwrite)")
+            data_path = f"{m._hdf5_path}/DATA"
+            out = np.lib.format.open_memmap(
+                npy,
+                mode="w+",
+                dtype=m._reader.dataset_dtype(data_path),
+                shape=m._reader.dataset_shape(data_path),
+            )
+            for slices, tile in m.iter_tiles():
+                out[slices] = tile
+            out.flush()
+            total += out.nbytes
+            del out
+            sidecar.write_text(to_json_line(_sidecar(m)) + "\n", encoding="utf-8")
+            written += [str(npy), str(sidecar)]
+    return {"path": path, "out": str(target), "files": written, "bytes": total}
+
+
+def _sidecar(m: Measurement) -> Record:
+    return {
+        "guid": m.guid,
+        "type": str(m.measurement_type),
+        "label": m.label,
+        "metadata": dict(m.metadata),
+    }
+
+
+def bench_file(path: str, samples: int = 32) -> Record:
+    """Time opening, full DATA reads, and *samples* random spectra and planes."""
+    t0 = time.perf_counter()
+    with PTIR5File(path) as f:
+        opened = time.perf_counter()
+        nbytes = 0
+        for m in data_measurements(f):
+            nbytes += m.read().nbytes
+        read_s = time.perf_counter() - opened
+    return {
+        "path": path,
+        "open_s": opened - t0,
+        "read_s": read_s,
+        "read_bytes": nbytes,
+        "read_mb_s": nbytes / read_s / 1e6 if read_s > 0 else None,
+        "samples": samples,
+        "sampled_s": time_reads(path, samples),
+    }
+
+
+TASKS: dict[str, Callable[..., Record]] = {
+    "ls": ls_file,
+    "tree": tree_file,
+    "info": info_file,
+    "stats": stats_file,
+    "export": export_file,
+    "bench": bench_file,
+}
+
+
+def to_json_line(record: Record) -> str:
+    """Serialise *record* as one JSON line; NumPy values are converted, NaN becomes ``null``."""
+    return dumps(record)
+
+
+def _safe(task: Callable[..., Record], path: str) -> Record:
+    try:
+        return task(path)
+    except Exception as exc:
+        return {"path": path, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def run(
+    task: str,
+    paths: Iterable[str],
+    *,
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+    **options: Any,
+) -> Iterator[Record]:
+    """Apply the named task to every path; yield records in completion order.
+
+    *options* are passed to the task function. *workers* defaults to the
+    CPU count; with one worker, files are processed in order on the calling
+    thread. At most *max_in_flight* files (default twice *workers*) are
+    submitted at once, so *paths* is consumed only as fast as results come
+    back.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Unknown task {task!r}; expected one of {', '.join(TASKS)}")
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    limit = max_in_flight if max_in_flight is not None else 2 * workers
+    if limit < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {limit}")
+    fn = functools.partial(TASKS[task], **options)
+    if workers == 1:
+        for path in paths:
+            yield _safe(fn, path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: set[Future[Record]] = set()
+        try:
+            for path in paths:
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(pool.submit(_safe, fn, path))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
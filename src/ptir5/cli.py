@@ -0,0 +1,132 @@
+"""``ptir5`` command-line interface."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from ptir5._version import __version__
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from ptir5.server import serve
+
+    serve(
+        args.files,
+        args.host,
+        args.port,
+        cache_mb=args.cache_mb,
+        per_file=args.per_file,
+        verbose=args.verbose,
+    )
+    return 0
+
+
+def _cmd_repack(args: argparse.Namespace) -> int:
+    from ptir5.repack import repack
+
+    report = repack(
+        args.source,
+        args.destination,
+        layout=args.layout,
+        compression=args.compression,
+        overwrite=args.overwrite,
+        benchmark=not args.no_bench,
+    )
+    print(report)
+    return 0
+
+
+def _cmd_batch(args: argparse.Namespace) -> int:
+    from ptir5 import batch
+
+    options = {name: getattr(args, name) for name in args.options}
+    failed = 0
+    records = batch.run(
+        args.command, batch.iter_paths(args.files), workers=args.workers, **options
+    )
+    for record in records:
+        failed += "error" in record
+        sys.stdout.write(batch.to_json_line(record) + "\n")
+        sys.stdout.flush()
+    return 1 if failed else 0
+
+
+_BATCH_COMMANDS = {
+    "ls": "list measurements and backgrounds with type, label, shape and dtype",
+    "tree": "print the document tree",
+    "info": "count measurements by type and summarise storage",
+    "stats": "compute DATA statistics",
+    "export": "write DATA as .npy files with JSON metadata sidecars",
+    "bench": "time opening, full reads and random spectrum/plane reads",
+}
+
+
+def _add_batch_commands(sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="+",
+                        help="files, directories (searched for .ptir) or glob patterns "
+                             "(quote them; ** recurses)")
+    common.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    for name, help_text in _BATCH_COMMANDS.items():
+        p = sub.add_parser(name, parents=[common], help=f"{help_text} (JSON Lines)")
+        p.set_defaults(func=_cmd_batch, options=())
+        if name == "stats":
+            p.add_argument("--bins", type=int, default=64,
+                           help="histogram bins (default: %(default)s)")
+            p.add_argument("--per-plane", action="store_true",
+                           help="include per-band/per-frame statistics")
+            p.add_argument("--cache", action="store_true",
+                           help="reuse and write .stats.json sidecars")
+            p.set_defaults(options=("bins", "per_plane", "cache"))
+        elif name == "export":
+            p.add_argument("-o", "--out-dir", required=True,
+                           help="output directory; each file gets a subdirectory")
+            p.add_argument("--overwrite", action="store_true",
+                           help="replace existing exported files")
+            p.set_defaults(options=("out_dir", "overwrite"))
+        elif name == "bench":
+            p.add_argument("--samples", type=int, default=32,
+                           help="random spectra and planes to time (default: %(default)s)")
+            p.set_defaults(options=("samples",))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ptir5", description="Tools for PTIR5 files.")
+    parser.add_argument("--version", action="version", version=f"ptir5 {__version__}")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="serve tree, metadata, images and spectra over HTTP")
+    p.add_argument("files", nargs="+", type=Path, help=".ptir files to serve")
+    p.add_argument("--host", default="127.0.0.1", help="bind address (default: %(default)s)")
+    p.add_argument("--port", type=int, default=8765, help="port (default: %(default)s)")
+    p.add_argument("--cache-mb", type=float, default=256,
+                   help="response cache size in MiB (default: %(default)s)")
+    p.add_argument("--per-file", type=int, default=4,
+                   help="concurrent requests allowed per file (default: %(default)s)")
+    p.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    p.set_defaults(func=_cmd_serve)
+
+    p = sub.add_parser("repack", help="write a copy with DATA rechunked for an access pattern")
+    p.add_argument("source", type=Path, help="input .ptir file (never modified)")
+    p.add_argument("destination", type=Path, help="output .ptir file")
+    p.add_argument("--layout", choices=["pixel", "plane", "balanced"], default="balanced",
+                   help="chunk layout: pixel spectra, whole planes, or a mix "
+                        "(default: %(default)s)")
+    p.add_argument("--compression", default="lzf",
+                   help="lzf, gzip:N (N = 0-9) or none (default: %(default)s)")
+    p.add_argument("--overwrite", action="store_true", help="replace an existing destination")
+    p.add_argument("--no-bench", action="store_true",
+                   help="skip timing reads on the source and the copy")
+    p.set_defaults(func=_cmd_repack)
+
+    _add_batch_commands(sub)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    result: int = args.func(args)
+    return result
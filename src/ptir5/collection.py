@@ -0,0 +1,197 @@
+"""Collection — many PTIR5 files behind a bounded pool of open handles.
+
+Each file's :class:`~ptir5.PTIR5File` (measurements, backgrounds, tree,
+metadata already read) is kept for the life of the collection. Only the
+underlying HDF5 handles are limited: when more than ``max_open`` files are
+in use, the least recently used one is suspended and is reopened
+transparently the next time one of its measurements reads data.
+
+A collection is meant to be used from one thread at a time; a handle
+evicted by one thread while another is reading through it would fail.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ptir5.exceptions import FileClosedError, MeasurementNotFoundError
+from ptir5.file import PTIR5File
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from ptir5._reader import HDF5Reader
+    from ptir5.enums import MeasurementType
+    from ptir5.models import Measurement
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of a :class:`HandlePool`'s counters."""
+
+    max_open: int
+    open: int
+    opens: int
+    reopens: int
+    evictions: int
+    hits: int
+
+
+class HandlePool:
+    """LRU set of open :class:`~ptir5._reader.HDF5Reader` handles."""
+
+    __slots__ = (
+        "_max_open",
+        "_open",
+        "_seen",
+        "_lock",
+        "_opens",
+        "_reopens",
+        "_evictions",
+        "_hits",
+    )
+
+    def __init__(self, max_open: int) -> None:
+        if max_open < 1:
+            raise ValueError(f"max_open must be at least 1, got {max_open}")
+        self._max_open = max_open
+        self._open: OrderedDict[int, HDF5Reader] = OrderedDict()
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+        self._opens = 0
+        self._reopens = 0
+        self._evictions = 0
+        self._hits = 0
+
+    def touch(self, reader: HDF5Reader) -> None:
+        """Mark *reader* most recently used, suspending the LRU reader if over capacity."""
+        key = id(reader)
+        with self._lock:
+            if key in self._open:
+                self._open.move_to_end(key)
+                self._hits += 1
+                return
+            self._open[key] = reader
+            if reader.path in self._seen:
+                self._reopens += 1
+            else:
+                self._seen.add(reader.path)
+                self._opens += 1
+            while len(self._open) > self._max_open:
+                _, victim = self._open.popitem(last=False)
+                victim.suspend()
+                self._evictions += 1
+
+    def discard(self, reader: HDF5Reader) -> None:
+        with self._lock:
+            self._open.pop(id(reader), None)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                max_open=self._max_open,
+                open=len(self._open),
+                opens=self._opens,
+                reopens=self._reopens,
+                evictions=self._evictions,
+                hits=self._hits,
+            )
+
+
+class Collection:
+    """Unified, read-only view over many PTIR5 files.
+
+    Files are opened on first use. Use as a context manager::
+
+        with ptir5.Collection(paths, max_open=16) as c:
+            for m in c.measurements:
+                ...
+    """
+
+    __slots__ = ("_paths", "_files", "_pool", "_index", "_closed")
+
+    def __init__(self, paths: Iterable[str | Path], *, max_open: int = 32) -> None:
+        self._paths = tuple(dict.fromkeys(str(p) for p in paths))
+        self._files: dict[str, PTIR5File] = {}
+        self._pool = HandlePool(max_open)
+        self._index: dict[str, list[str]] | None = None
+        self._closed = False
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        return self._paths
+
+    @property
+    def stats(self) -> PoolStats:
+        """Handle pool counters: open handles, first opens, reopens, evictions, hits."""
+        return self._pool.stats()
+
+    def file(self, path: str | Path) -> PTIR5File:
+        """Return the :class:`PTIR5File` for *path*, which must be in the collection."""
+        if self._closed:
+            raise FileClosedError("Collection is closed")
+        key = str(path)
+        f = self._files.get(key)
+        if f is None:
+            if key not in self._paths:
+                raise KeyError(f"{key} is not part of this collection")
+            f = PTIR5File(key)
+            f._reader.attach_pool(self._pool)
+            self._files[key] = f
+        return f
+
+    @property
+    def files(self) -> tuple[PTIR5File, ...]:
+        """Every file, in path order, opened as needed."""
+        return tuple(self.file(p) for p in self._paths)
+
+    @property
+    def measurements(self) -> tuple[Measurement, ...]:
+        """Top-level measurements of every file, in path order."""
+        # File by file, so each structure is loaded while its handle is fresh.
+        return tuple(m for p in self._paths for m in self.file(p).measurements)
+
+    def measurements_by_type(self, type_: MeasurementType | str) -> tuple[Measurement, ...]:
+        return tuple(m for m in self.measurements if m.measurement_type == type_)
+
+    def _guid_index(self) -> dict[str, list[str]]:
+        if self._index is None:
+            index: dict[str, list[str]] = {}
+            for path in self._paths:
+                for m in self.file(path).measurements:
+                    index.setdefault(m.guid, []).append(path)
+            self._index = index
+        return self._index
+
+    def locate(self, guid: str) -> list[str]:
+        """Paths of every file containing measurement *guid*."""
+        return list(self._guid_index().get(guid, ()))
+
+    def get_measurement(self, guid: str) -> Measurement:
+        """Find a measurement by GUID; the first file in path order wins if it repeats."""
+        paths = self._guid_index().get(guid)
+        if not paths:
+            raise MeasurementNotFoundError(guid)
+        return self.file(paths[0]).get_measurement(guid)
+
+    def close(self) -> None:
+        self._closed = True
+        for f in self._files.values():
+            f.close()
+
+    def __enter__(self) -> Collection:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        s = self._pool.stats()
+        return f"<Collection {len(self._paths)} files ({s.open}/{s.max_open} open)>"
@@ -0,0 +1,189 @@
+"""Out-of-core map/reduce over measurement DATA.
+
+:func:`map_blocks` applies a function to every block of a measurement's
+DATA, on a thread or process pool, without loading the whole array. Blocks
+follow the HDF5 chunk grid (as :meth:`Measurement.iter_tiles` does), at
+most *max_in_flight* of them are read or processed at any time, and results
+come back in block order. With *reduce*, results are combined pairwise in a
+balanced tree as they arrive, so only O(log n) partial results are held::
+
+    total = compute.map_blocks(m, np.nansum, reduce=operator.add, workers=8)
+
+The process backend ships only the file and dataset path to each worker,
+which opens its own handle; *fn* and *reduce* must then be picklable.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+
+from ptir5._blocks import default_block_shape, iter_blocks, validate_block_shape
+from ptir5._lazy import DatasetProxy
+from ptir5.exceptions import PTIR5Error
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+
+    from ptir5.models import Measurement
+
+T = TypeVar("T")
+
+Backend = Literal["thread", "process"]
+
+
+class _TreeReducer:
+    """Ordered pairwise reduction: combines equal-sized runs like a binary counter."""
+
+    __slots__ = ("_combine", "_stack")
+
+    def __init__(self, combine: Callable[[Any, Any], Any]) -> None:
+        self._combine = combine
+        self._stack: list[tuple[int, Any]] = []
+
+    def push(self, value: Any) -> None:
+        level = 0
+        while self._stack and self._stack[-1][0] == level:
+            _, left = self._stack.pop()
+            value = self._combine(left, value)
+            level += 1
+        self._stack.append((level, value))
+
+    def result(self) -> Any:
+        if not self._stack:
+            raise ValueError("map_blocks() has no blocks to reduce")
+        _, value = self._stack.pop()
+        while self._stack:
+            _, left = self._stack.pop()
+            value = self._combine(left, value)
+        return value
+
+
+def _apply(proxy: DatasetProxy, fn: Callable[[np.ndarray[Any, Any]], Any], sel: Any) -> Any:
+    return fn(proxy[sel])
+
+
+def _proxy(m: Measurement, backend: Backend) -> DatasetProxy:
+    """DATA of *m*: read through its own handle by threads, reopened by path in processes."""
+    data_path = f"{m._hdf5_path}/DATA"
+    if not m._reader.has_dataset(data_path):
+        raise ValueError(f"Measurement {m.guid} has no DATA dataset")
+    if backend == "thread":
+        return DatasetProxy(m._reader.path, data_path, m._reader)
+    if not m._reader.reopenable:
+        raise PTIR5Error(
+            f"{m._reader.path} was not opened from a path; "
+            "use backend='thread' or open the file by path"
+        )
+    return DatasetProxy(m._reader.path, data_path)
+
+
+def block_slices(
+    m: Measurement, block_shape: tuple[int, ...] | None = None
+) -> list[tuple[slice, ...]]:
+    """The blocks :func:`map_blocks` uses for *m*, in result order."""
+    proxy = _proxy(m, "thread")
+    return list(iter_blocks(proxy.shape, _block_shape(proxy, block_shape)))
+
+
+def _block_shape(proxy: DatasetProxy, block_shape: tuple[int, ...] | None) -> tuple[int, ...]:
+    if block_shape is None:
+        return default_block_shape(proxy.shape, proxy.dtype.itemsize, proxy.chunks)
+    validate_block_shape(block_shape, proxy.shape)
+    return block_shape
+
+
+@overload
+def map_blocks(
+    m: Measurement,
+    fn: Callable[[np.ndarray[Any, Any]], T],
+    *,
+    reduce: None = None,
+    block_shape: tuple[int, ...] | None = None,
+    workers: int | None = None,
+    backend: Backend = "thread",
+    max_in_flight: int | None = None,
+) -> list[T]: ...
+
+
+@overload
+def map_blocks(
+    m: Measurement,
+    fn: Callable[[np.ndarray[Any, Any]], T],
+    *,
+    reduce: Callable[[T, T], T],
+    block_shape: tuple[int, ...] | None = None,
+    workers: int | None = None,
+    backend: Backend = "thread",
+    max_in_flight: int | None = None,
+) -> T: ...
+
+
+def map_blocks(
+    m: Measurement,
+    fn: Callable[[np.ndarray[Any, Any]], T],
+    *,
+    reduce: Callable[[T, T], T] | None = None,
+    block_shape: tuple[int, ...] | None = None,
+    workers: int | None = None,
+    backend: Backend = "thread",
+    max_in_flight: int | None = None,
+) -> list[T] | T:
+    """Apply *fn* to every block of *m*'s DATA; return the results or their reduction.
+
+    Without *reduce*, returns one result per block in :func:`block_slices`
+    order. With *reduce*, results are combined in order (``reduce(left,
+    right)``) as a balanced tree, which suits associative combiners such as
+    ``operator.add`` or merging partial statistics.
+
+    *workers* defaults to the CPU count and *max_in_flight* to twice that; it
+    bounds how many blocks are being read or processed at once, and so the
+    memory held in blocks. Raises :class:`PTIR5Error` for the process
+    backend when the file was not opened from a path.
+    """
+    if backend not in ("thread", "process"):
+        raise ValueError(f"backend must be 'thread' or 'process', got {backend!r}")
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    limit = max_in_flight if max_in_flight is not None else 2 * workers
+    if limit < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {limit}")
+
+    proxy = _proxy(m, backend)
+    blocks = iter_blocks(proxy.shape, _block_shape(proxy, block_shape))
+
+    results: list[T] = []
+    reducer = _TreeReducer(reduce) if reduce is not None else None
+
+    def collect(value: T) -> None:
+        if reducer is not None:
+            reducer.push(value)
+        else:
+            results.append(value)
+
+    pool: Executor
+    if backend == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Future[T]] = deque()
+    try:
+        for sel in blocks:
+            if len(pending) >= limit:
+                collect(pending.popleft().result())
+            pending.append(pool.submit(_apply, proxy, fn, sel))
+        while pending:
+            collect(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+    if reducer is not None:
+        result: T = reducer.result()
+        return result
+    return results
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import os
+from typing import TYPE_CHECKING, Any, Literal
 
-from ptir5._reader import HDF5Reader
+import numpy as np
+
+from ptir5._blockio import DEFAULT_CACHE_SIZE
+from ptir5._reader import DEFAULT_MAX_PRELOAD, HDF5Reader
 from ptir5.exceptions import FileClosedError, MeasurementNotFoundError
+from ptir5.index import GuidIndex
 from ptir5.models import Measurement, build_measurement
+from ptir5.processing import SpectraMatrix, spectra_matrix
+from ptir5.profiling import OpenProfiler, ProfileReport, phase
+from ptir5.storage import StorageSummary
 from ptir5.tree import TreeFolder, TreeLeaf, TreeRoot
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Iterable, Iterator
+
+    from numpy.typing import ArrayLike
 
+    from ptir5._reader import Source
     from ptir5.enums import MeasurementType
+    from ptir5.index import IndexEntry
 
 
 class PTIR5File:
@@ -34,17 +47,43 @@ class PTIR5File:
         "_background_map",
         "_tree",
         "_tree_loaded",
+        "_index",
+        "_profiler",
+        "_profile",
     )
 
-    def __init__(self, path: str | Path) -> None:
-        self._path = str(path)
-        self._reader = HDF5Reader(path)
+    def __init__(
+        self,
+        path: Source,
+        *,
+        profile: bool = False,
+        block_size: int | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        preload: bool | Literal["auto"] = False,
+        max_preload: int | None = DEFAULT_MAX_PRELOAD,
+    ) -> None:
         self._measurements: tuple[Measurement, ...] | None = None
         self._backgrounds: tuple[Measurement, ...] | None = None
         self._measurement_map: dict[str, Measurement] | None = None
         self._background_map: dict[str, Measurement] | None = None
         self._tree: TreeRoot | None = None
         self._tree_loaded = False
+        self._index: GuidIndex | None = None
+        self._profiler: OpenProfiler | None = None
+        self._profile: ProfileReport | None = None
+        open_reader = functools.partial(
+            HDF5Reader,
+            path,
+            block_size=block_size,
+            cache_size=cache_size,
+            preload=preload,
+            max_preload=max_preload,
+        )
+        if profile:
+            self._open_profiled(open_reader)
+        else:
+            self._reader = open_reader()
+        self._path = self._reader.path
 
     def _check_open(self) -> None:
         if not self._reader.is_open:
@@ -60,6 +99,22 @@ class PTIR5File:
     def is_open(self) -> bool:
         return self._reader.is_open
 
+    @property
+    def in_memory(self) -> bool:
+        """Whether the whole file is held in memory (opened from bytes or preloaded)."""
+        return self._reader.in_memory
+
+    @property
+    def block_cache_stats(self) -> dict[str, int] | None:
+        """Block cache counters when opened from a file-like object with ``block_size``."""
+        cache = self._reader.block_cache
+        return None if cache is None else cache.stats()
+
+    @property
+    def profile(self) -> ProfileReport | None:
+        """Load-time profile if opened with ``profile=True``, else None."""
+        return self._profile
+
     @property
     def measurements(self) -> tuple[Measurement, ...]:
         self._check_open()
@@ -110,6 +165,117 @@ class PTIR5File:
         except KeyError:
             raise MeasurementNotFoundError(guid) from None
 
+    @property
+    def index(self) -> GuidIndex:
+        """GUID and label index of every measurement, GENERATED item, background and tree node.
+
+        Built in one pass on first use.
+        """
+        self._check_open()
+        if self._index is None:
+            with phase(self._profiler, "index"):
+                self._index = GuidIndex(self.measurements, self.backgrounds, self.tree)
+        return self._index
+
+    def lookup(self, guid: str) -> IndexEntry:
+        """Find any GUID in the file, returning the object with its kind and parent.
+
+        Raises :class:`MeasurementNotFoundError` if the GUID is unknown.
+        """
+        return self.index.lookup(guid)
+
+    def find_by_label(self, pattern: str) -> list[IndexEntry]:
+        """Entries whose label equals *pattern*, or matches it as a glob (case-insensitive)."""
+        return self.index.find_by_label(pattern)
+
+    def get_metadata(
+        self,
+        key: str,
+        default: Any = None,
+        *,
+        measurements: Iterable[Measurement] | None = None,
+        include_generated: bool = False,
+    ) -> dict[str, Any]:
+        """Read one metadata key across many measurements, keyed by GUID.
+
+        Only *key* is read from each group, and the values are cached on each
+        measurement's :class:`MetadataView`, so a following ``m.label`` (for
+        ``"Label"``) does no I/O. Defaults to all top-level measurements.
+        """
+        self._check_open()
+        items = list(self.measurements if measurements is None else measurements)
+        if include_generated:
+            items = list(_with_generated(items))
+        result: dict[str, Any] = {}
+        for m in items:
+            found, value = m._reader.read_attr(m._hdf5_path, key)
+            m.metadata._prime(key, found, value)
+            result[m.guid] = value if found else default
+        return result
+
+    def spectra_matrix(
+        self,
+        type_or_guids: MeasurementType | str | Iterable[str | Measurement],
+        align: str = "exact",
+        *,
+        grid: ArrayLike | None = None,
+        fill: float = np.nan,
+    ) -> SpectraMatrix:
+        """Stack spectra into one ``(n, points)`` array with their x-axis and GUIDs.
+
+        *type_or_guids* is a measurement type (matching GENERATED children
+        too) or an iterable of GUIDs or measurements, which may include
+        backgrounds. The matrix is allocated once and every spectrum is read
+        directly into its row. See :func:`ptir5.processing.spectra_matrix`
+        for *align*.
+        """
+        self._check_open()
+        if isinstance(type_or_guids, str):
+            items = [
+                m for m in _with_generated(self.measurements)
+                if m.measurement_type == type_or_guids
+            ]
+        else:
+            index: dict[str, Measurement] | None = None
+            items = []
+            for entry in type_or_guids:
+                if isinstance(entry, Measurement):
+                    items.append(entry)
+                    continue
+                if index is None:
+                    index = {
+                        m.guid: m
+                        for m in _with_generated((*self.measurements, *self.backgrounds))
+                    }
+                try:
+                    items.append(index[entry])
+                except KeyError:
+                    raise MeasurementNotFoundError(entry) from None
+        return spectra_matrix(items, align, grid=grid, fill=fill)
+
+    def fingerprint(
+        self, quick: bool = False, workers: int | None = None, cache: bool = True
+    ) -> str:
+        """Hex digest of the fingerprints of every measurement, GENERATED child and background.
+
+        See :meth:`Measurement.fingerprint`.
+        """
+        self._check_open()
+        from ptir5.fingerprint import file_fingerprint
+
+        return file_fingerprint(self, quick=quick, workers=workers, cache=cache)
+
+    def storage_summary(self) -> StorageSummary:
+        """Storage layout of every DATA dataset (GENERATED children and backgrounds included)."""
+        self._check_open()
+        infos = tuple(
+            m._reader.dataset_storage(f"{m._hdf5_path}/DATA")
+            for m in _with_generated((*self.measurements, *self.backgrounds))
+            if m._reader.has_dataset(f"{m._hdf5_path}/DATA")
+        )
+        file_bytes = os.path.getsize(self._path) if self._reader.reopenable else None
+        return StorageSummary(self._path, file_bytes, infos)
+
     def measurements_by_type(
         self, type_: MeasurementType
     ) -> tuple[Measurement, ...]:
@@ -132,25 +298,51 @@ class PTIR5File:
 
     # -- Internal loading ---------------------------------------------------
 
+    def _open_profiled(self, open_reader: Callable[[], HDF5Reader]) -> None:
+        """Open and eagerly load everything, recording a :class:`ProfileReport`."""
+        profiler = OpenProfiler()
+        self._profiler = profiler
+        try:
+            with profiler.collecting():
+                with profiler.phase("open"):
+                    self._reader = open_reader()
+                self._load_measurements()
+                self._load_backgrounds()
+                self._load_tree()
+                assert self._measurements is not None and self._backgrounds is not None
+                for m in (*self._measurements, *self._backgrounds):
+                    self._load_metadata_profiled(profiler, m)
+        finally:
+            self._profiler = None
+        self._profile = profiler.report(self._reader.path)
+
+    def _load_metadata_profiled(self, profiler: OpenProfiler, m: Measurement) -> None:
+        with profiler.measurement(m.guid, m._hdf5_path, "metadata"), profiler.phase("metadata"):
+            len(m.metadata)
+        for child in m.generated:
+            self._load_metadata_profiled(profiler, child)
+
     def _load_measurements(self) -> None:
-        guids = self._reader.list_measurement_guids()
+        with phase(self._profiler, "guid_listing"):
+            guids = self._reader.list_measurement_guids()
         items: list[Measurement] = []
         mapping: dict[str, Measurement] = {}
         for guid in guids:
             path = f"MEASUREMENTS/{guid}"
-            m = build_measurement(self._reader, path, guid)
+            m = build_measurement(self._reader, path, guid, self._profiler)
             items.append(m)
             mapping[guid] = m
         self._measurements = tuple(items)
         self._measurement_map = mapping
 
     def _load_backgrounds(self) -> None:
-        guids = self._reader.list_background_guids()
+        with phase(self._profiler, "guid_listing"):
+            guids = self._reader.list_background_guids()
         items: list[Measurement] = []
         mapping: dict[str, Measurement] = {}
         for guid in guids:
             path = f"BACKGROUNDS/{guid}"
-            m = build_measurement(self._reader, path, guid)
+            m = build_measurement(self._reader, path, guid, self._profiler, "backgrounds")
             items.append(m)
             mapping[guid] = m
         self._backgrounds = tuple(items)
@@ -168,8 +360,10 @@ class PTIR5File:
         assert self._measurement_map is not None
 
         # Build lookup of TREE node info
-        root_child_ids = self._reader.read_tree_node_ids("TREE")
-        children = tuple(self._build_tree_node(guid) for guid in root_child_ids)
+        with phase(self._profiler, "tree"):
+            with phase(self._profiler, "tree_nodes"):
+                root_child_ids = self._reader.read_tree_node_ids("TREE")
+            children = tuple(self._build_tree_node(guid) for guid in root_child_ids)
         self._tree = TreeRoot(children)
 
     def _build_tree_node(self, guid: str) -> TreeFolder | TreeLeaf:
@@ -178,10 +372,18 @@ class PTIR5File:
         label = self._reader.read_label(tree_path)
 
         if type_str == "FOLDER":
-            child_ids = self._reader.read_tree_node_ids(tree_path)
+            with phase(self._profiler, "tree_nodes"):
+                child_ids = self._reader.read_tree_node_ids(tree_path)
             children = tuple(self._build_tree_node(cid) for cid in child_ids)
-            return TreeFolder(name=label, children=children)
+            return TreeFolder(name=label, children=children, guid=guid)
         else:
             assert self._measurement_map is not None
             measurement = self._measurement_map.get(guid)
             return TreeLeaf(name=label, guid=guid, measurement=measurement)
+
+
+def _with_generated(items: Iterable[Measurement]) -> Iterator[Measurement]:
+    """Yield *items* and, depth-first, all their GENERATED descendants."""
+    for m in items:
+        yield m
+        yield from _with_generated(m.generated)
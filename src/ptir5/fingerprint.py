@@ -0,0 +1,144 @@
+"""Content fingerprints of measurements and files.
+
+A full fingerprint hashes a measurement's type, metadata and dataset
+layouts together with the stored bytes of its DATA. The bytes are read as
+raw chunks where DATA is chunked, so nothing is decompressed, and are
+hashed block by block on a thread pool. A quick fingerprint skips the data
+and hashes only structure, shapes, storage sizes and metadata, which costs
+a few attribute reads. Different quick fingerprints always mean different
+content; equal ones need the full hash to confirm, so a dedup job only
+fully hashes items whose quick fingerprints collide::
+
+    by_quick = defaultdict(list)
+    for m in items:
+        by_quick[m.fingerprint(quick=True)].append(m)
+    dupes = [g for g in by_quick.values() if len({m.fingerprint() for m in g}) < len(g)]
+
+Both are hex strings. Results are cached in-process, keyed by the file's
+path, size and modification time, so unchanged files are never hashed
+twice. Files not opened from a path are not cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ptir5.file import _with_generated
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ptir5._reader import HDF5Reader
+    from ptir5.file import PTIR5File
+    from ptir5.models import Measurement
+
+DIGEST_SIZE = 16
+
+_CACHE_SIZE = 4096
+_cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _canonical(value: Any) -> bytes:
+    """Stable bytes for a metadata value (arrays by dtype, shape and contents)."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "O":
+            return repr(value.tolist()).encode()
+        return repr((value.dtype.str, value.shape)).encode() + value.tobytes()
+    if isinstance(value, np.generic):
+        return repr((value.dtype.str, value.item())).encode()
+    return repr(value).encode()
+
+
+def _cache_key(reader: HDF5Reader, item: str, quick: bool) -> tuple[Any, ...] | None:
+    if not reader.reopenable:
+        return None
+    try:
+        st = os.stat(reader.path)
+    except OSError:
+        return None
+    return (os.path.realpath(reader.path), st.st_size, st.st_mtime_ns, item, quick)
+
+
+def _cached(key: tuple[Any, ...] | None, compute: Callable[[], str]) -> str:
+    if key is not None:
+        with _cache_lock:
+            hit = _cache.get(key)
+            if hit is not None:
+                _cache.move_to_end(key)
+                return hit
+    digest = compute()
+    if key is not None:
+        with _cache_lock:
+            _cache[key] = digest
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return digest
+
+
+def clear_cache() -> None:
+    """Forget every cached fingerprint."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _structure(m: Measurement) -> hashlib.blake2b:
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(f"{m._hdf5_path}|{m.measurement_type}".encode())
+    for key, value in sorted(m.metadata.items()):
+        h.update(key.encode() + b"=" + _canonical(value) + b";")
+    for name in sorted(m._reader.list_datasets(m._hdf5_path)):
+        info = m._reader.dataset_storage(f"{m._hdf5_path}/{name}").to_dict()
+        # The address is an artefact of where the writer put the data, not content.
+        info.pop("offset", None)
+        h.update(json.dumps(info, sort_keys=True, default=str).encode())
+    return h
+
+
+def _workers(workers: int | None) -> int:
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    return workers
+
+
+def measurement_fingerprint(
+    m: Measurement, *, quick: bool = False, workers: int | None = None, cache: bool = True
+) -> str:
+    """Fingerprint of *m*; see :meth:`Measurement.fingerprint`."""
+    workers = _workers(workers)
+
+    def compute() -> str:
+        h = _structure(m)
+        data_path = f"{m._hdf5_path}/DATA"
+        if not quick and m._reader.has_dataset(data_path):
+            h.update(m._reader.dataset_digest(data_path, workers))
+        return h.hexdigest()
+
+    key = _cache_key(m._reader, m._hdf5_path, quick) if cache else None
+    return _cached(key, compute)
+
+
+def file_fingerprint(
+    f: PTIR5File, *, quick: bool = False, workers: int | None = None, cache: bool = True
+) -> str:
+    """Fingerprint of every measurement in *f*; see :meth:`PTIR5File.fingerprint`."""
+    workers = _workers(workers)
+    items = list(_with_generated((*f.measurements, *f.backgrounds)))
+
+    def compute() -> str:
+        h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        for m in items:
+            digest = measurement_fingerprint(m, quick=quick, workers=workers, cache=cache)
+            h.update(bytes.fromhex(digest))
+        return h.hexdigest()
+
+    key = _cache_key(f._reader, "/", quick) if cache else None
+    return _cached(key, compute)
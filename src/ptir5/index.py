@@ -0,0 +1,137 @@
+"""GUID and label index over everything in a PTIR5 file.
+
+:class:`GuidIndex` is built in one pass over MEASUREMENTS (with their
+GENERATED descendants), BACKGROUNDS and the document tree. It maps every
+GUID to an :class:`IndexEntry` holding the object, its kind and its
+parent, and keeps labels in a sorted list so that exact and prefix label
+searches are binary searches rather than scans::
+
+    entry = f.lookup(guid)
+    entry.kind, entry.parent
+    f.find_by_label("Spectrum 1*")
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from ptir5.exceptions import MeasurementNotFoundError
+from ptir5.tree import TreeFolder, TreeLeaf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ptir5.models import Measurement
+    from ptir5.tree import TreeRoot
+
+EntryKind = Literal["measurement", "generated", "background", "folder", "leaf"]
+
+_WILDCARDS = "*?["
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """One GUID in a :class:`GuidIndex`.
+
+    *parent* is the measurement a GENERATED item belongs to, or the tree
+    folder whose children include this measurement, background or folder;
+    None at the top level. ``leaf`` entries are tree leaves whose GUID
+    names no measurement.
+    """
+
+    guid: str
+    kind: EntryKind
+    obj: Measurement | TreeFolder | TreeLeaf
+    parent: Measurement | TreeFolder | None
+    label: str
+
+
+class GuidIndex:
+    """Every GUID of a file mapped to its :class:`IndexEntry`, plus a sorted label index."""
+
+    __slots__ = ("_entries", "_label_keys", "_label_entries")
+
+    def __init__(
+        self,
+        measurements: Iterable[Measurement],
+        backgrounds: Iterable[Measurement],
+        tree: TreeRoot | None,
+    ) -> None:
+        entries: dict[str, IndexEntry] = {}
+        # Tree position of each GUID, so measurements can name their folder.
+        folder_of: dict[str, TreeFolder] = {}
+        tree_nodes: list[tuple[TreeFolder | TreeLeaf, TreeFolder | None]] = []
+        if tree is not None:
+            stack: list[tuple[TreeFolder | TreeLeaf, TreeFolder | None]] = [
+                (c, None) for c in reversed(tree.children)
+            ]
+            while stack:
+                node, parent = stack.pop()
+                tree_nodes.append((node, parent))
+                if node.guid is not None and parent is not None:
+                    folder_of[node.guid] = parent
+                if isinstance(node, TreeFolder):
+                    stack.extend((c, node) for c in reversed(node.children))
+
+        def add(m: Measurement, kind: EntryKind, parent: Measurement | TreeFolder | None) -> None:
+            entries.setdefault(m.guid, IndexEntry(m.guid, kind, m, parent, m.label))
+            for child in m.generated:
+                add(child, "generated", m)
+
+        for m in measurements:
+            add(m, "measurement", folder_of.get(m.guid))
+        for m in backgrounds:
+            add(m, "background", folder_of.get(m.guid))
+        for node, parent in tree_nodes:
+            if node.guid is None or node.guid in entries:
+                continue
+            kind: EntryKind = "folder" if isinstance(node, TreeFolder) else "leaf"
+            entries[node.guid] = IndexEntry(node.guid, kind, node, parent, node.name)
+
+        self._entries = entries
+        ordered = sorted(entries.values(), key=lambda e: (e.label.casefold(), e.guid))
+        self._label_keys = [e.label.casefold() for e in ordered]
+        self._label_entries = ordered
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, guid: object) -> bool:
+        return guid in self._entries
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        return iter(self._entries.values())
+
+    def lookup(self, guid: str) -> IndexEntry:
+        """Return the entry for *guid*; raise :class:`MeasurementNotFoundError` if unknown."""
+        try:
+            return self._entries[guid]
+        except KeyError:
+            raise MeasurementNotFoundError(guid) from None
+
+    def find_by_label(self, pattern: str) -> list[IndexEntry]:
+        """Entries whose label matches *pattern*, case-insensitively, in label order.
+
+        Without wildcards the label must equal *pattern*. With ``*``, ``?``
+        or ``[...]`` it is a glob; the text before the first wildcard is
+        looked up by binary search, so prefix patterns like ``"Spectrum*"``
+        only examine labels that share the prefix.
+        """
+        key = pattern.casefold()
+        cut = min((i for i, c in enumerate(key) if c in _WILDCARDS), default=None)
+        prefix = key if cut is None else key[:cut]
+        lo = bisect.bisect_left(self._label_keys, prefix)
+        if cut is None:
+            hi = bisect.bisect_right(self._label_keys, prefix, lo)
+            return self._label_entries[lo:hi]
+        matches = []
+        for i in range(lo, len(self._label_keys)):
+            label = self._label_keys[i]
+            if not label.startswith(prefix):
+                break
+            if fnmatch.fnmatchcase(label, key):
+                matches.append(self._label_entries[i])
+        return matches
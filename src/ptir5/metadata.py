@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from typing import Any
 
 import numpy as np
 
+# Negative-cache marker for keys known to be absent.
+_MISSING: Any = object()
+
 
 def _convert_sequence(value: object) -> object:
     if isinstance(value, list):
@@ -39,21 +42,55 @@ class MetadataView(Mapping[str, Any]):
     Merges attributes from the group itself and any sub-groups
     (Channel, ParticleData, ROIData) into a flat namespace.
     Values are converted to Python-native types on first access.
+
+    Given a *load_key* callable, single-key lookups (``[]``, ``get``, ``in``)
+    read and convert only that attribute; everything is loaded only when the
+    view is iterated, sized or printed. *load_key* returns ``(found, value)``.
     """
 
-    __slots__ = ("_cache", "_load")
+    __slots__ = ("_cache", "_load", "_load_key", "_keys")
 
-    def __init__(self, load: Any) -> None:
+    def __init__(
+        self,
+        load: Callable[[], dict[str, Any]],
+        load_key: Callable[[str], tuple[bool, Any]] | None = None,
+    ) -> None:
         self._load = load
+        self._load_key = load_key
         self._cache: dict[str, Any] | None = None
+        self._keys: dict[str, Any] = {}
 
     def _ensure_loaded(self) -> dict[str, Any]:
         if self._cache is None:
             self._cache = self._load()
+            self._keys.clear()
         return self._cache
 
+    def _lookup(self, key: str) -> Any:
+        """Return the value for *key*, or ``_MISSING``, loading as little as possible."""
+        if self._cache is not None:
+            return self._cache.get(key, _MISSING)
+        if self._load_key is None:
+            return self._ensure_loaded().get(key, _MISSING)
+        try:
+            return self._keys[key]
+        except KeyError:
+            pass
+        found, value = self._load_key(key)
+        result = value if found else _MISSING
+        self._keys[key] = result
+        return result
+
+    def _prime(self, key: str, found: bool, value: Any) -> None:
+        """Seed the per-key cache with a value read elsewhere (batch reads)."""
+        if self._cache is None:
+            self._keys[key] = value if found else _MISSING
+
     def __getitem__(self, key: str) -> Any:
-        return self._ensure_loaded()[key]
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._ensure_loaded())
@@ -62,7 +99,9 @@ class MetadataView(Mapping[str, Any]):
         return len(self._ensure_loaded())
 
     def __contains__(self, key: object) -> bool:
-        return key in self._ensure_loaded()
+        if not isinstance(key, str):
+            return False
+        return self._lookup(key) is not _MISSING
 
     def __repr__(self) -> str:
         return f"MetadataView({dict(self._ensure_loaded())})"
@@ -13,15 +13,30 @@ Each base shape has concrete subclasses for each MeasurementType.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import math
+import os
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
+from ptir5._blocks import default_block_shape, iter_blocks, validate_block_shape
 from ptir5.enums import TYPE_TO_SHAPE, DataShape, MeasurementType, PixelFormat
+from ptir5.exceptions import PTIR5Error
+from ptir5.profiling import phase
+from ptir5.refs import MeasurementRef, _open_ref
+from ptir5.stats import cached_stats
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+    from pathlib import Path
+
     from ptir5._reader import HDF5Reader
     from ptir5.metadata import MetadataView
+    from ptir5.profiling import OpenProfiler
+    from ptir5.stats import MeasurementStats
+    from ptir5.storage import StorageInfo
 
 
 class Measurement:
@@ -89,6 +104,138 @@ class Measurement:
         """Read the DATA dataset. Not cached — assign to a variable to reuse."""
         return self._reader.read_dataset(f"{self._hdf5_path}/DATA")
 
+    def read(self, workers: int | None = None) -> np.ndarray[Any, Any]:
+        """Read DATA, optionally decoding compressed chunks on *workers* threads.
+
+        With *workers*, chunks are fetched raw and gzip/shuffle are undone in
+        a thread pool, which speeds up full reads of compressed data that
+        HDF5 would decode on a single thread. Datasets that are contiguous or
+        use other filters are read through HDF5 as usual. ``workers=None`` is
+        the same as :attr:`data`.
+        """
+        path = f"{self._hdf5_path}/DATA"
+        if workers is None:
+            return self._reader.read_dataset(path)
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        return self._reader.read_dataset_parallel(path, workers)
+
+    def iter_tiles(
+        self, tile_shape: tuple[int, ...] | None = None
+    ) -> Generator[tuple[tuple[slice, ...], np.ndarray[Any, Any]], None, None]:
+        """Iterate over DATA in tiles, yielding ``(slices, tile)`` pairs.
+
+        By default tiles follow the HDF5 chunk grid (whole planes for
+        contiguous data), so each tile touches only the chunks it covers.
+        ``data[slices]`` equals ``tile``.
+        """
+        path = f"{self._hdf5_path}/DATA"
+        shape = self._reader.dataset_shape(path)
+        if tile_shape is None:
+            tile_shape = default_block_shape(
+                shape,
+                self._reader.dataset_dtype(path).itemsize,
+                self._reader.dataset_chunks(path),
+            )
+        else:
+            validate_block_shape(tile_shape, shape)
+        for slices in iter_blocks(shape, tile_shape):
+            yield slices, self._reader.read_dataset_slice(path, slices)
+
+    def stats(
+        self,
+        bins: int = 64,
+        percentiles: tuple[float, ...] = (1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0),
+        cache: str | Path | bool | None = None,
+    ) -> MeasurementStats:
+        """Return min/max/mean/std, NaN counts, percentiles and a histogram of DATA.
+
+        DATA is read once, tile by tile. Hypercubes and image stacks also get
+        per-band or per-frame statistics in ``per_plane``. With ``cache=True``
+        the result is stored in a ``<file>.stats.json`` sidecar (or in the
+        directory *cache* names) and reused until the file changes.
+        """
+        return cached_stats(self, bins, tuple(percentiles), cache)
+
+    def fingerprint(
+        self, quick: bool = False, workers: int | None = None, cache: bool = True
+    ) -> str:
+        """Hex digest identifying this measurement's content.
+
+        Covers the type, metadata, dataset layouts and the stored bytes of
+        DATA, hashed as raw chunks where DATA is chunked (nothing is
+        decompressed) on *workers* threads. ``quick=True`` skips DATA's
+        bytes. Results are cached per file path, size and modification time.
+        See :mod:`ptir5.fingerprint`.
+        """
+        from ptir5.fingerprint import measurement_fingerprint
+
+        return measurement_fingerprint(self, quick=quick, workers=workers, cache=cache)
+
+    def storage_info(self, dataset: str = "DATA") -> StorageInfo:
+        """Describe how DATA (or another dataset of this group) is stored.
+
+        Returns the layout, chunk shape and count, filters, logical and
+        allocated bytes and, for contiguous data, the offset in the file.
+        Nothing is read beyond the dataset header.
+        """
+        return self._reader.dataset_storage(f"{self._hdf5_path}/{dataset}")
+
+    def ref(self) -> MeasurementRef:
+        """Return a picklable reference that reopens this measurement in another process.
+
+        Raises :class:`PTIR5Error` if the file was not opened from a path.
+        """
+        if not self._reader.reopenable:
+            raise PTIR5Error(
+                f"Measurement {self._guid} comes from {self._reader.path}, which was not "
+                "opened from a path; references and pickling need a file path"
+            )
+        data_path = f"{self._hdf5_path}/DATA"
+        shape: tuple[int, ...] | None = None
+        dtype: str | None = None
+        if self._reader.has_dataset(data_path):
+            shape = self._reader.dataset_shape(data_path)
+            dtype = self._reader.dataset_dtype(data_path).str
+        return MeasurementRef(
+            # Absolute, so workers started in another directory still find the file.
+            path=os.path.abspath(self._reader.path),
+            hdf5_path=self._hdf5_path,
+            guid=self._guid,
+            measurement_type=str(self._measurement_type),
+            shape=shape,
+            dtype=dtype,
+        )
+
+    def to_dask(self, chunks: Any = "auto") -> Any:
+        """Return DATA as a lazy ``dask.array.Array`` (requires the ``dask`` extra).
+
+        ``chunks="native"`` follows the HDF5 chunk grid exactly; ``"auto"``
+        sizes blocks in multiples of it. Tasks carry only a file path and
+        dataset path, so each worker process opens its own handle.
+        """
+        from ptir5._dask import to_dask
+
+        return to_dask(self, chunks)
+
+    def to_xarray(self, lazy: bool = True, dataset: bool = False) -> Any:
+        """Return DATA as an ``xarray.DataArray`` (requires the ``xarray`` extra).
+
+        Carries ``wavenumber``, ``x_um`` and ``y_um`` coordinates where the
+        metadata defines them, and all metadata as ``attrs``. With *lazy*,
+        nothing is read until values are needed, and selections such as
+        ``.sel(wavenumber=slice(1500, 1700))`` read only the planes they cover.
+        With *dataset*, returns an ``xarray.Dataset`` that also holds the
+        per-pixel or per-frame auxiliary datasets stored next to DATA.
+        """
+        from ptir5._xarray import to_xarray
+
+        return to_xarray(self, lazy=lazy, dataset=dataset)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle as a reference; the receiving process opens its own handle.
+        return (_open_ref, (self.ref(),))
+
     def __repr__(self) -> str:
         return (
             f"<{type(self).__name__} guid={self._guid!r} "
@@ -96,6 +243,205 @@ class Measurement:
         )
 
 
+# ---------------------------------------------------------------------------
+# Wavenumber selection
+# ---------------------------------------------------------------------------
+
+# Tolerance, in index units, for wavenumbers that land on a grid point.
+_AXIS_EPS = 1e-9
+
+
+def _axis_position(m: FloatSpectrum1D | FloatHypercube3D, wavenumber: float) -> float:
+    """Fractional index of *wavenumber* on the uniform axis of *m*."""
+    if m.x_increment == 0:
+        raise ValueError(f"Measurement {m.guid} has a zero XIncrement")
+    return (wavenumber - m.x_start) / m.x_increment
+
+
+def _wavenumber_slice(
+    m: FloatSpectrum1D | FloatHypercube3D, start: float | None, stop: float | None
+) -> slice:
+    """Index range of the points with wavenumbers in [start, stop] (either order)."""
+    lo = -math.inf if start is None else start
+    hi = math.inf if stop is None else stop
+    if start is not None and stop is not None and lo > hi:
+        lo, hi = hi, lo
+    n = m.num_points
+    bounds = [_axis_position(m, w) if math.isfinite(w) else None for w in (lo, hi)]
+    if m.x_increment < 0:
+        bounds.reverse()
+    first = 0 if bounds[0] is None else max(0, math.ceil(bounds[0] - _AXIS_EPS))
+    last = n - 1 if bounds[1] is None else min(n - 1, math.floor(bounds[1] + _AXIS_EPS))
+    return slice(first, last + 1) if first <= last else slice(0, 0)
+
+
+def _sel_wavenumber(
+    m: FloatSpectrum1D | FloatHypercube3D,
+    wavenumber: float | slice,
+    method: Literal["nearest", "linear"],
+) -> np.ndarray[Any, Any]:
+    path = f"{m._hdf5_path}/DATA"
+    rest = (slice(None),) * (len(m._reader.dataset_shape(path)) - 1)
+    if isinstance(wavenumber, slice):
+        if wavenumber.step is not None:
+            raise ValueError("Wavenumber slices do not take a step")
+        index = _wavenumber_slice(m, wavenumber.start, wavenumber.stop)
+        return m._reader.read_dataset_slice(path, (index, *rest))
+    n = m.num_points
+    pos = _axis_position(m, float(wavenumber))
+    if method == "nearest":
+        if not -0.5 <= pos < n - 0.5:
+            raise ValueError(f"Wavenumber {wavenumber} is outside the axis of {m.guid}")
+        return m._reader.read_dataset_slice(path, (min(n - 1, round(pos)), *rest))
+    if method != "linear":
+        raise ValueError(f"method must be 'nearest' or 'linear', got {method!r}")
+    if not -_AXIS_EPS <= pos <= n - 1 + _AXIS_EPS:
+        raise ValueError(f"Wavenumber {wavenumber} is outside the axis of {m.guid}")
+    i0 = min(n - 1, max(0, math.floor(pos)))
+    frac = pos - i0
+    if frac <= _AXIS_EPS or i0 == n - 1:
+        return m._reader.read_dataset_slice(path, (i0, *rest))
+    pair = m._reader.read_dataset_slice(path, (slice(i0, i0 + 2), *rest))
+    result: np.ndarray[Any, Any] = pair[0] + frac * (pair[1] - pair[0])
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Regions of interest
+# ---------------------------------------------------------------------------
+
+def _pixel_window(
+    m: FloatImage2D | ByteImage2D | FloatHypercube3D | ByteImageStack3D,
+    x: int, y: int, width: int, height: int,
+) -> tuple[slice, slice]:
+    """Row and column slices of a pixel window, clipped to the image."""
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Region size must be positive, got {width}x{height}")
+    rows = slice(max(0, y), min(m.pixel_height, y + height))
+    cols = slice(max(0, x), min(m.pixel_width, x + width))
+    if rows.start >= rows.stop or cols.start >= cols.stop:
+        raise ValueError(
+            f"Region ({x}, {y}, {width}, {height}) lies outside the "
+            f"{m.pixel_width}x{m.pixel_height} image of {m.guid}"
+        )
+    return rows, cols
+
+
+def _physical_window(
+    m: FloatImage2D | ByteImage2D | FloatHypercube3D | ByteImageStack3D,
+    x_um: float, y_um: float, w_um: float, h_um: float,
+) -> tuple[slice, slice]:
+    """Pixels covering [x_um, x_um + w_um) x [y_um, y_um + h_um), from the image's top-left."""
+    if m.image_width_um <= 0 or m.image_height_um <= 0:
+        raise ValueError(f"Measurement {m.guid} has no physical image size")
+    if w_um <= 0 or h_um <= 0:
+        raise ValueError(f"Region size must be positive, got {w_um}x{h_um} um")
+    sx = m.image_width_um / m.pixel_width
+    sy = m.image_height_um / m.pixel_height
+    # Every pixel the window overlaps, tolerating edges that land on a pixel boundary.
+    x0 = math.floor(x_um / sx + _AXIS_EPS)
+    y0 = math.floor(y_um / sy + _AXIS_EPS)
+    x1 = math.ceil((x_um + w_um) / sx - _AXIS_EPS)
+    y1 = math.ceil((y_um + h_um) / sy - _AXIS_EPS)
+    return _pixel_window(m, x0, y0, max(1, x1 - x0), max(1, y1 - y0))
+
+
+def _read_window(
+    m: FloatImage2D | ByteImage2D | FloatHypercube3D | ByteImageStack3D,
+    window: tuple[slice, slice],
+    axis: int,
+) -> np.ndarray[Any, Any]:
+    """Read *window* over the (height, width) axes starting at *axis* of DATA."""
+    path = f"{m._hdf5_path}/DATA"
+    ndim = len(m._reader.dataset_shape(path))
+    selection = (slice(None),) * axis + window + (slice(None),) * (ndim - axis - 2)
+    return m._reader.read_dataset_slice(path, selection)
+
+
+# ---------------------------------------------------------------------------
+# Frame iteration
+# ---------------------------------------------------------------------------
+
+_DONE = object()
+
+
+def _iter_frames(
+    m: FloatHypercube3D | ByteImageStack3D,
+    start: int,
+    stop: int | None,
+    step: int,
+    prefetch: int,
+) -> Iterator[tuple[int, np.ndarray[Any, Any]]]:
+    """Iterate ``(index, frame)`` along axis 0 of DATA, reading ahead on a thread.
+
+    A producer thread fills a ring of ``prefetch + 1`` reused buffers. It
+    takes a buffer from ``free`` before each read, so it is never more than
+    *prefetch* frames ahead of the consumer, which hands its previous buffer
+    back when it asks for the next frame.
+    """
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be at least 0, got {prefetch}")
+    path = f"{m._hdf5_path}/DATA"
+    shape = m._reader.dataset_shape(path)
+    indices = range(*slice(start, stop, step).indices(shape[0]))
+    return _prefetch_frames(m, path, shape, indices, prefetch)
+
+
+def _prefetch_frames(
+    m: FloatHypercube3D | ByteImageStack3D,
+    path: str,
+    shape: tuple[int, ...],
+    indices: range,
+    prefetch: int,
+) -> Iterator[tuple[int, np.ndarray[Any, Any]]]:
+    rest = (slice(None),) * (len(shape) - 1)
+    if prefetch == 0:
+        for i in indices:
+            yield i, m._reader.read_dataset_slice(path, (i, *rest))
+        return
+
+    dtype = m._reader.dataset_dtype(path)
+    buffers = [np.empty(shape[1:], dtype=dtype) for _ in range(prefetch + 1)]
+    free: queue.SimpleQueue[int | None] = queue.SimpleQueue()
+    ready: queue.SimpleQueue[Any] = queue.SimpleQueue()
+    for b in range(len(buffers)):
+        free.put(b)
+    stop_event = threading.Event()
+
+    def produce() -> None:
+        try:
+            for i in indices:
+                b = free.get()
+                if b is None or stop_event.is_set():
+                    return
+                m._reader.read_dataset_slice_into(path, (i, *rest), buffers[b])
+                ready.put((i, b))
+        except BaseException as exc:
+            ready.put(exc)
+            return
+        ready.put(_DONE)
+
+    worker = threading.Thread(target=produce, name="ptir5-prefetch", daemon=True)
+    worker.start()
+    held: int | None = None
+    try:
+        while True:
+            item = ready.get()
+            if held is not None:
+                free.put(held)
+                held = None
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            i, held = item
+            yield i, buffers[held]
+    finally:
+        stop_event.set()
+        free.put(None)
+        worker.join()
+
+
 # ---------------------------------------------------------------------------
 # Base shape classes
 # ---------------------------------------------------------------------------
@@ -121,6 +467,24 @@ class FloatSpectrum1D(Measurement):
         """Computed x-axis values: x_start + i * x_increment."""
         return np.arange(self.num_points, dtype=np.float64) * self.x_increment + self.x_start
 
+    def wavenumber_slice(self, start: float | None, stop: float | None) -> slice:
+        """Index slice of the points whose wavenumber lies in [start, stop]."""
+        return _wavenumber_slice(self, start, stop)
+
+    def sel(
+        self,
+        wavenumber: float | slice,
+        method: Literal["nearest", "linear"] = "nearest",
+    ) -> np.ndarray[Any, Any]:
+        """Select by wavenumber (cm⁻¹) instead of index, reading only what is needed.
+
+        A number returns the value at the nearest point, or with
+        ``method="linear"`` one interpolated between its two neighbours. A
+        slice returns every point in the closed range, in file order; either
+        bound may be None. Numbers outside the axis raise ``ValueError``.
+        """
+        return _sel_wavenumber(self, wavenumber, method)
+
 
 class FloatImage2D(Measurement):
     """2D float image — shape (height, width), dtype float32."""
@@ -141,6 +505,20 @@ class FloatImage2D(Measurement):
     def image_height_um(self) -> float:
         return float(self._metadata.get("ImageHeight", 0.0))
 
+    def read_region(
+        self, x_um: float, y_um: float, w_um: float, h_um: float
+    ) -> np.ndarray[Any, Any]:
+        """Read the pixels covering a window in microns from the top-left corner.
+
+        Returns shape (h, w), reading only the window. Parts of the
+        window outside the image are clipped.
+        """
+        return _read_window(self, _physical_window(self, x_um, y_um, w_um, h_um), 0)
+
+    def read_region_px(self, x: int, y: int, width: int, height: int) -> np.ndarray[Any, Any]:
+        """Pixel-space :meth:`read_region`: columns x..x+width, rows y..y+height."""
+        return _read_window(self, _pixel_window(self, x, y, width, height), 0)
+
 
 class ByteImage2D(Measurement):
     """2D byte image — shape (height, width, bpp), dtype uint8."""
@@ -173,6 +551,20 @@ class ByteImage2D(Measurement):
     def image_height_um(self) -> float:
         return float(self._metadata.get("ImageHeight", 0.0))
 
+    def read_region(
+        self, x_um: float, y_um: float, w_um: float, h_um: float
+    ) -> np.ndarray[Any, Any]:
+        """Read the pixels covering a window in microns from the top-left corner.
+
+        Returns shape (h, w, bpp), reading only the window. Parts of the
+        window outside the image are clipped.
+        """
+        return _read_window(self, _physical_window(self, x_um, y_um, w_um, h_um), 0)
+
+    def read_region_px(self, x: int, y: int, width: int, height: int) -> np.ndarray[Any, Any]:
+        """Pixel-space :meth:`read_region`: columns x..x+width, rows y..y+height."""
+        return _read_window(self, _pixel_window(self, x, y, width, height), 0)
+
 
 class FloatHypercube3D(Measurement):
     """3D float hypercube — shape (points, height, width), dtype float32."""
@@ -197,6 +589,20 @@ class FloatHypercube3D(Measurement):
     def image_height_um(self) -> float:
         return float(self._metadata.get("ImageHeight", 0.0))
 
+    def read_region(
+        self, x_um: float, y_um: float, w_um: float, h_um: float
+    ) -> np.ndarray[Any, Any]:
+        """Read the pixels covering a window in microns from the top-left corner.
+
+        Returns shape (points, h, w), reading only the window. Parts of the
+        window outside the image are clipped.
+        """
+        return _read_window(self, _physical_window(self, x_um, y_um, w_um, h_um), 1)
+
+    def read_region_px(self, x: int, y: int, width: int, height: int) -> np.ndarray[Any, Any]:
+        """Pixel-space :meth:`read_region`: columns x..x+width, rows y..y+height."""
+        return _read_window(self, _pixel_window(self, x, y, width, height), 1)
+
     @property
     def x_start(self) -> float:
         return float(self._metadata.get("XStart", 0.0))
@@ -222,6 +628,37 @@ class FloatHypercube3D(Measurement):
             f"{self._hdf5_path}/DATA", (index, slice(None), slice(None))
         )
 
+    def wavenumber_slice(self, start: float | None, stop: float | None) -> slice:
+        """Index slice of the planes whose wavenumber lies in [start, stop]."""
+        return _wavenumber_slice(self, start, stop)
+
+    def sel(
+        self,
+        wavenumber: float | slice,
+        method: Literal["nearest", "linear"] = "nearest",
+    ) -> np.ndarray[Any, Any]:
+        """Select planes by wavenumber (cm⁻¹), reading only the planes covered.
+
+        A number returns the nearest ``(height, width)`` plane, or with
+        ``method="linear"`` one interpolated from the two neighbouring planes.
+        A slice returns the ``(k, height, width)`` block of planes in the
+        closed range, in file order; either bound may be None. Numbers
+        outside the axis raise ``ValueError``.
+        """
+        return _sel_wavenumber(self, wavenumber, method)
+
+    def iter_frames(
+        self, start: int = 0, stop: int | None = None, step: int = 1, prefetch: int = 2
+    ) -> Iterator[tuple[int, np.ndarray[Any, Any]]]:
+        """Iterate over planes ``start:stop:step``, yielding ``(index, plane)`` pairs.
+
+        Up to *prefetch* planes are read ahead on a background thread into a
+        ring of reused buffers, so each yielded array is only valid until
+        the next one is requested; copy it to keep it. Closing the iterator
+        early stops the thread. ``prefetch=0`` reads on the calling thread.
+        """
+        return _iter_frames(self, start, stop, step, prefetch)
+
 
 class ByteImageStack3D(Measurement):
     """3D byte image stack — shape (images, height, width, bpp), dtype uint8."""
@@ -258,6 +695,20 @@ class ByteImageStack3D(Measurement):
     def image_height_um(self) -> float:
         return float(self._metadata.get("ImageHeight", 0.0))
 
+    def read_region(
+        self, x_um: float, y_um: float, w_um: float, h_um: float
+    ) -> np.ndarray[Any, Any]:
+        """Read the pixels covering a window in microns from the top-left corner.
+
+        Returns shape (images, h, w, bpp), reading only the window. Parts of the
+        window outside the image are clipped.
+        """
+        return _read_window(self, _physical_window(self, x_um, y_um, w_um, h_um), 1)
+
+    def read_region_px(self, x: int, y: int, width: int, height: int) -> np.ndarray[Any, Any]:
+        """Pixel-space :meth:`read_region`: columns x..x+width, rows y..y+height."""
+        return _read_window(self, _pixel_window(self, x, y, width, height), 1)
+
     def read_image(self, index: int) -> np.ndarray[Any, Any]:
         """Extract image at stack index. Returns shape (height, width, bpp)."""
         return self._reader.read_dataset_slice(
@@ -265,6 +716,18 @@ class ByteImageStack3D(Measurement):
             (index, slice(None), slice(None), slice(None)),
         )
 
+    def iter_frames(
+        self, start: int = 0, stop: int | None = None, step: int = 1, prefetch: int = 2
+    ) -> Iterator[tuple[int, np.ndarray[Any, Any]]]:
+        """Iterate over frames ``start:stop:step``, yielding ``(index, frame)`` pairs.
+
+        Up to *prefetch* frames are read ahead on a background thread into a
+        ring of reused buffers, so each yielded array is only valid until
+        the next one is requested; copy it to keep it. Closing the iterator
+        early stops the thread. ``prefetch=0`` reads on the calling thread.
+        """
+        return _iter_frames(self, start, stop, step, prefetch)
+
 
 # ---------------------------------------------------------------------------
 # Concrete type classes (16 types)
@@ -341,8 +804,28 @@ def build_measurement(
     reader: HDF5Reader,
     hdf5_path: str,
     guid: str,
+    profiler: OpenProfiler | None = None,
+    phase_name: str = "construct",
+) -> Measurement:
+    """Construct a typed Measurement from an HDF5 group path.
+
+    With a *profiler*, the construction is timed under *phase_name* and
+    GENERATED children under ``"generated"``.
+    """
+    if profiler is None:
+        return _build_measurement(reader, hdf5_path, guid, None)
+    with profiler.measurement(guid, hdf5_path, "construct"), profiler.phase(phase_name):
+        m = _build_measurement(reader, hdf5_path, guid, profiler)
+    profiler.set_type(hdf5_path, str(m.measurement_type))
+    return m
+
+
+def _build_measurement(
+    reader: HDF5Reader,
+    hdf5_path: str,
+    guid: str,
+    profiler: OpenProfiler | None,
 ) -> Measurement:
-    """Construct a typed Measurement from an HDF5 group path."""
     type_str = reader.read_type(hdf5_path)
     metadata = reader.build_metadata_view(hdf5_path)
 
@@ -366,13 +849,16 @@ def build_measurement(
         mt = type_str  # type: ignore[assignment]
 
     # Build GENERATED children
-    generated_guids = reader.list_generated_guids(hdf5_path)
+    with phase(profiler, "generated"):
+        generated_guids = reader.list_generated_guids(hdf5_path)
     generated: tuple[Measurement, ...] = ()
     if generated_guids:
         gen_list: list[Measurement] = []
         for gen_guid in generated_guids:
             gen_path = f"{hdf5_path}/GENERATED/{gen_guid}"
-            gen_list.append(build_measurement(reader, gen_path, gen_guid))
+            gen_list.append(
+                build_measurement(reader, gen_path, gen_guid, profiler, "generated")
+            )
         generated = tuple(gen_list)
 
     return cls(
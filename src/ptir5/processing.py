@@ -0,0 +1,280 @@
+"""Spectral processing on measurement data.
+
+:func:`resample` interpolates spectra and hypercubes onto a common
+wavenumber grid, and :func:`spectra_matrix` assembles many spectra into one
+``(n, points)`` array, reading each spectrum directly into its row.
+
+PTIR5 spectral axes are uniform (``XStart`` plus ``i * XIncrement``), so the
+linear-interpolation matrix from an axis to the grid has at most two non-zero
+weights per grid point. It is stored as a pair of index and weight vectors,
+built once per distinct axis, and applied to a whole group of spectra in one
+vectorized product.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from ptir5._blocks import default_block_shape, iter_blocks
+from ptir5.models import FloatHypercube3D, FloatSpectrum1D
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import ArrayLike
+
+    from ptir5.models import Measurement
+
+_Axis = tuple[float, float, int]
+
+
+@dataclass(frozen=True)
+class _Weights:
+    """Sparse linear-interpolation matrix from one axis onto the grid.
+
+    Grid point ``j`` is ``w0[j] * src[i0[j]] + w1[j] * src[i1[j]]``. Where
+    ``w1`` is zero, ``i1 == i0`` so neighbouring NaNs do not leak in.
+    """
+
+    i0: np.ndarray[Any, np.dtype[np.intp]]
+    i1: np.ndarray[Any, np.dtype[np.intp]]
+    w0: np.ndarray[Any, np.dtype[np.float64]]
+    w1: np.ndarray[Any, np.dtype[np.float64]]
+    valid: np.ndarray[Any, np.dtype[np.bool_]]
+
+    @classmethod
+    def build(cls, axis: _Axis, grid: np.ndarray[Any, np.dtype[np.float64]]) -> _Weights:
+        start, step, n = axis
+        pos = (grid - start) / step if step else np.full(grid.shape, np.nan)
+        # Tolerate rounding at the axis ends.
+        eps = 1e-9 * max(n, 1)
+        valid = (pos >= -eps) & (pos <= n - 1 + eps)
+        pos = np.clip(np.where(valid, pos, 0.0), 0, max(n - 1, 0))
+        i0 = np.floor(pos).astype(np.intp)
+        frac = pos - i0
+        i0 = np.minimum(i0, max(n - 1, 0))
+        i1 = np.minimum(i0 + 1, max(n - 1, 0))
+        w1 = np.where(valid, frac, 0.0)
+        w1[i1 == i0] = 0.0
+        i1 = np.where(w1 == 0.0, i0, i1)
+        w0 = np.where(valid, 1.0 - w1, 0.0)
+        return cls(i0, i1, w0, w1, valid)
+
+    def apply(self, rows: np.ndarray[Any, Any], fill: float) -> np.ndarray[Any, Any]:
+        """Resample a ``(n, points)`` matrix to ``(n, len(grid))``."""
+        dtype = np.result_type(rows.dtype, np.float32)
+        out: np.ndarray[Any, Any] = rows[:, self.i0] * self.w0.astype(dtype)
+        out += rows[:, self.i1] * self.w1.astype(dtype)
+        out[:, ~self.valid] = fill
+        return out
+
+
+class SpectraMatrix(NamedTuple):
+    """Spectra stacked as rows: ``data[i]`` is spectrum ``guids[i]`` sampled at ``x``."""
+
+    data: np.ndarray[Any, Any]
+    x: np.ndarray[Any, np.dtype[np.float64]]
+    guids: list[str]
+
+
+def _axis(m: FloatSpectrum1D | FloatHypercube3D) -> _Axis:
+    return (m.x_start, m.x_increment, m.num_points)
+
+
+def _axis_values(axis: _Axis) -> np.ndarray[Any, np.dtype[np.float64]]:
+    start, step, n = axis
+    return start + step * np.arange(n, dtype=np.float64)
+
+
+def _data_dtype(m: Measurement) -> np.dtype[Any]:
+    return np.result_type(m._reader.dataset_dtype(f"{m._hdf5_path}/DATA"), np.float32)
+
+
+def _read_rows(
+    spectra: list[FloatSpectrum1D], out: np.ndarray[Any, Any], offset: int = 0
+) -> None:
+    """Read each spectrum's DATA straight into row ``i`` of *out*, from column *offset*."""
+    for row, m in enumerate(spectra):
+        dest = (row, slice(offset, offset + m.num_points))
+        m._reader.read_dataset_into(f"{m._hdf5_path}/DATA", out, dest)
+
+
+def _resample_cube(
+    m: FloatHypercube3D, weights: _Weights, fill: float
+) -> np.ndarray[Any, Any]:
+    """Stream *m* plane block by plane block into a ``(len(grid), h, w)`` cube."""
+    path = f"{m._hdf5_path}/DATA"
+    reader = m._reader
+    shape = reader.dataset_shape(path)
+    dtype = np.result_type(reader.dataset_dtype(path), np.float32)
+    out = np.zeros((len(weights.valid), *shape[1:]), dtype=dtype)
+    if weights.valid.any():
+        used = np.concatenate([weights.i0[weights.valid], weights.i1[weights.valid]])
+        lo, hi = int(used.min()), int(used.max()) + 1
+        block = default_block_shape(
+            shape, reader.dataset_dtype(path).itemsize, reader.dataset_chunks(path)
+        )
+        # Only the plane range [lo, hi) is read.
+        for rel in iter_blocks((hi - lo, *shape[1:]), block):
+            a, b = rel[0].start + lo, rel[0].stop + lo
+            slices = (slice(a, b), *rel[1:])
+            tile = reader.read_dataset_slice(path, slices)
+            for idx, w in ((weights.i0, weights.w0), (weights.i1, weights.w1)):
+                sel = np.nonzero((idx >= a) & (idx < b) & (w != 0.0))[0]
+                if sel.size:
+                    contrib = tile[idx[sel] - a] * w[sel, None, None].astype(dtype)
+                    target: tuple[Any, ...] = (sel, *slices[1:])
+                    out[target] += contrib
+    out[~weights.valid] = fill
+    return out
+
+
+def resample(
+    measurements: Iterable[Measurement],
+    grid: ArrayLike,
+    *,
+    fill: float = np.nan,
+) -> list[np.ndarray[Any, Any]]:
+    """Linearly interpolate spectra and hypercubes onto a common wavenumber *grid*.
+
+    Returns one array per input measurement, in order: ``(len(grid),)`` for
+    spectra and ``(len(grid), height, width)`` for hypercubes. Grid points
+    outside a measurement's axis are set to *fill*.
+
+    Spectra that share an axis (``x_start``, ``x_increment``, ``num_points``)
+    are resampled together; each distinct axis's weights are computed once.
+    Hypercubes are read in plane blocks, skipping planes the grid does not
+    need.
+    """
+    grid_arr = np.asarray(grid, dtype=np.float64)
+    if grid_arr.ndim != 1:
+        raise ValueError(f"grid must be one-dimensional, got shape {grid_arr.shape}")
+    items: list[FloatSpectrum1D | FloatHypercube3D] = []
+    for m in measurements:
+        if not isinstance(m, FloatSpectrum1D | FloatHypercube3D):
+            raise TypeError(
+                f"resample() needs spectra or hypercubes, got {type(m).__name__} ({m.guid})"
+            )
+        items.append(m)
+
+    weights: dict[_Axis, _Weights] = {}
+
+    def weights_for(axis: _Axis) -> _Weights:
+        w = weights.get(axis)
+        if w is None:
+            w = weights[axis] = _Weights.build(axis, grid_arr)
+        return w
+
+    results: list[np.ndarray[Any, Any] | None] = [None] * len(items)
+    groups: dict[_Axis, list[tuple[int, FloatSpectrum1D]]] = {}
+    for i, item in enumerate(items):
+        if isinstance(item, FloatHypercube3D):
+            results[i] = _resample_cube(item, weights_for(_axis(item)), fill)
+        else:
+            groups.setdefault(_axis(item), []).append((i, item))
+
+    for axis, members in groups.items():
+        group = [m for _, m in members]
+        rows = np.empty((len(group), axis[2]), dtype=_data_dtype(group[0]))
+        _read_rows(group, rows)
+        resampled = weights_for(axis).apply(rows, fill)
+        for row, (i, _) in enumerate(members):
+            results[i] = resampled[row]
+
+    return [r for r in results if r is not None]
+
+
+def _describe_axes(groups: dict[_Axis, list[str]]) -> str:
+    return "; ".join(
+        f"{len(guids)} spectra at x_start={a[0]:g}, x_increment={a[1]:g}, {a[2]} points "
+        f"(e.g. {guids[0]})"
+        for a, guids in groups.items()
+    )
+
+
+def spectra_matrix(
+    spectra: Iterable[Measurement],
+    align: str = "exact",
+    *,
+    grid: ArrayLike | None = None,
+    fill: float = np.nan,
+) -> SpectraMatrix:
+    """Stack spectra into one preallocated ``(n, points)`` array.
+
+    *align* controls spectra whose axes differ:
+
+    - ``"exact"``: every spectrum must share one axis, otherwise
+      ``ValueError`` lists the distinct axes and an example GUID for each.
+    - ``"pad"``: spectra must share ``x_increment`` and start on the same
+      sample grid; rows are placed on the union axis and padded with *fill*.
+    - ``"resample"``: spectra are interpolated onto *grid* (default: the
+      first spectrum's axis) as in :func:`resample`.
+    """
+    items: list[FloatSpectrum1D] = []
+    for m in spectra:
+        if not isinstance(m, FloatSpectrum1D):
+            raise TypeError(f"{m.guid} is a {type(m).__name__}, not a spectrum")
+        items.append(m)
+    guids = [m.guid for m in items]
+    if not items:
+        return SpectraMatrix(np.empty((0, 0), dtype=np.float32), np.empty(0), guids)
+
+    by_axis: dict[_Axis, list[str]] = {}
+    for m in items:
+        by_axis.setdefault(_axis(m), []).append(m.guid)
+    dtype = np.result_type(*(_data_dtype(m) for m in items))
+
+    if align == "exact":
+        if len(by_axis) > 1:
+            raise ValueError(
+                f"spectra do not share an axis: {_describe_axes(by_axis)}; "
+                "use align='pad' or align='resample'"
+            )
+        axis = next(iter(by_axis))
+        data = np.empty((len(items), axis[2]), dtype=dtype)
+        _read_rows(items, data)
+        return SpectraMatrix(data, _axis_values(axis), guids)
+
+    if align == "pad":
+        steps = {a[1] for a in by_axis}
+        if len(steps) > 1:
+            raise ValueError(
+                f"align='pad' needs a common x_increment: {_describe_axes(by_axis)}"
+            )
+        step = steps.pop() or 1.0
+        start = min(a[0] for a in by_axis) if step > 0 else max(a[0] for a in by_axis)
+        offsets: dict[_Axis, int] = {}
+        for a in by_axis:
+            off = (a[0] - start) / step
+            if abs(off - round(off)) > 1e-3:
+                raise ValueError(
+                    f"align='pad' needs starts on a common sample grid: {_describe_axes(by_axis)}"
+                )
+            offsets[a] = round(off)
+        width = max(offsets[a] + a[2] for a in by_axis)
+        data = np.full((len(items), width), fill, dtype=dtype)
+        for row, m in enumerate(items):
+            dest = (row, slice(offsets[_axis(m)], offsets[_axis(m)] + m.num_points))
+            m._reader.read_dataset_into(f"{m._hdf5_path}/DATA", data, dest)
+        return SpectraMatrix(data, _axis_values((start, step, width)), guids)
+
+    if align == "resample":
+        grid_arr = (
+            _axis_values(_axis(items[0]))
+            if grid is None
+            else np.asarray(grid, dtype=np.float64)
+        )
+        data = np.empty((len(items), len(grid_arr)), dtype=dtype)
+        rows_for: dict[_Axis, list[int]] = {}
+        for row, m in enumerate(items):
+            rows_for.setdefault(_axis(m), []).append(row)
+        for axis, rows in rows_for.items():
+            src = np.empty((len(rows), axis[2]), dtype=dtype)
+            _read_rows([items[r] for r in rows], src)
+            data[rows] = _Weights.build(axis, grid_arr).apply(src, fill)
+        return SpectraMatrix(data, grid_arr, guids)
+
+    raise ValueError(f"align must be 'exact', 'pad' or 'resample', got {align!r}")
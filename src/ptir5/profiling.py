@@ -0,0 +1,219 @@
+"""Phase-by-phase profiling of file opening and traversal.
+
+``ptir5.profile_open(path)`` (or ``ptir5.open(path, profile=True)``) loads
+the whole file structure eagerly and reports where the time went: GUID
+listing, measurement construction per type, GENERATED children, backgrounds,
+tree NODES decoding and tree building, and metadata loading. HDF5 operations
+are counted per phase through the :mod:`ptir5.tracing` hooks.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ptir5.tracing import add_io_hook, remove_io_hook
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+    from ptir5.tracing import IOEvent
+
+
+@dataclass
+class PhaseStats:
+    """Exclusive time and HDF5 operation counts for one phase."""
+
+    seconds: float = 0.0
+    calls: int = 0
+    hdf5_ops: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def hdf5_total(self) -> int:
+        return sum(self.hdf5_ops.values())
+
+
+@dataclass
+class MeasurementTiming:
+    """Construction and metadata-load cost of one measurement (GENERATED children included)."""
+
+    guid: str
+    measurement_type: str
+    hdf5_path: str
+    construct_s: float = 0.0
+    metadata_s: float = 0.0
+    hdf5_ops: int = 0
+
+    @property
+    def total_s(self) -> float:
+        return self.construct_s + self.metadata_s
+
+
+@dataclass
+class ProfileReport:
+    """Structured result of :func:`profile_open`."""
+
+    path: str
+    total_s: float
+    phases: dict[str, PhaseStats]
+    measurements: list[MeasurementTiming]
+
+    def by_type(self) -> dict[str, dict[str, float]]:
+        """Count and total construction seconds per measurement type.
+
+        A measurement's construction time includes its GENERATED children.
+        """
+        out: dict[str, dict[str, float]] = {}
+        for m in self.measurements:
+            s = out.setdefault(m.measurement_type, {"count": 0, "construct_s": 0.0})
+            s["count"] += 1
+            s["construct_s"] += m.construct_s
+        return out
+
+    def slowest(self, n: int = 10) -> list[MeasurementTiming]:
+        return sorted(self.measurements, key=lambda m: m.total_s, reverse=True)[:n]
+
+    def to_dict(self, top: int = 10) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "total_s": self.total_s,
+            "phases": {
+                name: {"seconds": p.seconds, "calls": p.calls, "hdf5_ops": dict(p.hdf5_ops)}
+                for name, p in self.phases.items()
+            },
+            "by_type": self.by_type(),
+            "slowest": [
+                {
+                    "guid": m.guid,
+                    "type": m.measurement_type,
+                    "hdf5_path": m.hdf5_path,
+                    "construct_s": m.construct_s,
+                    "metadata_s": m.metadata_s,
+                    "hdf5_ops": m.hdf5_ops,
+                }
+                for m in self.slowest(top)
+            ],
+        }
+
+    def format(self, top: int = 10) -> str:
+        """Human-readable table of phases, types and the slowest measurements."""
+        lines = [f"Profile of {self.path}: {self.total_s * 1e3:.1f} ms total", ""]
+        lines.append(f"{'phase':<16}{'ms':>10}{'calls':>8}{'hdf5 ops':>10}")
+        for name, p in self.phases.items():
+            lines.append(f"{name:<16}{p.seconds * 1e3:>10.2f}{p.calls:>8}{p.hdf5_total:>10}")
+        lines += ["", f"{'type':<24}{'count':>8}{'ms':>10}"]
+        for type_, s in sorted(self.by_type().items()):
+            lines.append(f"{type_:<24}{int(s['count']):>8}{s['construct_s'] * 1e3:>10.2f}")
+        lines += ["", f"{'slowest measurements':<40}{'type':<22}{'ms':>8}{'ops':>6}"]
+        for m in self.slowest(top):
+            lines.append(
+                f"{m.guid:<40}{m.measurement_type:<22}{m.total_s * 1e3:>8.2f}{m.hdf5_ops:>6}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class OpenProfiler:
+    """Collects phase timings while a :class:`~ptir5.PTIR5File` loads.
+
+    Phases nest; each phase's ``seconds`` excludes time spent in nested
+    phases, so the phase totals add up to the profiled wall time.
+    """
+
+    __slots__ = ("_phases", "_stack", "_nested", "_measurements", "_ops", "_t0")
+
+    def __init__(self) -> None:
+        self._phases: dict[str, PhaseStats] = {}
+        self._stack: list[str] = []
+        # Time spent in nested phases, per entry of _stack.
+        self._nested: list[float] = []
+        self._measurements: dict[str, MeasurementTiming] = {}
+        self._ops = 0
+        self._t0 = time.perf_counter()
+
+    def _on_event(self, event: IOEvent) -> None:
+        self._ops += 1
+        if self._stack:
+            self._phases[self._stack[-1]].hdf5_ops[event.op] += 1
+
+    @contextmanager
+    def collecting(self) -> Iterator[OpenProfiler]:
+        add_io_hook(self._on_event)
+        try:
+            yield self
+        finally:
+            remove_io_hook(self._on_event)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        stats = self._phases.setdefault(name, PhaseStats())
+        stats.calls += 1
+        self._stack.append(name)
+        self._nested.append(0.0)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._stack.pop()
+            stats.seconds += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    @contextmanager
+    def measurement(self, guid: str, hdf5_path: str, kind: str) -> Iterator[None]:
+        """Attribute the enclosed construction or metadata load to one measurement."""
+        timing = self._measurements.get(hdf5_path)
+        if timing is None:
+            timing = MeasurementTiming(guid, "", hdf5_path)
+            self._measurements[hdf5_path] = timing
+        ops0 = self._ops
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            timing.hdf5_ops += self._ops - ops0
+            if kind == "metadata":
+                timing.metadata_s += elapsed
+            else:
+                timing.construct_s += elapsed
+
+    def set_type(self, hdf5_path: str, measurement_type: str) -> None:
+        timing = self._measurements.get(hdf5_path)
+        if timing is not None:
+            timing.measurement_type = measurement_type
+
+    def report(self, path: str) -> ProfileReport:
+        return ProfileReport(
+            path=path,
+            total_s=time.perf_counter() - self._t0,
+            phases=dict(self._phases),
+            measurements=list(self._measurements.values()),
+        )
+
+
+def phase(profiler: OpenProfiler | None, name: str) -> AbstractContextManager[None]:
+    """``profiler.phase(name)``, or a no-op context when not profiling."""
+    return nullcontext() if profiler is None else profiler.phase(name)
+
+
+def profile_open(path: str | Path) -> ProfileReport:
+    """Open *path*, load its whole structure, and return a :class:`ProfileReport`.
+
+    The file is closed before returning. Use ``ptir5.open(path, profile=True)``
+    to keep the fully loaded file.
+    """
+    from ptir5.file import PTIR5File
+
+    with PTIR5File(path, profile=True) as f:
+        report = f.profile
+    assert report is not None
+    return report
@@ -0,0 +1,84 @@
+"""Picklable measurement references for multiprocessing.
+
+A :class:`MeasurementRef` records where a measurement lives instead of
+holding an open HDF5 handle, so it can be sent to worker processes.
+``ref.open()`` resolves it in the worker through a per-process cache of
+readers, so many refs into the same file share one handle.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ptir5._reader import HDF5Reader
+from ptir5.exceptions import MeasurementNotFoundError
+
+if TYPE_CHECKING:
+    from ptir5.models import Measurement
+
+
+_cache_lock = threading.Lock()
+_readers: dict[str, HDF5Reader] = {}
+_measurements: dict[tuple[str, str], Measurement] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class MeasurementRef:
+    """Lightweight, picklable pointer to a measurement in a PTIR5 file.
+
+    ``shape`` and ``dtype`` describe the DATA dataset and are ``None`` if the
+    measurement has none.
+    """
+
+    path: str
+    hdf5_path: str
+    guid: str
+    measurement_type: str
+    shape: tuple[int, ...] | None
+    dtype: str | None
+
+    def open(self) -> Measurement:
+        """Resolve the reference using this process's handle cache."""
+        from ptir5.models import build_measurement
+
+        key = (self.path, self.hdf5_path)
+        with _cache_lock:
+            cached = _measurements.get(key)
+            if cached is not None and cached._reader.is_open:
+                return cached
+            reader = _cached_reader_locked(self.path)
+            if not reader.has_group(self.hdf5_path):
+                raise MeasurementNotFoundError(self.guid)
+            m = build_measurement(reader, self.hdf5_path, self.guid)
+            _measurements[key] = m
+            return m
+
+
+def _cached_reader_locked(path: str) -> HDF5Reader:
+    reader = _readers.get(path)
+    if reader is None or not reader.is_open:
+        reader = HDF5Reader(path)
+        _readers[path] = reader
+    return reader
+
+
+def cached_reader(path: str) -> HDF5Reader:
+    """Return this process's shared reader for *path*, opening it if needed."""
+    with _cache_lock:
+        return _cached_reader_locked(path)
+
+
+def close_cached_files() -> None:
+    """Close every handle opened by :meth:`MeasurementRef.open` in this process."""
+    with _cache_lock:
+        for reader in _readers.values():
+            reader.close()
+        _readers.clear()
+        _measurements.clear()
+
+
+def _open_ref(ref: MeasurementRef) -> Measurement:
+    """Unpickling hook for :class:`~ptir5.Measurement`."""
+    return ref.open()
@@ -0,0 +1,226 @@
+"""Rewrite a PTIR5 file with a chunk layout suited to how it will be read.
+
+Instruments often write DATA contiguously, or chunked one plane at a time,
+which is slow for per-pixel spectra. :func:`repack` writes a copy whose
+measurement DATA datasets are rechunked and (re)compressed; groups, other
+datasets and every attribute are copied unchanged, and the source file is
+only ever opened read-only.
+
+Layouts, for hypercubes and image stacks (axis 0 = bands or frames):
+
+* ``pixel`` — every chunk holds the full axis 0 for a small spatial tile, so
+  a pixel spectrum is one chunk read.
+* ``plane`` — every chunk holds one whole plane, so band images and frames
+  are one chunk read.
+* ``balanced`` — roughly cubic chunks, a compromise between the two.
+
+Images are tiled (``plane`` keeps each image in one chunk) and spectra are
+stored in a single chunk.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+from ptir5._records import STACKED, data_measurements, time_reads
+from ptir5._writer import DatasetLayout, rewrite_file
+from ptir5.enums import DataShape
+from ptir5.file import PTIR5File
+
+if TYPE_CHECKING:
+    from ptir5.storage import StorageInfo
+
+Layout = Literal["pixel", "plane", "balanced"]
+
+# Chunk size aimed for by every layout. Readers reopen datasets per call, so the
+# HDF5 chunk cache rarely survives between reads: every chunk touched is decoded.
+_TARGET_CHUNK_BYTES = 256 * 1024
+# A plane larger than this is split into row bands under the ``plane`` layout.
+_MAX_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def parse_compression(spec: str) -> tuple[str | None, int | None]:
+    """Parse ``lzf``, ``gzip``, ``gzip:N`` (N in 0-9) or ``none``."""
+    name, _, level = spec.lower().partition(":")
+    if name == "none" and not level:
+        return None, None
+    if name == "lzf" and not level:
+        return "lzf", None
+    if name == "gzip":
+        if not level:
+            return "gzip", 4
+        if level.isdigit() and 0 <= int(level) <= 9:
+            return "gzip", int(level)
+    raise ValueError(f"Unknown compression {spec!r}; expected lzf, gzip:N (0-9) or none")
+
+
+def _tile(elements: int, height: int, width: int) -> tuple[int, int]:
+    """Square-ish spatial tile of about *elements* pixels."""
+    side = max(1, math.isqrt(max(1, elements)))
+    th = min(height, side)
+    tw = min(width, max(1, elements // th))
+    return th, tw
+
+
+def layout_chunks(
+    shape: tuple[int, ...],
+    itemsize: int,
+    data_shape: DataShape,
+    layout: Layout,
+    target_bytes: int = _TARGET_CHUNK_BYTES,
+) -> tuple[int, ...]:
+    """Chunk shape for a DATA dataset of *data_shape* under *layout*."""
+    if layout not in get_args(Layout):
+        raise ValueError(f"Unknown layout {layout!r}; expected one of {get_args(Layout)}")
+    if any(s == 0 for s in shape):
+        return tuple(max(1, s) for s in shape)
+    if len(shape) == 1 or data_shape is DataShape.FLOAT_SPECTRUM_1D:
+        return (min(shape[0], max(1, target_bytes // itemsize)), *shape[1:])
+    stacked = data_shape in STACKED and len(shape) >= 3
+    lead = 1 if stacked else 0
+    height, width = shape[lead], shape[lead + 1]
+    # Trailing axes (image channels) are always kept whole.
+    tail = shape[lead + 2 :]
+    pixel_bytes = itemsize * math.prod(tail)
+    target = max(1, target_bytes // pixel_bytes)
+
+    if layout == "plane":
+        rows = min(height, max(1, _MAX_CHUNK_BYTES // (pixel_bytes * width)))
+        spatial = (rows, width)
+        depth = 1
+    elif not stacked:
+        spatial = _tile(target, height, width)
+        depth = 1
+    elif layout == "pixel":
+        depth = shape[0]
+        spatial = _tile(max(1, target // depth), height, width)
+    else:
+        depth = min(shape[0], max(1, round(target ** (1 / 3))))
+        spatial = _tile(max(1, target // depth), height, width)
+    return (*((depth,) if stacked else ()), *spatial, *tail)
+
+
+@dataclass
+class RepackReport:
+    """Result of :func:`repack`: storage and read timings before and after."""
+
+    source: str
+    destination: str
+    layout: str
+    compression: str
+    source_bytes: int
+    destination_bytes: int
+    elapsed_s: float
+    before: list[StorageInfo]
+    after: list[StorageInfo]
+    read_s: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def size_ratio(self) -> float:
+        """Destination size over source size."""
+        return self.destination_bytes / self.source_bytes if self.source_bytes else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["size_ratio"] = self.size_ratio
+        out["read_s"] = {k: {"before": b, "after": a} for k, (b, a) in self.read_s.items()}
+        return out
+
+    def format(self) -> str:
+        """Human-readable summary of sizes, layouts and read timings."""
+        mib = 1024 * 1024
+        lines = [
+            f"Repacked {self.source} -> {self.destination} "
+            f"(layout={self.layout}, compression={self.compression}) "
+            f"in {self.elapsed_s:.2f} s",
+            f"file size: {self.source_bytes / mib:.2f} MiB -> "
+            f"{self.destination_bytes / mib:.2f} MiB ({self.size_ratio:.2f}x)",
+            "",
+            f"{'dataset':<64}{'chunks before':>20}{'chunks after':>20}",
+        ]
+        for old, new in zip(self.before, self.after, strict=True):
+            old_chunks = "contiguous" if old.chunks is None else str(old.chunks)
+            lines.append(f"{old.path:<64}{old_chunks:>20}{new.chunks!s:>20}")
+        if self.read_s:
+            lines += ["", f"{'read pattern':<16}{'before ms':>12}{'after ms':>12}{'speedup':>10}"]
+            for name, (b, a) in self.read_s.items():
+                speedup = b / a if a else float("inf")
+                lines.append(f"{name:<16}{b * 1e3:>12.2f}{a * 1e3:>12.2f}{speedup:>9.2f}x")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def repack(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    layout: Layout = "balanced",
+    compression: str = "lzf",
+    overwrite: bool = False,
+    benchmark: bool = True,
+    samples: int = 32,
+) -> RepackReport:
+    """Write a copy of *source* to *destination* with DATA rechunked for *layout*.
+
+    *compression* is ``lzf``, ``gzip:N`` or ``none``; the shuffle filter is
+    enabled whenever data is compressed. The copy is written to a temporary
+    file next to *destination* and moved into place only once complete. With
+    *benchmark*, *samples* random pixel spectra and planes (or whole images)
+    are timed on both files.
+
+    Raises ``FileExistsError`` if *destination* exists and *overwrite* is
+    False, and ``ValueError`` if it is the source file itself.
+    """
+    src, dst = Path(source), Path(destination)
+    codec, level = parse_compression(compression)
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            raise ValueError(f"Destination {dst} is the source file")
+        if not overwrite:
+            raise FileExistsError(f"Destination {dst} exists; pass overwrite=True to replace it")
+
+    layouts: dict[str, DatasetLayout] = {}
+    with PTIR5File(src) as f:
+        for m in data_measurements(f):
+            data_path = f"{m._hdf5_path}/DATA"
+            shape = m._reader.dataset_shape(data_path)
+            itemsize = m._reader.dataset_dtype(data_path).itemsize
+            layouts[data_path.lstrip("/")] = DatasetLayout(
+                chunks=layout_chunks(shape, itemsize, m.data_shape, layout),
+                compression=codec,
+                compression_opts=level,
+                shuffle=codec is not None,
+            )
+
+    t0 = time.perf_counter()
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        before, after = rewrite_file(str(src), str(tmp), layouts)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    elapsed = time.perf_counter() - t0
+
+    report = RepackReport(
+        source=str(src),
+        destination=str(dst),
+        layout=layout,
+        compression=compression,
+        source_bytes=src.stat().st_size,
+        destination_bytes=dst.stat().st_size,
+        elapsed_s=elapsed,
+        before=before,
+        after=after,
+    )
+    if benchmark:
+        old, new = time_reads(str(src), samples), time_reads(str(dst), samples)
+        report.read_s = {name: (old[name], new[name]) for name in old}
+    return report
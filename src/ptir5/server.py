@@ -0,0 +1,490 @@
+"""Local HTTP server for viewers: tree, metadata, image tiles and spectra.
+
+Started with ``ptir5 serve FILE...`` or :func:`serve`. Built on the
+standard library only. Connections are kept alive (HTTP/1.1), each served
+on its own thread. Responses are kept in a byte-bounded LRU cache, and
+every file has its own concurrency limit, so one client hammering a large
+file cannot starve requests for the others.
+
+Routes (all ``GET``; ``{file}`` is the index shown by ``/files``)::
+
+    /files
+    /stats
+    /files/{file}/tree
+    /files/{file}/measurements
+    /files/{file}/measurements/{guid}/metadata
+    /files/{file}/measurements/{guid}/image[/{index}]   ?x0&y0&w&h&format=npy|png&vmin&vmax
+    /files/{file}/measurements/{guid}/band?wavenumber=  &format=npy|png&vmin&vmax
+    /files/{file}/measurements/{guid}/spectrum[?x&y]    &format=npy|json
+
+Arrays are returned as ``.npy`` payloads (``application/x-npy``), read
+with ``np.load(io.BytesIO(body))``.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from ptir5._records import dumps, measurement_json, tree_json
+from ptir5.enums import PixelFormat
+from ptir5.exceptions import MeasurementNotFoundError, PTIR5Error
+from ptir5.file import PTIR5File
+from ptir5.models import (
+    ByteImage2D,
+    ByteImageStack3D,
+    FloatHypercube3D,
+    FloatImage2D,
+    FloatSpectrum1D,
+    Measurement,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+NPY_TYPE = "application/x-npy"
+_BGR_FORMATS = {PixelFormat.Bgr24, PixelFormat.Bgr32, PixelFormat.Bgra32, PixelFormat.Pbgra32}
+
+
+class HTTPError(Exception):
+    """Error response with a status code; the message is sent as JSON."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# -- Encoding ----------------------------------------------------------------
+
+
+def encode_npy(array: np.ndarray[Any, Any]) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, np.ascontiguousarray(array), allow_pickle=False)
+    return buf.getvalue()
+
+
+def encode_png(pixels: np.ndarray[Any, Any]) -> bytes:
+    """Encode a ``uint8`` ``(h, w)``, ``(h, w, 3)`` or ``(h, w, 4)`` array as PNG."""
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, None]
+    height, width, channels = pixels.shape
+    color_type = {1: 0, 3: 2, 4: 6}[channels]
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)
+    raw[:, 1:] = pixels.reshape(height, -1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _float_to_gray(
+    plane: np.ndarray[Any, Any], vmin: float | None, vmax: float | None
+) -> np.ndarray[Any, Any]:
+    finite = plane[np.isfinite(plane)]
+    lo = vmin if vmin is not None else (float(finite.min()) if finite.size else 0.0)
+    hi = vmax if vmax is not None else (float(finite.max()) if finite.size else 1.0)
+    scale = 255.0 / (hi - lo) if hi > lo else 0.0
+    scaled = np.nan_to_num((plane.astype(np.float64) - lo) * scale, nan=0.0)
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def _bytes_to_rgb(pixels: np.ndarray[Any, Any], fmt: PixelFormat | str) -> np.ndarray[Any, Any]:
+    channels = pixels.shape[-1]
+    if channels <= 2:
+        return pixels[..., 0]
+    if fmt in _BGR_FORMATS:
+        pixels = pixels[..., [2, 1, 0, 3][:channels]]
+    if channels == 4 and fmt == PixelFormat.Bgr32:
+        pixels = pixels[..., :3]
+    return pixels[..., :4]
+
+
+# -- Response cache ------------------------------------------------------------
+
+
+class ResponseCache:
+    """Thread-safe LRU of response bodies, bounded by total size."""
+
+    __slots__ = ("_max_bytes", "_items", "_size", "_lock", "hits", "misses")
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._items: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key: str, content_type: str, body: bytes) -> None:
+        if len(body) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._items[key] = (content_type, body)
+            self._size += len(body)
+            while self._size > self._max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._size,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# -- Request handling ------------------------------------------------------------
+
+
+class _Query:
+    __slots__ = ("_params",)
+
+    def __init__(self, query: str) -> None:
+        self._params = {k: v[-1] for k, v in parse_qs(query).items()}
+
+    def text(self, key: str, default: str) -> str:
+        return self._params.get(key, default)
+
+    def number(self, key: str) -> float | None:
+        raw = self._params.get(key)
+        try:
+            return None if raw is None else float(raw)
+        except ValueError:
+            raise HTTPError(400, f"{key} must be a number") from None
+
+    def integer(self, key: str) -> int | None:
+        raw = self._params.get(key)
+        try:
+            return None if raw is None else int(raw)
+        except ValueError:
+            raise HTTPError(400, f"{key} must be an integer") from None
+
+
+_Response = tuple[str, bytes]
+
+
+class TileServer(ThreadingHTTPServer):
+    """HTTP server over a fixed set of open PTIR5 files."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        paths: Iterable[str | Path],
+        *,
+        cache_bytes: int = 256 * 1024 * 1024,
+        per_file: int = 4,
+        wait_s: float = 30.0,
+        verbose: bool = False,
+    ) -> None:
+        if per_file < 1:
+            raise ValueError(f"per_file must be at least 1, got {per_file}")
+        self.files: list[PTIR5File] = []
+        try:
+            for p in paths:
+                f = PTIR5File(p)
+                self.files.append(f)
+                # Load structure up front so request threads only read data.
+                for m in f.measurements:
+                    _ = m.generated
+                f.tree  # noqa: B018
+        except BaseException:
+            self.close_files()
+            raise
+        self.cache = ResponseCache(cache_bytes)
+        self.limits = [threading.BoundedSemaphore(per_file) for _ in self.files]
+        self.active = [0] * len(self.files)
+        self._active_lock = threading.Lock()
+        self.wait_s = wait_s
+        self.verbose = verbose
+        super().__init__(address, _Handler)
+
+    def close_files(self) -> None:
+        for f in self.files:
+            f.close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.close_files()
+
+    # -- Routes --------------------------------------------------------------
+
+    def _file(self, file_id: str) -> tuple[int, PTIR5File]:
+        try:
+            index = int(file_id)
+            return index, self.files[index]
+        except (ValueError, IndexError):
+            raise HTTPError(404, f"no file {file_id!r}") from None
+
+    def _measurement(self, f: PTIR5File, guid: str) -> Measurement:
+        try:
+            return f.get_measurement(guid)
+        except MeasurementNotFoundError:
+            pass
+        for m in f.measurements:
+            for child in m.generated:
+                if child.guid == guid:
+                    return child
+        try:
+            return f.get_background(guid)
+        except MeasurementNotFoundError:
+            raise HTTPError(404, f"no measurement {guid!r}") from None
+
+    def handle_path(self, path: str, query: _Query) -> _Response:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["files"]:
+            body = [{"id": i, "path": f.path} for i, f in enumerate(self.files)]
+            return _json(body)
+        if parts == ["stats"]:
+            return _json(
+                {
+                    "cache": self.cache.stats(),
+                    "files": [
+                        {"id": i, "path": f.path, "active": n}
+                        for i, (f, n) in enumerate(zip(self.files, self.active, strict=True))
+                    ],
+                }
+            )
+        if len(parts) < 3 or parts[0] != "files":
+            raise HTTPError(404, f"no route {path!r}")
+        index, f = self._file(parts[1])
+        if not self.limits[index].acquire(timeout=self.wait_s):
+            raise HTTPError(503, f"too many concurrent requests for file {index}")
+        with self._active_lock:
+            self.active[index] += 1
+        try:
+            return self._file_route(f, parts[2:], query)
+        finally:
+            with self._active_lock:
+                self.active[index] -= 1
+            self.limits[index].release()
+
+    def _file_route(self, f: PTIR5File, parts: list[str], query: _Query) -> _Response:
+        if parts == ["tree"]:
+            tree = f.tree
+            return _json(None if tree is None else [tree_json(c) for c in tree.children])
+        if parts == ["measurements"]:
+            return _json([measurement_json(m) for m in f.measurements])
+        if len(parts) >= 3 and parts[0] == "measurements":
+            m = self._measurement(f, parts[1])
+            handler = _MEASUREMENT_ROUTES.get(parts[2])
+            if handler is not None:
+                return handler(m, parts[3:], query)
+        raise HTTPError(404, f"no route {'/'.join(parts)!r}")
+
+
+def _json(body: Any) -> _Response:
+    return "application/json", dumps(body).encode()
+
+
+def _metadata_route(m: Measurement, rest: list[str], query: _Query) -> _Response:
+    if rest:
+        raise HTTPError(404, "unexpected path after metadata")
+    return _json(dict(m.metadata))
+
+
+def _region(query: _Query, height: int, width: int) -> tuple[slice, slice]:
+    x0, y0 = query.integer("x0") or 0, query.integer("y0") or 0
+    w, h = query.integer("w"), query.integer("h")
+    x1 = width if w is None else x0 + w
+    y1 = height if h is None else y0 + h
+    if not (0 <= x0 < x1 <= width and 0 <= y0 < y1 <= height):
+        raise HTTPError(400, f"region outside the {width}x{height} image")
+    return slice(y0, y1), slice(x0, x1)
+
+
+def _plane_response(m: Measurement, index: int | None, query: _Query) -> _Response:
+    path = f"{m._hdf5_path}/DATA"
+    shape = m._reader.dataset_shape(path)
+    stacked = isinstance(m, FloatHypercube3D | ByteImageStack3D)
+    if stacked:
+        if index is None:
+            raise HTTPError(400, "an image index is required for stacks and hypercubes")
+        if not 0 <= index < shape[0]:
+            raise HTTPError(400, f"index {index} out of range 0..{shape[0] - 1}")
+        lead: tuple[int | slice, ...] = (index,)
+        height, width = shape[1], shape[2]
+    elif isinstance(m, FloatImage2D | ByteImage2D):
+        if index not in (None, 0):
+            raise HTTPError(400, "single images only have index 0")
+        lead = ()
+        height, width = shape[0], shape[1]
+    else:
+        raise HTTPError(400, f"{type(m).__name__} has no images")
+    ys, xs = _region(query, height, width)
+    plane = m._reader.read_dataset_slice(path, (*lead, ys, xs))
+
+    fmt = query.text("format", "npy")
+    if fmt == "npy":
+        return NPY_TYPE, encode_npy(plane)
+    if fmt == "png":
+        if isinstance(m, ByteImage2D | ByteImageStack3D):
+            pixels = _bytes_to_rgb(plane, m.pixel_format)
+        else:
+            pixels = _float_to_gray(plane, query.number("vmin"), query.number("vmax"))
+        return "image/png", encode_png(pixels)
+    raise HTTPError(400, f"unsupported image format {fmt!r}")
+
+
+def _image_route(m: Measurement, rest: list[str], query: _Query) -> _Response:
+    if len(rest) > 1:
+        raise HTTPError(404, "unexpected path after image index")
+    try:
+        index = int(rest[0]) if rest else None
+    except ValueError:
+        raise HTTPError(400, "image index must be an integer") from None
+    return _plane_response(m, index, query)
+
+
+def _band_route(m: Measurement, rest: list[str], query: _Query) -> _Response:
+    if not isinstance(m, FloatHypercube3D):
+        raise HTTPError(400, f"{type(m).__name__} has no wavenumber bands")
+    wavenumber = query.number("wavenumber")
+    if wavenumber is None:
+        raise HTTPError(400, "wavenumber is required")
+    step = m.x_increment or 1.0
+    index = round((wavenumber - m.x_start) / step)
+    if not 0 <= index < m.num_points:
+        raise HTTPError(400, f"wavenumber {wavenumber} outside the measured range")
+    return _plane_response(m, index, query)
+
+
+def _spectrum_route(m: Measurement, rest: list[str], query: _Query) -> _Response:
+    if isinstance(m, FloatHypercube3D):
+        x, y = query.integer("x"), query.integer("y")
+        if x is None or y is None:
+            raise HTTPError(400, "x and y are required for hypercube spectra")
+        if not (0 <= x < m.pixel_width and 0 <= y < m.pixel_height):
+            raise HTTPError(400, f"pixel ({x}, {y}) outside the image")
+        spectrum = m.read_spectrum(x, y)
+    elif isinstance(m, FloatSpectrum1D):
+        spectrum = m.data
+    else:
+        raise HTTPError(400, f"{type(m).__name__} has no spectra")
+    fmt = query.text("format", "npy")
+    if fmt == "npy":
+        return NPY_TYPE, encode_npy(spectrum)
+    if fmt == "json":
+        return _json({"x": m.x_values, "y": spectrum})
+    raise HTTPError(400, f"unsupported spectrum format {fmt!r}")
+
+
+_MEASUREMENT_ROUTES: dict[str, Callable[[Measurement, list[str], _Query], _Response]] = {
+    "metadata": _metadata_route,
+    "image": _image_route,
+    "band": _band_route,
+    "spectrum": _spectrum_route,
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: TileServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        key = f"{url.path}?{'&'.join(sorted(url.query.split('&')))}"
+        cached = self.server.cache.get(key)
+        if cached is not None:
+            self._send(200, *cached)
+            return
+        try:
+            content_type, body = self.server.handle_path(url.path, _Query(url.query))
+        except HTTPError as exc:
+            self._send(exc.status, *_json({"error": str(exc)}))
+            return
+        except (PTIR5Error, ValueError, TypeError, IndexError, KeyError) as exc:
+            self._send(400, *_json({"error": str(exc)}))
+            return
+        except Exception as exc:
+            # Read failures (OSError, h5py errors) still get a response.
+            self.log_error("error serving %s: %r", self.path, exc)
+            self._send(500, *_json({"error": f"{type(exc).__name__}: {exc}"}))
+            return
+        self.server.cache.put(key, content_type, body)
+        self._send(200, content_type, body)
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(
+    paths: Iterable[str | Path],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    *,
+    cache_mb: float = 256,
+    per_file: int = 4,
+    verbose: bool = False,
+) -> TileServer:
+    """Open *paths* and bind a :class:`TileServer` (``port=0`` picks a free port)."""
+    return TileServer(
+        (host, port),
+        paths,
+        cache_bytes=int(cache_mb * 1024 * 1024),
+        per_file=per_file,
+        verbose=verbose,
+    )
+
+
+def serve(
+    paths: Iterable[str | Path],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    **kwargs: Any,
+) -> None:
+    """Run a :class:`TileServer` until interrupted."""
+    server = make_server(paths, host, port, **kwargs)
+    bound_host, bound_port = server.server_address[:2]
+    url = f"http://{bound_host!s}:{bound_port}/"
+    print(f"Serving {len(server.files)} file(s) on {url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
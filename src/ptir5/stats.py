@@ -0,0 +1,407 @@
+"""Streaming statistics and histograms for measurement DATA.
+
+:func:`compute_stats` reads DATA once, tile by tile along the HDF5 chunk
+grid, so memory stays bounded by one tile regardless of the array size.
+
+Float data is histogrammed into a fine adaptive histogram whose range
+doubles whenever a tile falls outside it (adjacent bins merge exactly), so
+no second pass is needed to find the range first. Percentiles and the
+returned histogram are therefore accurate to one fine bin (the value range
+divided by ``_FINE_BINS``). 8-bit data is counted exactly.
+
+Results can be kept in a JSON sidecar next to the file (``<file>.stats.json``)
+or in a cache directory (``<file>.<path hash>.stats.json``), keyed by the
+file's size and modification time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ptir5.enums import DataShape
+
+if TYPE_CHECKING:
+    from ptir5.models import Measurement
+
+_FINE_BINS = 4096
+_DEFAULT_PERCENTILES = (1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0)
+_SIDECAR_SUFFIX = ".stats.json"
+_CACHE_VERSION = 1
+
+
+@dataclass
+class MeasurementStats:
+    """Summary statistics of a measurement's DATA.
+
+    ``min``/``max``/``mean``/``std`` ignore NaN and infinite values, which are
+    counted separately. ``per_plane`` holds the same statistics per band
+    (hypercubes) or per frame (image stacks) as lists, and is ``None`` for
+    other shapes.
+    """
+
+    count: int
+    nan_count: int
+    inf_count: int
+    min: float
+    max: float
+    mean: float
+    std: float
+    percentiles: dict[float, float]
+    histogram: list[int]
+    bin_edges: list[float]
+    per_plane: dict[str, list[float]] | None = None
+    exact: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "nan_count": self.nan_count,
+            "inf_count": self.inf_count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": self.std,
+            "percentiles": {str(k): v for k, v in self.percentiles.items()},
+            "histogram": self.histogram,
+            "bin_edges": self.bin_edges,
+            "per_plane": self.per_plane,
+            "exact": self.exact,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MeasurementStats:
+        fields = dict(data)
+        fields["percentiles"] = {float(k): v for k, v in data["percentiles"].items()}
+        return cls(**fields)
+
+
+class _AdaptiveHistogram:
+    """Fixed-count histogram whose range doubles (merging bin pairs) as needed."""
+
+    __slots__ = ("nbins", "lo", "width", "counts")
+
+    def __init__(self, nbins: int = _FINE_BINS) -> None:
+        self.nbins = nbins
+        self.lo = 0.0
+        self.width = 0.0
+        self.counts: np.ndarray[Any, np.dtype[np.int64]] = np.zeros(nbins, dtype=np.int64)
+
+    @property
+    def hi(self) -> float:
+        return self.lo + self.width * self.nbins
+
+    def _grow(self, downward: bool) -> None:
+        merged = self.counts.reshape(-1, 2).sum(axis=1)
+        half = self.nbins // 2
+        self.counts = np.zeros(self.nbins, dtype=np.int64)
+        if downward:
+            self.lo -= self.width * self.nbins
+            self.counts[half:] = merged
+        else:
+            self.counts[:half] = merged
+        self.width *= 2
+
+    def add(self, values: np.ndarray[Any, Any]) -> None:
+        if values.size == 0:
+            return
+        vmin, vmax = float(values.min()), float(values.max())
+        if self.width == 0.0:
+            self.lo = vmin
+            span = vmax - vmin
+            self.width = span / self.nbins * 1.0001 if span > 0 else max(abs(vmin), 1.0) * 1e-9
+        while vmin < self.lo:
+            self._grow(downward=True)
+        while vmax >= self.hi:
+            self._grow(downward=False)
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        np.clip(idx, 0, self.nbins - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=self.nbins)
+
+    def edges(self) -> np.ndarray[Any, np.dtype[np.float64]]:
+        return self.lo + self.width * np.arange(self.nbins + 1, dtype=np.float64)
+
+
+class _PlaneAccumulator:
+    """Per-index statistics along axis 0."""
+
+    def __init__(self, n: int) -> None:
+        self.count = np.zeros(n, dtype=np.int64)
+        self.nan = np.zeros(n, dtype=np.int64)
+        self.total = np.zeros(n, dtype=np.float64)
+        self.total_sq = np.zeros(n, dtype=np.float64)
+        self.min = np.full(n, np.inf)
+        self.max = np.full(n, -np.inf)
+
+    def add(self, start: int, block: np.ndarray[Any, Any]) -> None:
+        flat = block.reshape(block.shape[0], -1).astype(np.float64, copy=False)
+        finite = np.isfinite(flat)
+        sl = slice(start, start + flat.shape[0])
+        self.count[sl] += finite.sum(axis=1)
+        self.nan[sl] += np.isnan(flat).sum(axis=1)
+        clean = np.where(finite, flat, 0.0)
+        self.total[sl] += clean.sum(axis=1)
+        self.total_sq[sl] += (clean * clean).sum(axis=1)
+        self.min[sl] = np.minimum(self.min[sl], np.where(finite, flat, np.inf).min(axis=1))
+        self.max[sl] = np.maximum(self.max[sl], np.where(finite, flat, -np.inf).max(axis=1))
+
+    def result(self) -> dict[str, list[float]]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.total / self.count
+            var = np.maximum(self.total_sq / self.count - mean * mean, 0.0)
+        return {
+            "min": np.where(self.count > 0, self.min, np.nan).tolist(),
+            "max": np.where(self.count > 0, self.max, np.nan).tolist(),
+            "mean": mean.tolist(),
+            "std": np.sqrt(var).tolist(),
+            "nan_count": self.nan.astype(np.float64).tolist(),
+        }
+
+
+def _percentiles_from_counts(
+    counts: np.ndarray[Any, Any],
+    edges: np.ndarray[Any, Any],
+    qs: tuple[float, ...],
+    interpolate: bool,
+) -> dict[float, float]:
+    total = int(counts.sum())
+    if total == 0:
+        return {q: math.nan for q in qs}
+    cdf = np.cumsum(counts)
+    out: dict[float, float] = {}
+    for q in qs:
+        target = q / 100.0 * total
+        i = int(np.searchsorted(cdf, max(target, 1e-12), side="left"))
+        i = min(i, len(counts) - 1)
+        if not interpolate:
+            out[q] = float(edges[i])
+            continue
+        before = cdf[i - 1] if i > 0 else 0
+        frac = (target - before) / counts[i] if counts[i] else 0.0
+        out[q] = float(edges[i] + frac * (edges[i + 1] - edges[i]))
+    return out
+
+
+def _rebin(
+    fine: np.ndarray[Any, Any],
+    fine_edges: np.ndarray[Any, Any],
+    lo: float,
+    hi: float,
+    bins: int,
+) -> tuple[list[int], list[float]]:
+    """Redistribute fine-bin counts into *bins* equal bins over [lo, hi]."""
+    edges = np.linspace(lo, hi, bins + 1)
+    if hi <= lo:
+        return [int(fine.sum())] + [0] * (bins - 1), edges.tolist()
+    centers = (fine_edges[:-1] + fine_edges[1:]) / 2
+    idx = np.clip(((centers - lo) / (hi - lo) * bins).astype(np.int64), 0, bins - 1)
+    counts = np.bincount(idx, weights=fine, minlength=bins).astype(np.int64)
+    return counts.tolist(), edges.tolist()
+
+
+def compute_stats(
+    m: Measurement,
+    bins: int = 64,
+    percentiles: tuple[float, ...] = _DEFAULT_PERCENTILES,
+) -> MeasurementStats:
+    """Compute :class:`MeasurementStats` for *m* in one chunked pass over DATA."""
+    per_plane_shapes = (DataShape.FLOAT_HYPERCUBE_3D, DataShape.BYTE_IMAGE_STACK_3D)
+    planes: _PlaneAccumulator | None = None
+    byte_counts: np.ndarray[Any, Any] | None = None
+    hist = _AdaptiveHistogram()
+
+    n = nan = inf = 0
+    mean = m2 = 0.0
+    vmin, vmax = math.inf, -math.inf
+    # 8-bit counts are indexed from 0; signed data is shifted up by 128.
+    signed = np.issubdtype(m._reader.dataset_dtype(f"{m._hdf5_path}/DATA"), np.signedinteger)
+    byte_offset = 128 if signed else 0
+
+    for slices, block in m.iter_tiles():
+        if planes is None and m.data_shape in per_plane_shapes and block.ndim >= 3:
+            length = m._reader.dataset_shape(f"{m._hdf5_path}/DATA")[0]
+            planes = _PlaneAccumulator(length)
+        if planes is not None:
+            planes.add(slices[0].start, block)
+
+        if block.dtype.itemsize == 1 and np.issubdtype(block.dtype, np.integer):
+            counts = np.bincount(block.ravel().astype(np.int64) + byte_offset, minlength=256)
+            byte_counts = counts if byte_counts is None else byte_counts + counts
+            values = block.ravel().astype(np.float64)
+        else:
+            flat = block.ravel().astype(np.float64, copy=False)
+            finite = np.isfinite(flat)
+            nan += int(np.isnan(flat).sum())
+            inf += int(flat.size - finite.sum()) - int(np.isnan(flat).sum())
+            values = flat[finite] if not finite.all() else flat
+            hist.add(values)
+
+        if values.size == 0:
+            continue
+        # Chan et al. parallel merge of (count, mean, M2).
+        bn = values.size
+        bmean = float(values.mean())
+        bm2 = float(((values - bmean) ** 2).sum())
+        delta = bmean - mean
+        total = n + bn
+        mean += delta * bn / total
+        m2 += bm2 + delta * delta * n * bn / total
+        n = total
+        vmin = min(vmin, float(values.min()))
+        vmax = max(vmax, float(values.max()))
+
+    if n == 0:
+        vmin = vmax = mean = math.nan
+    std = math.sqrt(m2 / n) if n else math.nan
+
+    if byte_counts is not None:
+        offset = -byte_offset
+        edges = np.arange(257, dtype=np.float64) + offset
+        pct = _percentiles_from_counts(byte_counts, edges, percentiles, interpolate=False)
+        hist_counts: list[int] = [0] * bins
+        hist_edges: list[float] = []
+        if n:
+            lo_i, hi_i = int(vmin) - offset, int(vmax) - offset + 1
+            hist_counts, hist_edges = _rebin(
+                byte_counts[lo_i:hi_i], edges[lo_i : hi_i + 1], vmin, vmax + 1, bins
+            )
+        exact = True
+    else:
+        fine_edges = hist.edges()
+        pct = _percentiles_from_counts(hist.counts, fine_edges, percentiles, interpolate=True)
+        pct = {q: min(max(v, vmin), vmax) for q, v in pct.items()} if n else pct
+        hist_counts, hist_edges = (
+            _rebin(hist.counts, fine_edges, vmin, vmax, bins) if n else ([0] * bins, [])
+        )
+        exact = False
+
+    return MeasurementStats(
+        count=n,
+        nan_count=nan,
+        inf_count=inf,
+        min=vmin,
+        max=vmax,
+        mean=mean,
+        std=std,
+        percentiles=pct,
+        histogram=hist_counts,
+        bin_edges=hist_edges,
+        per_plane=planes.result() if planes is not None else None,
+        exact=exact,
+    )
+
+
+# -- Sidecar cache -----------------------------------------------------------
+
+
+@dataclass
+class StatsCache:
+    """JSON cache of :class:`MeasurementStats` for one data file.
+
+    Entries are dropped as soon as the file's size or modification time
+    changes.
+    """
+
+    data_path: Path
+    cache_path: Path
+    _entries: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def for_file(cls, data_path: str | Path, location: str | Path | bool) -> StatsCache:
+        """Cache for *data_path*: a sidecar if *location* is True, else inside that directory.
+
+        In a shared directory the name also carries a hash of the resolved
+        data path, so files with the same name in different places do not
+        overwrite each other's entries.
+        """
+        data_path = Path(data_path)
+        if isinstance(location, bool):
+            cache_path = data_path.with_name(data_path.name + _SIDECAR_SUFFIX)
+        else:
+            tag = hashlib.blake2b(
+                str(data_path.resolve()).encode(), digest_size=4
+            ).hexdigest()
+            cache_path = Path(location) / f"{data_path.name}.{tag}{_SIDECAR_SUFFIX}"
+        cache = cls(data_path, cache_path)
+        cache._entries = cache._read()
+        return cache
+
+    def _fingerprint(self) -> dict[str, int]:
+        st = os.stat(self.data_path)
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if (
+            payload.get("version") != _CACHE_VERSION
+            or payload.get("fingerprint") != self._fingerprint()
+        ):
+            return {}
+        entries: dict[str, Any] = payload.get("entries", {})
+        return entries
+
+    @staticmethod
+    def key(hdf5_path: str, bins: int, percentiles: tuple[float, ...]) -> str:
+        return f"{hdf5_path}|bins={bins}|p={','.join(map(repr, percentiles))}"
+
+    def get(self, key: str) -> MeasurementStats | None:
+        entry = self._entries.get(key)
+        return None if entry is None else MeasurementStats.from_dict(entry)
+
+    def put(self, key: str, stats: MeasurementStats) -> None:
+        self._entries[key] = stats.to_dict()
+        payload = {
+            "version": _CACHE_VERSION,
+            "fingerprint": self._fingerprint(),
+            "entries": self._entries,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp, self.cache_path)
+        except OSError as exc:
+            warnings.warn(
+                f"Could not write stats cache {self.cache_path}: {exc}",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+
+def cached_stats(
+    m: Measurement,
+    bins: int,
+    percentiles: tuple[float, ...],
+    cache: str | Path | bool | None,
+) -> MeasurementStats:
+    """:func:`compute_stats`, going through a :class:`StatsCache` if *cache* is set."""
+    if not cache:
+        return compute_stats(m, bins, percentiles)
+    if not m._reader.reopenable:
+        warnings.warn(
+            f"Not caching stats for {m._reader.path}: it was not opened from a path",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return compute_stats(m, bins, percentiles)
+    store = StatsCache.for_file(m._reader.path, cache)
+    key = StatsCache.key(m._hdf5_path, bins, percentiles)
+    hit = store.get(key)
+    if hit is not None:
+        return hit
+    result = compute_stats(m, bins, percentiles)
+    store.put(key, result)
+    return result
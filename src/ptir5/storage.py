@@ -0,0 +1,120 @@
+"""How measurement datasets are laid out on disk.
+
+:meth:`Measurement.storage_info` describes one dataset: layout, chunk grid,
+filters, allocated versus logical size and, for contiguous data, its byte
+offset in the file. :meth:`PTIR5File.storage_summary` totals these over
+every measurement, GENERATED child and background so tools can choose an
+access pattern (whole reads, tiles, per-pixel spectra) without trial runs.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+StorageLayout = Literal["contiguous", "chunked", "compact", "virtual"]
+
+
+@dataclass(frozen=True)
+class StorageInfo:
+    """Storage layout of one HDF5 dataset."""
+
+    path: str
+    layout: StorageLayout
+    shape: tuple[int, ...]
+    dtype: str
+    chunks: tuple[int, ...] | None
+    filters: tuple[str, ...]
+    compression: str | None
+    compression_opts: Any
+    logical_bytes: int
+    stored_bytes: int
+    num_chunks: int
+    offset: int | None
+
+    @property
+    def chunk_grid(self) -> int:
+        """Chunks needed to cover the whole dataset (0 if it is not chunked)."""
+        if self.chunks is None:
+            return 0
+        return math.prod(-(-s // c) for s, c in zip(self.shape, self.chunks, strict=True))
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Logical over stored bytes, or None while nothing is allocated."""
+        return self.logical_bytes / self.stored_bytes if self.stored_bytes else None
+
+    def to_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["chunk_grid"] = self.chunk_grid
+        out["compression_ratio"] = self.compression_ratio
+        return out
+
+
+@dataclass(frozen=True)
+class StorageSummary:
+    """Storage totals for the DATA datasets of a whole file."""
+
+    path: str
+    file_bytes: int | None
+    datasets: tuple[StorageInfo, ...]
+
+    @property
+    def logical_bytes(self) -> int:
+        return sum(d.logical_bytes for d in self.datasets)
+
+    @property
+    def stored_bytes(self) -> int:
+        return sum(d.stored_bytes for d in self.datasets)
+
+    @property
+    def num_chunks(self) -> int:
+        return sum(d.num_chunks for d in self.datasets)
+
+    @property
+    def compression_ratio(self) -> float | None:
+        return self.logical_bytes / self.stored_bytes if self.stored_bytes else None
+
+    def layouts(self) -> dict[str, int]:
+        """Number of datasets per layout."""
+        return dict(Counter(d.layout for d in self.datasets))
+
+    def filters(self) -> dict[str, int]:
+        """Number of datasets using each filter."""
+        return dict(Counter(f for d in self.datasets for f in d.filters))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "file_bytes": self.file_bytes,
+            "logical_bytes": self.logical_bytes,
+            "stored_bytes": self.stored_bytes,
+            "compression_ratio": self.compression_ratio,
+            "num_chunks": self.num_chunks,
+            "layouts": self.layouts(),
+            "filters": self.filters(),
+            "datasets": [d.to_dict() for d in self.datasets],
+        }
+
+    def format(self) -> str:
+        """Human-readable totals and a per-dataset table."""
+        mib = 1024 * 1024
+        ratio = self.compression_ratio
+        lines = [
+            f"Storage of {self.path}: {len(self.datasets)} datasets, "
+            f"{self.logical_bytes / mib:.2f} MiB logical, {self.stored_bytes / mib:.2f} MiB "
+            f"stored" + (f" ({ratio:.2f}x)" if ratio is not None else ""),
+            "",
+            f"{'dataset':<64}{'layout':>12}{'chunks':>20}{'filters':>18}{'ratio':>8}",
+        ]
+        for d in self.datasets:
+            chunks = "-" if d.chunks is None else str(d.chunks)
+            filters = ",".join(d.filters) or "-"
+            r = "-" if d.compression_ratio is None else f"{d.compression_ratio:.2f}"
+            lines.append(f"{d.path:<64}{d.layout:>12}{chunks:>20}{filters:>18}{r:>8}")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
@@ -0,0 +1,158 @@
+"""I/O tracing hooks for :class:`~ptir5._reader.HDF5Reader`.
+
+Every dataset read, attribute load and path lookup the reader performs can
+be reported to registered callbacks as an :class:`IOEvent`. With no
+callbacks registered the instrumentation is a single truthiness check per
+call.
+
+Usage::
+
+    with ptir5.trace() as t:
+        spectrum = cube.read_spectrum(3, 4)
+    print(t.summary())
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+IOHook = Callable[["IOEvent"], None]
+
+# Replaced (never mutated) under _hooks_lock, so readers can iterate it without locking.
+_hooks: tuple[IOHook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class IOEvent:
+    """One instrumented reader call.
+
+    ``bytes_read`` and ``elements`` are the logical size of the returned
+    array. ``chunks_touched`` is the number of HDF5 chunks the selection
+    intersects, or ``None`` for contiguous/compact datasets and non-dataset
+    operations.
+    """
+
+    op: str
+    path: str
+    guid: str | None
+    duration_s: float
+    bytes_read: int = 0
+    elements: int = 0
+    chunks_touched: int | None = None
+
+
+def add_io_hook(hook: IOHook) -> None:
+    """Register *hook* to be called with every :class:`IOEvent`, from the reading thread."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+
+def remove_io_hook(hook: IOHook) -> None:
+    """Unregister a hook added with :func:`add_io_hook`. Unknown hooks are ignored."""
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        if hook in hooks:
+            hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+def emit(event: IOEvent) -> None:
+    for hook in _hooks:
+        hook(event)
+
+
+def guid_from_path(path: str) -> str | None:
+    """Return the innermost GUID component of an HDF5 path, if any."""
+    for part in reversed(path.split("/")):
+        if len(part) == 36 and part[8] == part[13] == part[18] == part[23] == "-":
+            return part
+    return None
+
+
+def chunks_touched(
+    shape: tuple[int, ...],
+    chunks: tuple[int, ...] | None,
+    selection: tuple[Any, ...] | None,
+) -> int | None:
+    """Count the chunks a basic (int/slice) selection intersects."""
+    if chunks is None:
+        return None
+    selection = selection or ()
+    total = 1
+    for axis, (n, c) in enumerate(zip(shape, chunks, strict=True)):
+        sel = selection[axis] if axis < len(selection) else slice(None)
+        if isinstance(sel, slice):
+            start, stop, step = sel.indices(n)
+            indices = range(start, stop, step)
+            if not indices:
+                return 0
+            if step == 1:
+                total *= (indices[-1] // c) - (indices[0] // c) + 1
+            else:
+                total *= len({i // c for i in indices})
+    return total if shape else 0
+
+
+@dataclass
+class Trace:
+    """Events collected by :func:`trace`."""
+
+    events: list[IOEvent] = field(default_factory=list)
+
+    def _record(self, event: IOEvent) -> None:
+        self.events.append(event)
+
+    @property
+    def total_time(self) -> float:
+        return sum(e.duration_s for e in self.events)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.bytes_read for e in self.events)
+
+    def count(self, op: str | None = None) -> int:
+        """Number of events, optionally only those for *op*."""
+        return sum(1 for e in self.events if op is None or e.op == op)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-operation totals: calls, seconds, bytes, elements and chunks touched."""
+        return _summarize(self.events, lambda e: e.op)
+
+    def by_guid(self) -> dict[str | None, dict[str, Any]]:
+        """Per-measurement totals, keyed by GUID (``None`` for file-level calls)."""
+        return _summarize(self.events, lambda e: e.guid)
+
+
+def _summarize(events: list[IOEvent], key: Callable[[IOEvent], Any]) -> dict[Any, dict[str, Any]]:
+    out: dict[Any, dict[str, Any]] = {}
+    for e in events:
+        s = out.setdefault(
+            key(e), {"calls": 0, "seconds": 0.0, "bytes": 0, "elements": 0, "chunks": 0}
+        )
+        s["calls"] += 1
+        s["seconds"] += e.duration_s
+        s["bytes"] += e.bytes_read
+        s["elements"] += e.elements
+        s["chunks"] += e.chunks_touched or 0
+    return out
+
+
+@contextmanager
+def trace() -> Iterator[Trace]:
+    """Collect every reader I/O event raised while the block runs.
+
+    Events from all threads are collected, not just the calling one.
+    """
+    t = Trace()
+    add_io_hook(t._record)
+    try:
+        yield t
+    finally:
+        remove_io_hook(t._record)
@@ -39,16 +39,27 @@ class TreeLeaf:
 class TreeFolder:
     """A folder node in the PTIR5 tree, containing children."""
 
-    __slots__ = ("_name", "_children")
-
-    def __init__(self, name: str, children: tuple[TreeFolder | TreeLeaf, ...]) -> None:
+    __slots__ = ("_name", "_children", "_guid")
+
+    def __init__(
+        self,
+        name: str,
+        children: tuple[TreeFolder | TreeLeaf, ...],
+        guid: str | None = None,
+    ) -> None:
         self._name = name
         self._children = children
+        self._guid = guid
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def guid(self) -> str | None:
+        """GUID of the folder's TREE node, or None if built without one."""
+        return self._guid
+
     @property
     def children(self) -> tuple[TreeFolder | TreeLeaf, ...]:
         return self._children
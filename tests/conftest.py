@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import h5py
+import numpy as np
 import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -12,8 +15,16 @@ SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from ptir5 import Trace
+
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# GUID of the single measurement in files written by the synthetic fixtures.
+SYNTHETIC_GUID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -58,3 +69,50 @@ def optir_image_stack_path() -> Path:
 @pytest.fixture
 def hyperspectra_path() -> Path:
     return FIXTURES_DIR / "sample_optir_hyperspectra_generated_spectrum_generated_image.ptir"
+
+
+def _write_measurement(
+    path: Path,
+    data: np.ndarray[Any, Any] | None = None,
+    measurement_type: str = "OPTIRHyperspectra",
+    attrs: Mapping[str, Any] | None = None,
+    **dataset_kwargs: Any,
+) -> Path:
+    with h5py.File(path, "w") as h5:
+        g = h5.create_group(f"MEASUREMENTS/{SYNTHETIC_GUID}")
+        g.attrs["TYPE"] = np.bytes_(measurement_type)
+        for key, value in (attrs or {}).items():
+            g.attrs[key] = value
+        if data is not None or dataset_kwargs:
+            g.create_dataset("DATA", data=data, **dataset_kwargs)
+    return path
+
+
+@pytest.fixture
+def write_measurement() -> Callable[..., Path]:
+    """Write a file holding one measurement and return its path.
+
+    Called as ``write_measurement(path, data, measurement_type, attrs, **dataset_kwargs)``;
+    the keyword arguments go to ``create_dataset`` for DATA, which is left out
+    when there is neither *data* nor any keyword argument.
+    """
+    return _write_measurement
+
+
+@pytest.fixture
+def elements_read() -> Callable[[Trace], int]:
+    """Count the DATA elements read by the ``read_dataset*`` events of a trace."""
+
+    def count(t: Trace) -> int:
+        return sum(e.elements for e in t.events if e.op.startswith("read_dataset"))
+
+    return count
+
+
+@pytest.fixture
+def chunked_cube_path(tmp_path: Path) -> Path:
+    """A 40x12x10 float32 hypercube holding ``arange``, gzip-compressed in (8, 6, 5) chunks."""
+    data = np.arange(40 * 12 * 10, dtype=np.float32).reshape(40, 12, 10)
+    return _write_measurement(
+        tmp_path / "chunked.ptir", data, chunks=(8, 6, 5), compression="gzip"
+    )
@@ -0,0 +1,166 @@
+"""Tests for the asyncio facade."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import aio
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_open_and_read(optir_spectrum_path: Path) -> None:
+    async def main() -> None:
+        async with await aio.open(optir_spectrum_path) as f:
+            assert f.is_open
+            ms = await f.measurements()
+            assert len(ms) == 1
+            data = await ms[0].read()
+            assert data.shape == (1019,)
+            assert await ms[0].label() == "O-PTIR0 1"
+            meta = await ms[0].metadata()
+            assert meta["XStart"] == 962.0
+        assert not f.is_open
+
+    asyncio.run(main())
+
+
+def test_read_spectrum_and_image(hyperspectra_path: Path) -> None:
+    async def main() -> None:
+        async with await aio.open(hyperspectra_path) as f:
+            m = (await f.measurements())[0]
+            spec = await m.read_spectrum(0, 0)
+            img = await m.read_image(3)
+            full = await m.read()
+            np.testing.assert_array_equal(spec, full[:, 0, 0])
+            np.testing.assert_array_equal(img, full[3])
+            assert len(m.generated) == 2
+
+    asyncio.run(main())
+
+
+def test_read_spectrum_wrong_shape_raises(optir_spectrum_path: Path) -> None:
+    async def main() -> None:
+        async with await aio.open(optir_spectrum_path) as f:
+            m = (await f.measurements())[0]
+            with pytest.raises(TypeError):
+                await m.read_spectrum(0, 0)
+
+    asyncio.run(main())
+
+
+def test_iter_tiles_matches_sync(optir_image_stack_path: Path) -> None:
+    async def main() -> None:
+        async with await aio.open(optir_image_stack_path) as f:
+            m = (await f.measurements())[0]
+            full = await m.read()
+            seen = 0
+            async for slices, tile in m.iter_tiles((4, 51, 51)):
+                np.testing.assert_array_equal(tile, full[slices])
+                seen += tile.shape[0]
+            assert seen == full.shape[0]
+
+    asyncio.run(main())
+
+
+def test_iter_tiles_break_closes_on_executor(
+    optir_image_stack_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed_in: list[threading.Thread] = []
+    original = ptir5.Measurement.iter_tiles
+
+    def tracked(self: ptir5.Measurement, tile_shape: tuple[int, ...] | None = None) -> Any:
+        try:
+            yield from original(self, tile_shape)
+        finally:
+            closed_in.append(threading.current_thread())
+
+    monkeypatch.setattr(ptir5.Measurement, "iter_tiles", tracked)
+
+    async def main() -> None:
+        async with await aio.open(optir_image_stack_path) as f:
+            m = (await f.measurements())[0]
+            tiles = m.iter_tiles((1, 51, 51))
+            async for _ in tiles:
+                break
+            await tiles.aclose()
+            assert len(closed_in) == 1
+            # Closed by an executor call, not by the event loop thread.
+            assert closed_in[0] is not threading.current_thread()
+
+    asyncio.run(main())
+
+
+def test_concurrent_reads_on_many_files(fixtures_dir: Path) -> None:
+    paths = sorted(fixtures_dir.glob("*.ptir"))
+
+    async def read_all(path: Path) -> int:
+        async with await aio.open(path) as f:
+            ms = await f.measurements()
+            arrays = await asyncio.gather(*(m.read() for m in ms))
+            return sum(a.size for a in arrays)
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(read_all(p) for p in paths))
+
+    sizes = asyncio.run(main())
+    for p, size in zip(paths, sizes, strict=True):
+        with ptir5.open(p) as f:
+            assert size == sum(m.data.size for m in f.measurements)
+
+
+def test_calls_on_one_file_are_serialized(optir_spectrum_path: Path) -> None:
+    active = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with guard:
+            active -= 1
+
+    async def main() -> None:
+        executor = ThreadPoolExecutor(max_workers=4)
+        async with await aio.open(optir_spectrum_path, executor=executor) as f:
+            await asyncio.gather(*(f.run(work) for _ in range(6)))
+        executor.shutdown()
+
+    asyncio.run(main())
+    assert peak == 1
+
+
+def test_cancel_waits_for_running_call(optir_spectrum_path: Path) -> None:
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow() -> None:
+        started.set()
+        time.sleep(0.05)
+        finished.set()
+
+    async def main() -> None:
+        async with await aio.open(optir_spectrum_path) as f:
+            task = asyncio.create_task(f.run(slow))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # The running call was allowed to finish before the lock was released.
+            assert finished.is_set()
+            assert len(await f.measurements()) == 1
+
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""Tests for batch inspection commands and JSON Lines output."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import batch
+from ptir5.cli import main
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _reject_constant(name: str) -> None:
+    raise AssertionError(f"invalid JSON constant {name}")
+
+
+def _lines(capsys: pytest.CaptureFixture[str]) -> list[dict[str, Any]]:
+    # Strict parsing: NaN and Infinity would make the JSON Lines output invalid.
+    out = capsys.readouterr().out
+    return [json.loads(line, parse_constant=_reject_constant) for line in out.splitlines()]
+
+
+def test_iter_paths(tmp_path: Path, optir_spectrum_path: Path, hyperspectra_path: Path) -> None:
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    shutil.copy(optir_spectrum_path, nested / "one.ptir")
+    shutil.copy(hyperspectra_path, tmp_path / "two.ptir")
+    (tmp_path / "notes.txt").write_text("x")
+    found = list(batch.iter_paths([tmp_path, str(tmp_path / "**" / "*.ptir"), "missing.ptir"]))
+    assert sorted(found[:2]) == sorted([str(nested / "one.ptir"), str(tmp_path / "two.ptir")])
+    assert found[2:] == ["missing.ptir"]
+
+
+def test_ls_and_errors(
+    capsys: pytest.CaptureFixture[str], hyperspectra_path: Path, tmp_path: Path
+) -> None:
+    missing = tmp_path / "missing.ptir"
+    assert main(["ls", str(hyperspectra_path), str(missing), "-j", "1"]) == 1
+    ok, err = _lines(capsys)
+    assert ok["path"] == str(hyperspectra_path)
+    # GENERATED children are listed after their parent.
+    assert len(ok["measurements"]) == 3
+    assert ok["measurements"][0]["type"] == "OPTIRHyperspectra"
+    assert ok["measurements"][0]["shape"] == [574, 20, 20]
+    assert err["path"] == str(missing) and "error" in err
+
+
+def test_info_tree_parallel(
+    capsys: pytest.CaptureFixture[str], hyperspectra_path: Path, camera_image_path: Path
+) -> None:
+    paths = [str(hyperspectra_path), str(camera_image_path)]
+    assert main(["info", *paths, "-j", "2"]) == 0
+    records = {r["path"]: r for r in _lines(capsys)}
+    assert set(records) == set(paths)
+    info = records[str(hyperspectra_path)]
+    assert info["measurements"] == 1 and info["generated"] == 2
+    assert info["types"]["OPTIRHyperspectra"] == 1
+    assert info["logical_bytes"] == info["stored_bytes"]
+    assert main(["tree", str(camera_image_path), "-j", "1"]) == 0
+    (tree,) = _lines(capsys)
+    assert tree["tree"][0]["name"]
+
+
+def test_stats(capsys: pytest.CaptureFixture[str], flptir_stack_path: Path) -> None:
+    assert main(["stats", str(flptir_stack_path), "--bins", "8", "-j", "1"]) == 0
+    (record,) = _lines(capsys)
+    (row,) = record["measurements"]
+    assert len(row["histogram"]) == 8
+    assert "per_plane" not in row
+    with ptir5.open(flptir_stack_path) as f:
+        assert row["max"] == float(f.measurements[0].data.max())
+
+
+def test_stats_non_finite_is_null(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, write_measurement: Callable[..., Path]
+) -> None:
+    data = np.full((4, 3, 3), np.nan, dtype=np.float32)
+    path = write_measurement(tmp_path / "nan.ptir", data)
+    assert main(["stats", str(path), "-j", "1"]) == 0
+    (record,) = _lines(capsys)
+    (row,) = record["measurements"]
+    assert row["min"] is None and row["nan_count"] == 36
+    assert set(row["percentiles"].values()) == {None}
+
+
+def test_export(
+    capsys: pytest.CaptureFixture[str], optir_image_stack_path: Path, tmp_path: Path
+) -> None:
+    out = tmp_path / "out"
+    argv = ["export", str(optir_image_stack_path), "-o", str(out), "-j", "1"]
+    assert main(argv) == 0
+    (record,) = _lines(capsys)
+    with ptir5.open(optir_image_stack_path) as f:
+        m = f.measurements[0]
+        exported = np.load(out / optir_image_stack_path.stem / f"{m.guid}.npy")
+        np.testing.assert_array_equal(exported, m.data)
+        sidecar = json.loads((out / optir_image_stack_path.stem / f"{m.guid}.json").read_text())
+        assert sidecar["type"] == "OPTIRImageStack"
+    assert record["bytes"] > 0
+    # A second export refuses to overwrite unless asked.
+    assert main(argv) == 1
+    assert "FileExistsError" in _lines(capsys)[0]["error"]
+    assert main([*argv, "--overwrite"]) == 0
+
+
+def test_bench(capsys: pytest.CaptureFixture[str], hyperspectra_path: Path) -> None:
+    assert main(["bench", str(hyperspectra_path), "--samples", "2", "-j", "1"]) == 0
+    (record,) = _lines(capsys)
+    assert record["read_bytes"] > 0
+    assert set(record["sampled_s"]) >= {"spectra", "planes"}
+
+
+def test_run_validation() -> None:
+    with pytest.raises(ValueError):
+        list(batch.run("nope", []))
+    with pytest.raises(ValueError):
+        list(batch.run("ls", [], workers=0))
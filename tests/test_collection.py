@@ -0,0 +1,98 @@
+"""Tests for Collection and its bounded handle pool."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def fixture_paths(
+    optir_spectrum_path: Path,
+    raman_spectrum_path: Path,
+    optir_image_path: Path,
+    hyperspectra_path: Path,
+) -> list[Path]:
+    return [optir_spectrum_path, raman_spectrum_path, optir_image_path, hyperspectra_path]
+
+
+def _open_handles(c: ptir5.Collection) -> int:
+    return sum(1 for f in c._files.values() if f._reader._h5 is not None)
+
+
+def test_unified_enumeration(fixture_paths: list[Path]) -> None:
+    with ptir5.Collection(fixture_paths, max_open=2) as c:
+        assert len(c) == 4
+        guids = [m.guid for m in c.measurements]
+        expected = []
+        for p in fixture_paths:
+            with ptir5.open(p) as f:
+                expected += [m.guid for m in f.measurements]
+        assert guids == expected
+        assert len(c.measurements_by_type("OPTIRHyperspectra")) == 1
+
+
+def test_pool_never_exceeds_max_open(fixture_paths: list[Path]) -> None:
+    with ptir5.Collection(fixture_paths, max_open=2) as c:
+        for m in c.measurements:
+            m.data  # noqa: B018
+            assert _open_handles(c) <= 2
+        stats = c.stats
+        assert stats.open == 2
+        assert stats.opens == 4
+        assert stats.evictions >= 2
+
+
+def test_evicted_files_reopen_transparently(fixture_paths: list[Path]) -> None:
+    with ptir5.Collection(fixture_paths, max_open=1) as c:
+        first, last = c.measurements[0], c.measurements[-1]
+        expected = first.data
+        last.data  # noqa: B018
+        assert first._reader._h5 is None  # evicted by the last file
+        np.testing.assert_array_equal(first.data, expected)
+        assert c.stats.reopens >= 1
+
+
+def test_structure_survives_eviction(fixture_paths: list[Path]) -> None:
+    with ptir5.Collection(fixture_paths, max_open=1) as c:
+        c.measurements  # noqa: B018
+        with ptir5.trace() as t:
+            again = c.measurements
+        assert len(again) > 0
+        assert t.count("list") == 0
+        assert c.stats.reopens == 0
+
+
+def test_lookup_across_files(fixture_paths: list[Path], tmp_path: Path) -> None:
+    copy = tmp_path / "copy.ptir"
+    shutil.copy(fixture_paths[3], copy)
+    with ptir5.Collection([*fixture_paths, copy], max_open=2) as c:
+        with ptir5.open(fixture_paths[3]) as f:
+            guid = f.measurements[0].guid
+        assert c.locate(guid) == [str(fixture_paths[3]), str(copy)]
+        m = c.get_measurement(guid)
+        assert m._reader.path == str(fixture_paths[3])
+        with pytest.raises(ptir5.MeasurementNotFoundError):
+            c.get_measurement("00000000-0000-0000-0000-000000000000")
+
+
+def test_close_and_validation(fixture_paths: list[Path]) -> None:
+    with pytest.raises(ValueError):
+        ptir5.Collection(fixture_paths, max_open=0)
+    c = ptir5.Collection(fixture_paths, max_open=2)
+    m = c.measurements[0]
+    with pytest.raises(KeyError):
+        c.file("elsewhere.ptir")
+    c.close()
+    with pytest.raises(ptir5.FileClosedError):
+        m.data  # noqa: B018
+    with pytest.raises(ptir5.FileClosedError):
+        c.file(fixture_paths[0])
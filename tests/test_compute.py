@@ -0,0 +1,103 @@
+"""Tests for out-of-core map/reduce over measurement DATA."""
+
+from __future__ import annotations
+
+import functools
+import operator
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import compute
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _block_sum(block: np.ndarray[Any, Any]) -> float:
+    return float(block.sum(dtype=np.float64))
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_reduce_matches_numpy(chunked_cube_path: Path, backend: str) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        total = compute.map_blocks(
+            m, _block_sum, reduce=operator.add, workers=2, backend=backend,  # type: ignore[arg-type]
+            block_shape=(8, 12, 10),
+        )
+        assert total == pytest.approx(float(m.data.sum(dtype=np.float64)))
+
+
+def test_results_in_block_order(chunked_cube_path: Path) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        slices = compute.block_slices(m)
+        firsts = compute.map_blocks(m, lambda b: float(b.flat[0]), workers=4)
+        data = m.data
+    # Default blocks are whole chunk columns: (40, 6, 5).
+    assert len(slices) == len(firsts) == 2 * 2
+    assert firsts == [float(data[sel].flat[0]) for sel in slices]
+
+
+def test_tree_reduce_keeps_order(chunked_cube_path: Path) -> None:
+    calls: list[tuple[int, int]] = []
+
+    def concat(a: list[int], b: list[int]) -> list[int]:
+        calls.append((len(a), len(b)))
+        return a + b
+
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        n = len(compute.block_slices(m, (1, 12, 10)))
+        out = compute.map_blocks(
+            m, lambda b: [int(b[0, 0, 0])], reduce=concat, block_shape=(1, 12, 10), workers=3
+        )
+    assert out == [i * 120 for i in range(40)]
+    assert len(calls) == n - 1
+    # Balanced: no combine ever joins a single result onto a long run.
+    assert max(max(a, b) / min(a, b) for a, b in calls) <= 4
+
+
+def test_in_flight_bound(chunked_cube_path: Path) -> None:
+    lock = threading.Lock()
+    active = peak = 0
+
+    def slow(block: np.ndarray[Any, Any]) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return block.size
+
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        sizes = compute.map_blocks(m, slow, workers=8, max_in_flight=3)
+    assert sum(sizes) == 40 * 12 * 10
+    assert peak <= 3
+
+
+def test_errors(chunked_cube_path: Path) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        with pytest.raises(ValueError):
+            compute.map_blocks(m, _block_sum, backend="gpu")  # type: ignore[call-overload]
+        with pytest.raises(ValueError):
+            compute.map_blocks(m, _block_sum, workers=0)
+        with pytest.raises(ValueError):
+            compute.map_blocks(m, _block_sum, block_shape=(8, 12))
+        with pytest.raises(ZeroDivisionError):
+            compute.map_blocks(m, lambda b: 1 / 0, workers=2)
+    with ptir5.open(chunked_cube_path.read_bytes()) as f:
+        m = f.measurements[0]
+        with pytest.raises(ptir5.PTIR5Error):
+            compute.map_blocks(m, _block_sum, backend="process")
+        sums = compute.map_blocks(m, functools.partial(np.sum, dtype=np.float64), workers=2)
+        assert float(sum(sums)) == pytest.approx(float(m.data.sum(dtype=np.float64)))
@@ -0,0 +1,64 @@
+"""Tests for Dask-backed measurement DATA."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+da = pytest.importorskip("dask.array")
+
+
+def test_to_dask_matches_data(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        arr = m.to_dask()
+        assert arr.shape == (574, 20, 20)
+        assert arr.dtype == np.float32
+        np.testing.assert_array_equal(arr.compute(), m.data)
+
+
+def test_native_chunks_follow_hdf5_grid(chunked_cube_path: Path) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        arr = f.measurements[0].to_dask(chunks="native")
+        assert arr.chunksize == (8, 6, 5)
+        assert arr.numblocks == (5, 2, 2)
+
+
+def test_auto_chunks_are_multiples_of_hdf5_chunks(chunked_cube_path: Path) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        arr = f.measurements[0].to_dask()
+        for size, chunk, full in zip(arr.chunksize, (8, 6, 5), arr.shape, strict=True):
+            assert size % chunk == 0 or size == full
+
+
+def test_native_chunks_contiguous_use_planes(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        arr = f.measurements[0].to_dask(chunks="native")
+        assert arr.chunksize[1:] == (51, 51)
+
+
+def test_graph_is_picklable_and_process_scheduler(chunked_cube_path: Path) -> None:
+    with ptir5.open(chunked_cube_path) as f:
+        m = f.measurements[0]
+        expected = m.data
+        arr = m.to_dask(chunks="native")
+    # Computes after the original file is closed, from the path references alone.
+    arr = pickle.loads(pickle.dumps(arr))
+    result = (arr[:, 2:8, 3] * 2).compute(scheduler="processes", num_workers=2)
+    np.testing.assert_array_equal(result, expected[:, 2:8, 3] * 2)
+    ptir5.close_cached_files()
+
+
+def test_no_data_raises(tmp_path: Path, write_measurement: Callable[..., Path]) -> None:
+    path = write_measurement(tmp_path / "nodata.ptir", measurement_type="Unknown")
+    with ptir5.open(path) as f, pytest.raises(ValueError):
+        f.measurements[0].to_dask()
@@ -0,0 +1,132 @@
+"""Tests for opening PTIR5 files from file-like objects."""
+
+from __future__ import annotations
+
+import io
+import pickle
+import zipfile
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5._blockio import BlockCachedFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+fsspec = pytest.importorskip("fsspec")
+
+
+def _assert_same_contents(path: Path, f: ptir5.PTIR5File) -> None:
+    with ptir5.open(path) as ref:
+        assert [m.guid for m in f.measurements] == [m.guid for m in ref.measurements]
+        for m, expected in zip(f.measurements, ref.measurements, strict=True):
+            if expected.data is not None:
+                np.testing.assert_array_equal(m.data, expected.data)
+
+
+@pytest.mark.parametrize("block_size", [None, 4096])
+def test_local_fsspec(hyperspectra_path: Path, block_size: int | None) -> None:
+    fs = fsspec.filesystem("file")
+    with fs.open(str(hyperspectra_path), "rb") as fobj, ptir5.open(
+        fobj, block_size=block_size
+    ) as f:
+        assert f.path == str(hyperspectra_path)
+        _assert_same_contents(hyperspectra_path, f)
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        np.testing.assert_array_equal(m.read_image(3)[2:5, 1:4], m.data[3, 2:5, 1:4])
+        stats = f.block_cache_stats
+        if block_size is None:
+            assert stats is None
+        else:
+            assert stats is not None
+            assert stats["block_size"] == 4096
+            assert stats["source_reads"] < stats["hits"] + stats["misses"]
+
+
+def test_memory_fsspec(optir_image_path: Path) -> None:
+    fs = fsspec.filesystem("memory")
+    fs.pipe("/sample.ptir", optir_image_path.read_bytes())
+    with fs.open("/sample.ptir", "rb") as fobj, ptir5.open(fobj, block_size=1024) as f:
+        _assert_same_contents(optir_image_path, f)
+
+
+def test_zip_member(tmp_path: Path, optir_spectrum_path: Path) -> None:
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(optir_spectrum_path, "spectrum.ptir")
+    with zipfile.ZipFile(archive) as zf, zf.open("spectrum.ptir") as member, ptir5.open(
+        member, block_size=8192
+    ) as f:
+        _assert_same_contents(optir_spectrum_path, f)
+
+
+def test_lazy_views_and_refs(hyperspectra_path: Path) -> None:
+    with open(hyperspectra_path, "rb") as fobj, ptir5.open(fobj) as f:
+        m = f.measurements[0]
+        with pytest.raises(ptir5.PTIR5Error, match="not opened from a path"):
+            m.ref()
+        with pytest.raises(ptir5.PTIR5Error):
+            pickle.dumps(m)
+        with pytest.warns(RuntimeWarning, match="not opened from a path"):
+            stats = m.stats(cache=True)
+        assert stats.count == m.data.size
+        pytest.importorskip("dask.array")
+        arr = m.to_dask()
+        np.testing.assert_array_equal(arr[:, 4, 5].compute(), m.read_spectrum(5, 4))
+        with pytest.raises(TypeError):
+            pickle.dumps(arr)
+    assert not list(hyperspectra_path.parent.glob("*.stats.json"))
+
+
+def test_block_cached_file() -> None:
+    payload = bytes(range(256)) * 400
+    cached = BlockCachedFile(io.BytesIO(payload), block_size=1000, cache_size=3000)
+    for offset, size in [(0, 10), (995, 10), (5, 3), (102_300, 50), (50_000, 20_000), (0, 0)]:
+        cached.seek(offset)
+        assert cached.read(size) == payload[offset : offset + size]
+    cached.seek(-4, io.SEEK_END)
+    assert cached.read(100) == payload[-4:]
+    assert cached.read(1) == b""
+    stats = cached.stats()
+    assert stats["cached_blocks"] <= 3
+    assert stats["hits"] >= 1
+    # The 20 kB read bypasses the cache and is fetched in a single request.
+    assert stats["source_bytes"] < len(payload)
+    cached.close()
+    assert cached.closed
+
+
+@pytest.mark.parametrize("cache_size", [1000, 2500])
+def test_block_cached_file_cache_smaller_than_read(cache_size: int) -> None:
+    payload = bytes(range(256)) * 40
+    cached = BlockCachedFile(io.BytesIO(payload), block_size=1000, cache_size=cache_size)
+    # Reads spanning 2-4 blocks, more than the cache holds, still return every byte.
+    for offset, size in [(900, 200), (500, 2600), (1, 3998), (999, 3002), (2500, 600)]:
+        cached.seek(offset)
+        assert cached.read(size) == payload[offset : offset + size]
+    assert cached.stats()["cached_blocks"] <= cache_size // 1000
+
+
+def test_tiny_cache_through_open(hyperspectra_path: Path) -> None:
+    with open(hyperspectra_path, "rb") as fobj, ptir5.open(
+        fobj, block_size=4096, cache_size=4096
+    ) as f:
+        _assert_same_contents(hyperspectra_path, f)
+
+
+def test_block_cached_file_coalesces_runs() -> None:
+    source = io.BytesIO(b"x" * 10_000)
+    cached = BlockCachedFile(source, block_size=1000)
+    cached.seek(500)
+    cached.read(2000)
+    assert cached.stats()["source_reads"] == 1
+    assert cached.stats()["misses"] == 3
+    cached.seek(1500)
+    cached.read(100)
+    assert cached.stats()["source_reads"] == 1
+    with pytest.raises(ValueError):
+        BlockCachedFile(source, block_size=0)
@@ -0,0 +1,119 @@
+"""Tests for measurement and file content fingerprints."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import fingerprint as fp
+from ptir5._reader import HDF5Reader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    fp.clear_cache()
+    yield
+    fp.clear_cache()
+
+
+@pytest.fixture
+def write(write_measurement: Callable[..., Path]) -> Callable[..., Path]:
+    def write(path: Path, data: np.ndarray, xstart: float = 1000.0, **kwargs: object) -> Path:
+        return write_measurement(path, data, attrs={"XStart": xstart}, **kwargs)
+
+    return write
+
+
+def _cube() -> np.ndarray:
+    return np.arange(16 * 8 * 8, dtype=np.float32).reshape(16, 8, 8)
+
+
+def test_identical_copies_match(tmp_path: Path, hyperspectra_path: Path) -> None:
+    copy = tmp_path / "copy.ptir"
+    shutil.copy(hyperspectra_path, copy)
+    with ptir5.open(hyperspectra_path) as a, ptir5.open(copy) as b:
+        assert a.fingerprint() == b.fingerprint()
+        assert a.fingerprint(quick=True) == b.fingerprint(quick=True)
+        assert a.fingerprint() != a.fingerprint(quick=True)
+        ma, mb = a.measurements[0], b.measurements[0]
+        assert ma.fingerprint(workers=1) == mb.fingerprint(workers=4)
+        assert len(ma.fingerprint()) == 2 * fp.DIGEST_SIZE
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunks": (4, 8, 8), "shuffle": True}])
+def test_data_change_detected(
+    tmp_path: Path, write: Callable[..., Path], kwargs: dict[str, object]
+) -> None:
+    data = _cube()
+    a = write(tmp_path / "a.ptir", data, **kwargs)
+    data[7, 3, 3] += 1
+    b = write(tmp_path / "b.ptir", data, **kwargs)
+    with ptir5.open(a) as fa, ptir5.open(b) as fb:
+        ma, mb = fa.measurements[0], fb.measurements[0]
+        # Same structure, so only the full fingerprint tells them apart.
+        assert ma.fingerprint(quick=True) == mb.fingerprint(quick=True)
+        assert ma.fingerprint() != mb.fingerprint()
+
+
+def test_metadata_and_layout_change_quick(tmp_path: Path, write: Callable[..., Path]) -> None:
+    a = write(tmp_path / "a.ptir", _cube())
+    b = write(tmp_path / "b.ptir", _cube(), chunks=(4, 8, 8))
+    c = write(tmp_path / "c.ptir", _cube(), xstart=1001.0)
+    with ptir5.open(a) as fa, ptir5.open(b) as fb, ptir5.open(c) as fc:
+        quick = {f.fingerprint(quick=True) for f in (fa, fb, fc)}
+    assert len(quick) == 3
+
+
+def test_raw_chunks_not_decoded(tmp_path: Path, write: Callable[..., Path]) -> None:
+    path = write(tmp_path / "z.ptir", _cube(), chunks=(4, 8, 8), compression="gzip")
+    with ptir5.open(path) as f, ptir5.trace() as t:
+        f.measurements[0].fingerprint()
+    assert not [e for e in t.events if e.op.startswith("read_dataset")]
+
+
+def test_cache_by_size_and_mtime(
+    tmp_path: Path, write: Callable[..., Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = write(tmp_path / "a.ptir", _cube())
+    calls: list[str] = []
+    original = HDF5Reader.dataset_digest
+
+    def counting(self: HDF5Reader, p: str, workers: int) -> bytes:
+        calls.append(p)
+        return original(self, p, workers)
+
+    monkeypatch.setattr(HDF5Reader, "dataset_digest", counting)
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        first = m.fingerprint()
+        calls.clear()
+        assert m.fingerprint() == first
+        assert calls == []
+        assert m.fingerprint(cache=False) == first
+        assert len(calls) == 1
+    # Rewriting the values keeps the size but changes the mtime, so the cache misses.
+    data = _cube()
+    data[0, 0, 0] = -1
+    write(path, data)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    with ptir5.open(path) as f:
+        assert f.measurements[0].fingerprint() != first
+
+
+def test_in_memory_and_errors(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        expected = f.fingerprint()
+        with pytest.raises(ValueError):
+            f.fingerprint(workers=0)
+    with ptir5.open(hyperspectra_path.read_bytes()) as f:
+        assert f.fingerprint() == expected
@@ -0,0 +1,104 @@
+"""Tests for opening PTIR5 files from bytes and preloading them into memory."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import _reader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _first_data(path: Path) -> np.ndarray:
+    with ptir5.open(path) as f:
+        data = f.measurements[0].data
+        assert data is not None
+        return data
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_open_bytes(hyperspectra_path: Path, wrap: type) -> None:
+    raw = hyperspectra_path.read_bytes()
+    with ptir5.open(wrap(raw)) as f:
+        assert f.in_memory
+        assert f.path == f"<memory: {len(raw)} bytes>"
+        m = f.measurements[0]
+        np.testing.assert_array_equal(m.data, _first_data(hyperspectra_path))
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        np.testing.assert_array_equal(m.read_spectrum(3, 4), m.data[:, 4, 3])
+        with pytest.raises(ptir5.PTIR5Error, match="not opened from a path"):
+            m.ref()
+
+
+def test_bytes_are_copied(optir_spectrum_path: Path) -> None:
+    buf = bytearray(optir_spectrum_path.read_bytes())
+    with ptir5.open(buf) as f:
+        buf[:] = bytes(len(buf))
+        np.testing.assert_array_equal(
+            f.measurements[0].data, _first_data(optir_spectrum_path)
+        )
+
+
+def test_preload_survives_source_removal(tmp_path: Path, hyperspectra_path: Path) -> None:
+    path = tmp_path / "copy.ptir"
+    shutil.copy(hyperspectra_path, path)
+    expected = _first_data(path)
+    with ptir5.open(path, preload=True) as f:
+        assert f.in_memory
+        assert f.path == str(path)
+        path.unlink()
+        np.testing.assert_array_equal(f.measurements[0].data, expected)
+
+
+def test_preload_reopens_in_memory(tmp_path: Path, optir_image_path: Path) -> None:
+    with ptir5.open(optir_image_path, preload=True) as f:
+        reader = f._reader
+        assert reader.reopenable
+        reader.suspend()
+        np.testing.assert_array_equal(f.measurements[0].data, _first_data(optir_image_path))
+        assert reader.in_memory
+        ref = f.measurements[0].ref()
+        assert ref.path == str(optir_image_path)
+
+
+def test_preload_file_object(optir_spectrum_path: Path) -> None:
+    with open(optir_spectrum_path, "rb") as fobj, ptir5.open(fobj, preload=True) as f:
+        assert f.in_memory
+        assert f.block_cache_stats is None
+        np.testing.assert_array_equal(
+            f.measurements[0].data, _first_data(optir_spectrum_path)
+        )
+
+
+def test_auto_preload_threshold(
+    monkeypatch: pytest.MonkeyPatch, optir_spectrum_path: Path
+) -> None:
+    with ptir5.open(optir_spectrum_path, preload="auto") as f:
+        assert f.in_memory
+    monkeypatch.setattr(_reader, "AUTO_PRELOAD_SIZE", 16)
+    with ptir5.open(optir_spectrum_path, preload="auto") as f:
+        assert not f.in_memory
+    with ptir5.open(optir_spectrum_path) as f:
+        assert not f.in_memory
+
+
+def test_memory_caps(monkeypatch: pytest.MonkeyPatch, optir_spectrum_path: Path) -> None:
+    raw = optir_spectrum_path.read_bytes()
+    with pytest.raises(ptir5.PTIR5Error, match="in-memory limit"):
+        ptir5.open(optir_spectrum_path, preload=True, max_preload=1024)
+    with pytest.raises(ptir5.PTIR5Error, match="in-memory limit"):
+        ptir5.open(raw, max_preload=1024)
+    # "auto" falls back to reading from disk instead.
+    with ptir5.open(optir_spectrum_path, preload="auto", max_preload=1024) as f:
+        assert not f.in_memory
+    with ptir5.open(optir_spectrum_path, preload=True, max_preload=None) as f:
+        assert f.in_memory
+    monkeypatch.setattr(_reader, "_available_memory", lambda: 1024)
+    with pytest.raises(ptir5.PTIR5Error, match="available"):
+        ptir5.open(optir_spectrum_path, preload=True, max_preload=None)
@@ -0,0 +1,66 @@
+"""Tests for the unified GUID and label index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import ptir5
+from ptir5 import TreeFolder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_lookup_kinds_and_parents(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        cube = f.measurements[0]
+        entry = f.lookup(cube.guid)
+        assert entry.kind == "measurement" and entry.obj is cube
+        assert isinstance(entry.parent, TreeFolder)
+        assert entry.parent.name == "Hyperspectral Measurement"
+
+        for child in cube.generated:
+            g = f.lookup(child.guid)
+            assert g.kind == "generated" and g.obj is child and g.parent is cube
+
+        folder = f.lookup(entry.parent.guid or "")
+        assert folder.kind == "folder" and folder.obj is entry.parent
+        assert folder.parent is None
+        assert len(f.index) == 4
+        with pytest.raises(ptir5.MeasurementNotFoundError):
+            f.lookup("00000000-0000-0000-0000-000000000000")
+
+
+def test_backgrounds(camera_image_path: Path) -> None:
+    with ptir5.open(camera_image_path) as f:
+        bg = f.backgrounds[0]
+        entry = f.lookup(bg.guid)
+        assert entry.kind == "background" and entry.obj is bg
+        assert bg.guid in f.index
+        assert {e.kind for e in f.index} == {"measurement", "background", "folder"}
+
+
+def test_find_by_label(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        rois = f.find_by_label("ROI Spectrum 1")
+        assert len(rois) == 2 and all(e.kind == "generated" for e in rois)
+        # Case-insensitive, and globs use the sorted prefix.
+        assert f.find_by_label("roi spectrum 1") == rois
+        assert [e.label for e in f.find_by_label("o-ptir*")] == ["O-PTIR 1"]
+        assert {e.label for e in f.find_by_label("*1")} == {
+            "DC 1", "O-PTIR 1", "ROI Spectrum 1", "HSi Stack 1",
+        }
+        assert f.find_by_label("ROI") == []
+        assert f.find_by_label("HSi Stack ?")[0].kind == "folder"
+
+
+def test_index_is_built_once(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        index = f.index
+        with ptir5.trace() as t:
+            f.lookup(f.measurements[0].guid)
+            f.find_by_label("Mirage*")
+        assert f.index is index
+    assert t.events == []
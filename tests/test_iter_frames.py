@@ -0,0 +1,94 @@
+"""Tests for the background-prefetching frame iterator."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import ptir5
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _prefetch_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "ptir5-prefetch"]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_frames_match_data(flptir_stack_path: Path, prefetch: int) -> None:
+    with ptir5.open(flptir_stack_path) as f:
+        m = f.measurements[0]
+        data = m.data
+        got = [(i, frame.copy()) for i, frame in m.iter_frames(prefetch=prefetch)]
+    assert [i for i, _ in got] == list(range(data.shape[0]))
+    for i, frame in got:
+        np.testing.assert_array_equal(frame, data[i])
+
+
+def test_start_stop_step(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        m = f.measurements[0]
+        data = m.data
+        frames = {i: frame.copy() for i, frame in m.iter_frames(1, None, 2)}
+        assert [i for i, _ in m.iter_frames(-1, None, -1)] == list(range(data.shape[0]))[::-1]
+    assert list(frames) == list(range(1, data.shape[0], 2))
+    for i, frame in frames.items():
+        np.testing.assert_array_equal(frame, data[i])
+
+
+def test_buffers_are_reused(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        ids = {id(frame) for _, frame in m.iter_frames(0, 20, prefetch=2)}
+    assert len(ids) <= 3
+
+
+def test_back_pressure(hyperspectra_path: Path) -> None:
+    reads: list[int] = []
+
+    def hook(event: ptir5.IOEvent) -> None:
+        if event.op == "read_dataset_slice":
+            reads.append(1)
+
+    ptir5.add_io_hook(hook)
+    try:
+        with ptir5.open(hyperspectra_path) as f:
+            m = f.measurements[0]
+            it = m.iter_frames(prefetch=2)
+            next(it)
+            time.sleep(0.1)
+            # The consumer holds one frame; the producer may be two ahead.
+            assert len(reads) <= 3
+            it.close()
+    finally:
+        ptir5.remove_io_hook(hook)
+    assert not _prefetch_threads()
+
+
+def test_early_exit_and_errors(flptir_stack_path: Path) -> None:
+    with ptir5.open(flptir_stack_path) as f:
+        m = f.measurements[0]
+        for i, _ in m.iter_frames(prefetch=2):
+            if i == 1:
+                break
+        with pytest.raises(ValueError):
+            m.iter_frames(prefetch=-1)
+        with pytest.raises(ValueError):
+            m.iter_frames(step=0)
+    assert not _prefetch_threads()
+
+
+def test_read_error_propagates(flptir_stack_path: Path) -> None:
+    f = ptir5.open(flptir_stack_path)
+    m = f.measurements[0]
+    it: Any = m.iter_frames(prefetch=1)
+    # The producer starts on the first next(), after the file is gone.
+    f.close()
+    with pytest.raises(ptir5.FileClosedError):
+        next(it)
+    assert not _prefetch_threads()
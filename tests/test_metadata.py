@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import numpy as np
 
 import ptir5
+from ptir5._reader import HDF5Reader
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
 
@@ -101,10 +106,74 @@ def test_metadata_image_attributes(optir_image_path: Path) -> None:
 
 
 def test_metadata_cached(optir_spectrum_path: Path) -> None:
-    """Accessing metadata twice should return same cached dict."""
+    """Single keys are cached individually; iteration loads and caches everything."""
     with ptir5.open(optir_spectrum_path) as f:
         m = f.measurements[0]
         _ = m.metadata["TYPE"]
         _ = m.metadata["Label"]
-        # Internal cache should be populated after first access
+        assert m.metadata._cache is None
+        assert set(m.metadata._keys) == {"TYPE", "Label"}
+        _ = dict(m.metadata)
         assert m.metadata._cache is not None
+
+
+def test_single_key_does_not_load_all(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        with patch.object(HDF5Reader, "_read_all_attrs") as load_all:
+            assert m.label == "O-PTIR0 1"
+            assert m.metadata["Channel.Units"] == "mV"
+            assert "XStart" in m.metadata
+            assert "Missing" not in m.metadata
+            assert m.metadata.get("Missing", 5) == 5
+            load_all.assert_not_called()
+
+
+def test_single_key_matches_full_load(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        for m in (*f.measurements, *f.measurements[0].generated):
+            full = dict(m.metadata)
+            fresh = f._reader.build_metadata_view(m._hdf5_path)
+            for key, value in full.items():
+                assert fresh[key] == value
+
+
+def test_get_metadata_batch(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        labels = f.get_metadata("Label")
+        assert labels == {m.guid: m.label for m in f.measurements}
+        starts = f.get_metadata("XStart", include_generated=True)
+        assert len(starts) == 4
+        assert set(starts.values()) == {790.0}
+        assert f.get_metadata("Nope", default=0) == dict.fromkeys(labels, 0)
+
+
+def test_get_metadata_across_files(optir_image_stack_path: Path, hyperspectra_path: Path) -> None:
+    with ptir5.Collection([optir_image_stack_path, hyperspectra_path]) as c:
+        items = c.measurements
+        first = items[0]._reader
+        with ptir5.open(optir_image_stack_path) as f:
+            labels = f.get_metadata("Label", measurements=items)
+        assert labels == {m.guid: m.label for m in items}
+        assert any(m._reader is not first for m in items)
+
+
+def test_get_metadata_same_group_in_two_files(
+    tmp_path: Path, write_measurement: Callable[..., Path]
+) -> None:
+    data = np.zeros((2, 2, 2), dtype=np.float32)
+    a = write_measurement(tmp_path / "a.ptir", data, attrs={"Label": "from a"})
+    b = write_measurement(tmp_path / "b.ptir", data, attrs={"Label": "from b"})
+    with ptir5.open(a) as fa, ptir5.open(b) as fb:
+        (m,) = fb.measurements
+        # Same group path in both files: the value comes from b, not from fa.
+        assert fa.get_metadata("Label", measurements=[m]) == {m.guid: "from b"}
+        assert m.label == "from b"
+
+
+def test_get_metadata_primes_views(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        f.get_metadata("Label")
+        with patch.object(HDF5Reader, "read_attr") as read_attr:
+            _ = [m.label for m in f.measurements]
+            read_attr.assert_not_called()
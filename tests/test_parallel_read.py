@@ -0,0 +1,110 @@
+"""Tests for parallel chunk decoding with direct chunk reads."""
+
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5._filters import decode_chunk, unshuffle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _ops(t: ptir5.Trace) -> set[str]:
+    return {e.op for e in t.events if e.op.startswith("read_dataset")}
+
+
+@pytest.mark.parametrize(
+    ("dtype", "kwargs"),
+    [
+        ("<f4", {"compression": "gzip", "shuffle": True}),
+        (">i2", {"compression": "gzip", "compression_opts": 9, "shuffle": True}),
+        ("<f8", {"compression": "gzip"}),
+        ("u1", {"shuffle": True}),
+        ("<f4", {}),
+    ],
+)
+def test_matches_hdf5(
+    tmp_path: Path, write_measurement: Callable[..., Path], dtype: str, kwargs: dict[str, Any]
+) -> None:
+    rng = np.random.default_rng(0)
+    data = (rng.random((37, 21, 18)) * 100).astype(dtype)
+    # Chunks that do not divide the shape exercise the edge chunks.
+    path = write_measurement(tmp_path / "cube.ptir", data, chunks=(8, 5, 7), **kwargs)
+    with ptir5.open(path) as f, ptir5.trace() as t:
+        m = f.measurements[0]
+        out = m.read(workers=4)
+    assert out.dtype == data.dtype
+    np.testing.assert_array_equal(out, data)
+    assert _ops(t) == {"read_dataset_chunks"}
+    (event,) = [e for e in t.events if e.op == "read_dataset_chunks"]
+    assert event.chunks_touched == 5 * 5 * 3
+
+
+def test_unwritten_chunks_use_fill_value(
+    tmp_path: Path, write_measurement: Callable[..., Path]
+) -> None:
+    path = write_measurement(
+        tmp_path / "sparse.ptir", shape=(12, 6, 6), dtype="f4", chunks=(4, 6, 6),
+        compression="gzip", fillvalue=-1.0,
+    )
+    with h5py.File(path, "a") as f:
+        (g,) = f["MEASUREMENTS"].values()
+        g["DATA"][4:8] = 2.0
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        np.testing.assert_array_equal(m.read(workers=2), m.data)
+        assert m.read(workers=2)[0, 0, 0] == -1.0
+
+
+def test_filter_mask(tmp_path: Path, write_measurement: Callable[..., Path]) -> None:
+    """A chunk stored with its deflate step skipped is decoded without it."""
+    path = write_measurement(
+        tmp_path / "masked.ptir", shape=(1, 4, 8), dtype="<f4", chunks=(1, 4, 4),
+        compression="gzip", shuffle=True,
+    )
+    chunk = np.arange(16, dtype="<f4").reshape(4, 4)
+    with h5py.File(path, "a") as f:
+        (g,) = f["MEASUREMENTS"].values()
+        ds = g["DATA"]
+        shuffled = chunk.view(np.uint8).reshape(16, 4).T.tobytes()
+        ds.id.write_direct_chunk((0, 0, 0), zlib.compress(shuffled))
+        ds.id.write_direct_chunk((0, 0, 4), shuffled, filter_mask=0b10)
+    with ptir5.open(path) as f:
+        out = f.measurements[0].read(workers=2)
+    np.testing.assert_array_equal(out[0, :, :4], chunk)
+    np.testing.assert_array_equal(out[0, :, 4:], chunk)
+
+
+def test_fallbacks(
+    tmp_path: Path, hyperspectra_path: Path, write_measurement: Callable[..., Path]
+) -> None:
+    data = np.ones((6, 4, 4), dtype="f4")
+    lzf = write_measurement(tmp_path / "lzf.ptir", data, chunks=(2, 4, 4), compression="lzf")
+    for path in (hyperspectra_path, lzf):
+        with ptir5.open(path) as f, ptir5.trace() as t:
+            m = f.measurements[0]
+            np.testing.assert_array_equal(m.read(workers=3), m.data)
+        assert _ops(t) == {"read_dataset"}
+    with ptir5.open(lzf) as f:
+        m = f.measurements[0]
+        np.testing.assert_array_equal(m.read(), m.data)
+        with pytest.raises(ValueError):
+            m.read(workers=0)
+
+
+def test_decode_helpers() -> None:
+    values = np.arange(10, dtype="<i4")
+    shuffled = values.view(np.uint8).reshape(10, 4).T.tobytes()
+    assert unshuffle(shuffled + b"xy", 4) == values.tobytes() + b"xy"
+    assert unshuffle(b"abc", 1) == b"abc"
+    assert decode_chunk(zlib.compress(shuffled), (2, 1), 0, 4) == values.tobytes()
+    with pytest.raises(ValueError):
+        decode_chunk(b"", (32000,), 0, 4)
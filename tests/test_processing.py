@@ -0,0 +1,165 @@
+"""Tests for ptir5.processing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import h5py
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5.processing import resample
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _spectrum(h5: h5py.File, guid: str, data: np.ndarray, start: float, step: float) -> None:
+    g = h5.create_group(f"MEASUREMENTS/{guid}")
+    g.attrs["TYPE"] = np.bytes_(b"OPTIRSpectrum")
+    g.attrs["XStart"] = np.array([start], dtype=np.float32)
+    g.attrs["XIncrement"] = np.array([step], dtype=np.float32)
+    g.create_dataset("DATA", data=data.astype(np.float32))
+
+
+@pytest.fixture
+def mixed_axes_path(tmp_path: Path) -> Path:
+    """Three spectra on two different axes; values are linear in wavenumber."""
+    path = tmp_path / "mixed.ptir"
+    with h5py.File(path, "w") as h5:
+        x1 = 1000 + 2.0 * np.arange(100)
+        x2 = 1050 + 0.5 * np.arange(200)
+        _spectrum(h5, "00000000-0000-0000-0000-000000000001", x1 * 2, 1000, 2.0)
+        _spectrum(h5, "00000000-0000-0000-0000-000000000002", x2 * 3, 1050, 0.5)
+        _spectrum(h5, "00000000-0000-0000-0000-000000000003", x1 * -1, 1000, 2.0)
+    return path
+
+
+def test_resample_spectra_groups(mixed_axes_path: Path) -> None:
+    grid = np.linspace(1060, 1140, 41)
+    with ptir5.open(mixed_axes_path) as f:
+        ms = sorted(f.measurements, key=lambda m: m.guid)
+        out = resample(ms, grid)
+    assert [a.shape for a in out] == [(41,)] * 3
+    np.testing.assert_allclose(out[0], grid * 2, rtol=1e-5)
+    np.testing.assert_allclose(out[1], grid * 3, rtol=1e-5)
+    np.testing.assert_allclose(out[2], -grid, rtol=1e-5)
+
+
+def test_out_of_range_is_filled(mixed_axes_path: Path) -> None:
+    grid = np.array([900.0, 1000.0, 1198.0, 1300.0])
+    with ptir5.open(mixed_axes_path) as f:
+        m = f.get_measurement("00000000-0000-0000-0000-000000000001")
+        (out,) = resample([m], grid)
+        (zeros,) = resample([m], grid, fill=0.0)
+        data = m.data
+    assert np.isnan(out[[0, 3]]).all()
+    np.testing.assert_allclose(out[1:3], data[[0, -1]])
+    assert zeros[0] == 0.0
+
+
+def test_exact_grid_points_match_data(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        (out,) = resample([m], m.x_values)
+        np.testing.assert_allclose(out, m.data, rtol=1e-6)
+
+
+def test_resample_hypercube_matches_per_pixel(hyperspectra_path: Path) -> None:
+    grid = np.linspace(1000, 1200, 37)
+    with ptir5.open(hyperspectra_path) as f:
+        cube = f.measurements[0]
+        with ptir5.trace() as t:
+            (out,) = resample([cube], grid)
+        data = cube.data
+        x = cube.x_values
+    assert out.shape == (37, 20, 20)
+    for y, xpix in [(0, 0), (5, 17), (19, 19)]:
+        expected = np.interp(grid, x, data[:, y, xpix])
+        np.testing.assert_allclose(out[:, y, xpix], expected, rtol=1e-5)
+    # Only the planes covering 1000-1200 cm-1 are read.
+    assert t.summary()["read_dataset_slice"]["elements"] < data.size
+
+
+def test_nan_does_not_spread(tmp_path: Path) -> None:
+    path = tmp_path / "nan.ptir"
+    data = np.arange(10, dtype=np.float32)
+    data[5] = np.nan
+    with h5py.File(path, "w") as h5:
+        _spectrum(h5, "00000000-0000-0000-0000-000000000001", data, 0, 1)
+    with ptir5.open(path) as f:
+        (out,) = resample(f.measurements, [1.5, 4.0, 4.5, 6.0, 7.5])
+    np.testing.assert_array_equal(np.isnan(out), [False, False, True, False, False])
+
+
+def test_rejects_images(optir_image_path: Path) -> None:
+    with ptir5.open(optir_image_path) as f, pytest.raises(TypeError):
+        resample(f.measurements, [1.0, 2.0])
+
+
+@pytest.fixture
+def padded_axes_path(tmp_path: Path) -> Path:
+    """Spectra with a common step but different starts and lengths."""
+    path = tmp_path / "padded.ptir"
+    with h5py.File(path, "w") as h5:
+        _spectrum(h5, "00000000-0000-0000-0000-000000000001", np.arange(10), 1000, 2.0)
+        _spectrum(h5, "00000000-0000-0000-0000-000000000002", np.arange(5), 1004, 2.0)
+        _spectrum(h5, "00000000-0000-0000-0000-000000000003", np.arange(12), 1000, 2.0)
+    return path
+
+
+class TestSpectraMatrix:
+    def test_exact_reads_into_rows(self, padded_axes_path: Path) -> None:
+        guids = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000001"]
+        with ptir5.open(padded_axes_path) as f, ptir5.trace() as t:
+            result = f.spectra_matrix(guids)
+        data, x, index = result
+        assert data.shape == (2, 10)
+        np.testing.assert_array_equal(data[1], np.arange(10))
+        np.testing.assert_allclose(x, 1000 + 2.0 * np.arange(10))
+        assert index == guids
+        assert t.count("read_dataset_into") == 2
+        assert t.count("read_dataset") == 0
+
+    def test_exact_reports_mismatch(self, padded_axes_path: Path) -> None:
+        with ptir5.open(padded_axes_path) as f, pytest.raises(ValueError, match="5 points"):
+            f.spectra_matrix("OPTIRSpectrum")
+
+    def test_pad(self, padded_axes_path: Path) -> None:
+        with ptir5.open(padded_axes_path) as f:
+            result = f.spectra_matrix("OPTIRSpectrum", align="pad")
+        by_guid = dict(zip(result.guids, result.data, strict=True))
+        assert result.data.shape == (3, 12)
+        np.testing.assert_allclose(result.x, 1000 + 2.0 * np.arange(12))
+        short = by_guid["00000000-0000-0000-0000-000000000002"]
+        np.testing.assert_array_equal(short[2:7], np.arange(5))
+        assert np.isnan(short[:2]).all() and np.isnan(short[7:]).all()
+
+    def test_pad_needs_common_step(self, mixed_axes_path: Path) -> None:
+        with ptir5.open(mixed_axes_path) as f, pytest.raises(ValueError, match="x_increment"):
+            f.spectra_matrix("OPTIRSpectrum", align="pad")
+
+    def test_resample_matches_resample(self, mixed_axes_path: Path) -> None:
+        grid = np.linspace(1060, 1140, 41)
+        with ptir5.open(mixed_axes_path) as f:
+            result = f.spectra_matrix("OPTIRSpectrum", align="resample", grid=grid)
+            expected = resample([f.get_measurement(g) for g in result.guids], grid)
+        np.testing.assert_allclose(result.data, np.stack(expected))
+        np.testing.assert_array_equal(result.x, grid)
+
+    def test_type_includes_generated(self, hyperspectra_path: Path) -> None:
+        with ptir5.open(hyperspectra_path) as f:
+            result = f.spectra_matrix("GeneratedSpectrum")
+            child = next(
+                c for c in f.measurements[0].generated if isinstance(c, ptir5.FloatSpectrum1D)
+            )
+            np.testing.assert_array_equal(result.data[0], child.data)
+        assert result.guids == [child.guid]
+
+    def test_unknown_guid_and_bad_align(self, padded_axes_path: Path) -> None:
+        with ptir5.open(padded_axes_path) as f:
+            with pytest.raises(ptir5.MeasurementNotFoundError):
+                f.spectra_matrix(["nope"])
+            with pytest.raises(ValueError, match="align"):
+                f.spectra_matrix("OPTIRSpectrum", align="stretch")
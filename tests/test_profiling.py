@@ -0,0 +1,61 @@
+"""Tests for phase-by-phase open profiling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import ptir5
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_profile_open_reports_phases(hyperspectra_path: Path) -> None:
+    report = ptir5.profile_open(hyperspectra_path)
+    assert isinstance(report, ptir5.ProfileReport)
+    for name in ("open", "guid_listing", "construct", "generated", "tree", "metadata"):
+        assert name in report.phases
+    assert report.phases["construct"].calls == 1
+    assert report.phases["generated"].hdf5_total > 0
+    assert report.phases["metadata"].hdf5_ops["read_attrs"] == 3
+    assert sum(p.seconds for p in report.phases.values()) <= report.total_s
+
+
+def test_profile_by_type_and_slowest(hyperspectra_path: Path) -> None:
+    report = ptir5.profile_open(hyperspectra_path)
+    by_type = report.by_type()
+    assert by_type["OPTIRHyperspectra"]["count"] == 1
+    assert by_type["GeneratedSpectrum"]["count"] == 1
+    slowest = report.slowest(2)
+    assert len(slowest) == 2
+    assert slowest[0].total_s >= slowest[1].total_s
+    assert report.to_dict(top=1)["slowest"][0]["guid"] == slowest[0].guid
+    assert "slowest measurements" in report.format()
+
+
+def test_open_with_profile_keeps_file_loaded(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path, profile=True) as f:
+        assert f.profile is not None
+        assert f.tree is not None
+        assert len(f.measurements) == 2
+        assert f.profile.phases["tree_nodes"].calls == 2
+        assert f.measurements[0].label == "DC 1"
+
+
+def test_open_without_profile(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        assert f.profile is None
+
+
+def test_profile_removes_hook(optir_spectrum_path: Path) -> None:
+    from ptir5 import tracing
+
+    ptir5.profile_open(optir_spectrum_path)
+    assert tracing._hooks == ()
+
+
+def test_profile_open_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(OSError):
+        ptir5.profile_open(tmp_path / "missing.ptir")
@@ -0,0 +1,134 @@
+"""Tests for picklable measurement references and fork safety."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import MeasurementNotFoundError, MeasurementRef
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+needs_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method not available",
+)
+
+
+def _data_sum(ref: MeasurementRef) -> float:
+    return float(ref.open().data.sum())
+
+
+def _measurement_sum(m: ptir5.Measurement) -> float:
+    return float(m.data.sum())
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    ptir5.close_cached_files()
+
+
+def test_ref_fields(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        ref = m.ref()
+        assert ref.path == str(hyperspectra_path)
+        assert ref.hdf5_path == f"MEASUREMENTS/{m.guid}"
+        assert ref.guid == m.guid
+        assert ref.measurement_type == "OPTIRHyperspectra"
+        assert ref.shape == (574, 20, 20)
+        assert np.dtype(ref.dtype) == np.float32
+
+
+def test_ref_path_is_absolute(
+    hyperspectra_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(hyperspectra_path.parent)
+    with ptir5.open(hyperspectra_path.name) as f:
+        ref = f.measurements[0].ref()
+    assert ref.path == str(hyperspectra_path)
+    # A worker started from another directory still resolves it.
+    monkeypatch.chdir(tmp_path)
+    try:
+        assert ref.open().data.shape == (574, 20, 20)
+    finally:
+        ptir5.close_cached_files()
+
+
+def test_ref_pickle_roundtrip_and_open(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        gen = f.measurements[0].generated[0]
+        ref = pickle.loads(pickle.dumps(gen.ref()))
+        expected = gen.data
+    m = ref.open()
+    assert type(m) is type(gen)
+    np.testing.assert_array_equal(m.data, expected)
+
+
+def test_open_reuses_cached_handle(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        refs = [m.ref() for m in f.measurements]
+    a, b = (r.open() for r in refs)
+    assert a._reader is b._reader
+    assert refs[0].open() is a
+
+
+def test_missing_path_raises(optir_spectrum_path: Path) -> None:
+    ref = MeasurementRef(
+        str(optir_spectrum_path), "MEASUREMENTS/nope", "nope", "OPTIRSpectrum", None, None
+    )
+    with pytest.raises(MeasurementNotFoundError):
+        ref.open()
+
+
+def test_measurement_pickles_as_ref(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        clone = pickle.loads(pickle.dumps(m))
+        assert clone.guid == m.guid
+        np.testing.assert_array_equal(clone.data, m.data)
+
+
+@pytest.mark.parametrize("method", ["spawn", pytest.param("fork", marks=needs_fork)])
+def test_process_pool_with_refs(optir_image_stack_path: Path, method: str) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        refs = [m.ref() for m in f.measurements]
+        expected = [float(m.data.sum()) for m in f.measurements]
+    ctx = multiprocessing.get_context(method)
+    with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as pool:
+        assert list(pool.map(_data_sum, refs)) == pytest.approx(expected)
+
+
+_inherited: list[ptir5.Measurement] = []
+
+
+def _sum_inherited(queue: multiprocessing.Queue[float]) -> None:
+    queue.put(float(_inherited[0].data.sum()))
+
+
+@needs_fork
+def test_inherited_reader_reopens_after_fork(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        expected = float(m.data.sum())
+        parent_handle = m._reader._h5
+        _inherited[:] = [m]
+        ctx = multiprocessing.get_context("fork")
+        queue: multiprocessing.Queue[float] = ctx.Queue()
+        proc = ctx.Process(target=_sum_inherited, args=(queue,))
+        proc.start()
+        result = queue.get(timeout=30)
+        proc.join(timeout=30)
+        _inherited.clear()
+        assert proc.exitcode == 0
+        assert result == pytest.approx(expected)
+        # The parent's handle is untouched and still usable.
+        assert m._reader._h5 is parent_handle
+        assert float(m.data.sum()) == pytest.approx(expected)
@@ -0,0 +1,91 @@
+"""Tests for region-of-interest reads in physical and pixel units."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def grid_image_path(tmp_path: Path, write_measurement: Callable[..., Path]) -> Path:
+    """A 40x20 (width x height) float image, 2 um per pixel."""
+    return write_measurement(
+        tmp_path / "grid.ptir",
+        np.arange(20 * 40, dtype=np.float32).reshape(20, 40),
+        "OPTIRImage",
+        {"ImageWidth": 80.0, "ImageHeight": 40.0},
+    )
+
+
+def test_physical_window(
+    grid_image_path: Path, elements_read: Callable[[ptir5.Trace], int]
+) -> None:
+    with ptir5.open(grid_image_path) as f:
+        m = f.measurements[0]
+        data = m.data
+        with ptir5.trace() as t:
+            region = m.read_region(10.0, 4.0, 8.0, 6.0)
+        # Partially covered edge pixels are included.
+        partial = m.read_region(11.0, 4.5, 2.0, 1.0)
+    np.testing.assert_array_equal(region, data[2:5, 5:9])
+    assert elements_read(t) == region.size
+    np.testing.assert_array_equal(partial, data[2:3, 5:7])
+
+
+def test_pixel_window_and_clipping(grid_image_path: Path) -> None:
+    with ptir5.open(grid_image_path) as f:
+        m = f.measurements[0]
+        data = m.data
+        np.testing.assert_array_equal(m.read_region_px(3, 1, 4, 2), data[1:3, 3:7])
+        np.testing.assert_array_equal(m.read_region_px(35, -5, 10, 8), data[0:3, 35:40])
+        np.testing.assert_array_equal(m.read_region(70.0, 30.0, 50.0, 50.0), data[15:, 35:])
+        with pytest.raises(ValueError):
+            m.read_region_px(50, 0, 4, 4)
+        with pytest.raises(ValueError):
+            m.read_region_px(0, 0, 0, 4)
+        with pytest.raises(ValueError):
+            m.read_region(0.0, 0.0, -1.0, 1.0)
+
+
+def test_stacks_and_cubes(
+    hyperspectra_path: Path, flptir_stack_path: Path, elements_read: Callable[[ptir5.Trace], int]
+) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        data = m.data
+        with ptir5.trace() as t:
+            region = m.read_region_px(2, 5, 3, 4)
+        np.testing.assert_array_equal(region, data[:, 5:9, 2:5])
+        assert elements_read(t) == m.num_points * 12
+    with ptir5.open(flptir_stack_path) as f:
+        m = f.measurements[0]
+        sx = m.image_width_um / m.pixel_width
+        region = m.read_region(10 * sx, 20 * sx, 16 * sx, 8 * sx)
+        np.testing.assert_array_equal(region, m.data[:, 20:28, 10:26, :])
+
+
+def test_byte_image(camera_image_path: Path) -> None:
+    with ptir5.open(camera_image_path) as f:
+        m = f.measurements[0]
+        region = m.read_region_px(100, 50, 30, 20)
+        assert region.shape == (20, 30, m.bytes_per_pixel)
+        np.testing.assert_array_equal(region, m.data[50:70, 100:130])
+
+
+def test_missing_physical_size(tmp_path: Path, write_measurement: Callable[..., Path]) -> None:
+    path = write_measurement(
+        tmp_path / "nosize.ptir", np.zeros((4, 4), dtype=np.float32), "OPTIRImage"
+    )
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        with pytest.raises(ValueError, match="physical"):
+            m.read_region(0.0, 0.0, 1.0, 1.0)
+        assert m.read_region_px(0, 0, 2, 2).shape == (2, 2)
@@ -0,0 +1,126 @@
+"""Tests for rewriting files with a new DATA chunk layout."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5.cli import main
+from ptir5.enums import DataShape
+from ptir5.repack import layout_chunks, parse_compression, repack
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _snapshot(path: Path) -> dict[str, Any]:
+    """Every object's attributes (value and HDF5 type) and every dataset's contents."""
+    out: dict[str, Any] = {}
+    with h5py.File(path, "r") as f:
+
+        def attrs(obj: Any) -> dict[str, Any]:
+            return {
+                k: (repr(obj.attrs[k]), str(obj.attrs.get_id(k).dtype)) for k in obj.attrs
+            }
+
+        def visit(name: str, obj: Any) -> None:
+            data = obj[()].tobytes() if isinstance(obj, h5py.Dataset) else None
+            out[name] = (type(obj).__name__, attrs(obj), data)
+
+        out["/"] = ("Group", attrs(f), None)
+        f.visititems(visit)
+    return out
+
+
+@pytest.mark.parametrize("layout", ["pixel", "plane", "balanced"])
+def test_repack_preserves_contents(
+    tmp_path: Path, hyperspectra_path: Path, layout: str
+) -> None:
+    dst = tmp_path / "out.ptir"
+    digest = _digest(hyperspectra_path)
+    report = repack(hyperspectra_path, dst, layout=layout, benchmark=False)  # type: ignore[arg-type]
+    assert _digest(hyperspectra_path) == digest
+    assert _snapshot(dst) == _snapshot(hyperspectra_path)
+    assert len(report.after) == 3
+    with ptir5.open(dst) as f, ptir5.open(hyperspectra_path) as src:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        np.testing.assert_array_equal(m.data, src.measurements[0].data)
+        np.testing.assert_array_equal(m.read_spectrum(2, 3), src.measurements[0].data[:, 3, 2])
+        assert dict(m.metadata) == dict(src.measurements[0].metadata)
+        assert f.has_tree == src.has_tree
+        chunks = m._reader.dataset_chunks(f"{m._hdf5_path}/DATA")
+    assert chunks is not None
+    if layout == "pixel":
+        assert chunks[0] == 574
+    elif layout == "plane":
+        assert chunks == (1, 20, 20)
+    else:
+        assert 1 < chunks[0] < 574
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"), [("gzip:6", ("gzip", 6)), ("none", (None, None)), ("lzf", ("lzf", None))]
+)
+def test_compression(
+    tmp_path: Path, flptir_stack_path: Path, spec: str, expected: tuple[Any, Any]
+) -> None:
+    assert parse_compression(spec) == expected
+    dst = tmp_path / "stack.ptir"
+    report = repack(flptir_stack_path, dst, layout="pixel", compression=spec, benchmark=False)
+    (after,) = report.after
+    assert (after.compression, after.compression_opts) == expected
+    assert after.chunks is not None and after.chunks[0] == 5 and after.chunks[-1] == 4
+    with ptir5.open(dst) as f, ptir5.open(flptir_stack_path) as src:
+        np.testing.assert_array_equal(f.measurements[0].data, src.measurements[0].data)
+
+
+def test_bad_compression() -> None:
+    for spec in ("zstd", "gzip:12", "lzf:3", "none:1"):
+        with pytest.raises(ValueError):
+            parse_compression(spec)
+
+
+def test_layout_chunks() -> None:
+    cube = (400, 256, 256)
+    assert layout_chunks(cube, 4, DataShape.FLOAT_HYPERCUBE_3D, "plane") == (1, 256, 256)
+    pixel = layout_chunks(cube, 4, DataShape.FLOAT_HYPERCUBE_3D, "pixel")
+    assert pixel[0] == 400 and np.prod(pixel) * 4 <= 256 * 1024
+    assert layout_chunks((1019,), 4, DataShape.FLOAT_SPECTRUM_1D, "pixel") == (1019,)
+    rgba = layout_chunks((300, 400, 4), 1, DataShape.BYTE_IMAGE_2D, "balanced")
+    assert len(rgba) == 3 and rgba[-1] == 4
+    with pytest.raises(ValueError):
+        layout_chunks(cube, 4, DataShape.FLOAT_HYPERCUBE_3D, "rows")  # type: ignore[arg-type]
+
+
+def test_destination_checks(tmp_path: Path, optir_image_path: Path) -> None:
+    with pytest.raises(ValueError, match="source"):
+        repack(optir_image_path, optir_image_path, overwrite=True)
+    dst = tmp_path / "image.ptir"
+    dst.write_bytes(b"")
+    with pytest.raises(FileExistsError):
+        repack(optir_image_path, dst)
+    report = repack(optir_image_path, dst, overwrite=True)
+    assert set(report.read_s) == {"images"}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_cli(
+    tmp_path: Path, hyperspectra_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    dst = tmp_path / "cli.ptir"
+    argv = ["repack", str(hyperspectra_path), str(dst), "--layout", "pixel"]
+    assert main([*argv, "--compression", "gzip:1"]) == 0
+    out = capsys.readouterr().out
+    assert "layout=pixel" in out and "spectra" in out and "planes" in out
+    with ptir5.open(dst) as f:
+        assert len(f.measurements) == 1
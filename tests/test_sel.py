@@ -0,0 +1,97 @@
+"""Tests for wavenumber-indexed selection on spectra and hypercubes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5.models import FloatHypercube3D, FloatSpectrum1D
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def test_cube_scalar_nearest(
+    hyperspectra_path: Path, elements_read: Callable[[ptir5.Trace], int]
+) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, FloatHypercube3D)
+        x = m.x_values
+        data = m.data
+        npix = m.pixel_height * m.pixel_width
+        with ptir5.trace() as t:
+            plane = m.sel(x[100] + 0.3 * m.x_increment)
+    np.testing.assert_array_equal(plane, data[100])
+    assert elements_read(t) == npix
+
+
+def test_cube_scalar_linear(
+    hyperspectra_path: Path, elements_read: Callable[[ptir5.Trace], int]
+) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, FloatHypercube3D)
+        x = m.x_values
+        data = m.data.astype(np.float64)
+        npix = m.pixel_height * m.pixel_width
+        with ptir5.trace() as t:
+            plane = m.sel(x[10] + 0.25 * m.x_increment, method="linear")
+        exact = m.sel(float(x[10]), method="linear")
+    np.testing.assert_allclose(plane, 0.75 * data[10] + 0.25 * data[11], rtol=1e-5)
+    assert elements_read(t) == 2 * npix
+    np.testing.assert_array_equal(exact, data[10].astype(np.float32))
+
+
+def test_cube_band_reads_only_covered_planes(
+    hyperspectra_path: Path, elements_read: Callable[[ptir5.Trace], int]
+) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, FloatHypercube3D)
+        x = m.x_values
+        data = m.data
+        lo, hi = float(x[200]), float(x[219])
+        npix = m.pixel_height * m.pixel_width
+        with ptir5.trace() as t:
+            band = m.sel(slice(lo, hi))
+        # Bounds are inclusive and may be given in either order.
+        assert m.wavenumber_slice(hi, lo) == slice(200, 220)
+        assert m.wavenumber_slice(None, lo) == slice(0, 201)
+        assert m.wavenumber_slice(x[-1] + 100, None) == slice(0, 0)
+    np.testing.assert_array_equal(band, data[200:220])
+    assert elements_read(t) == 20 * npix
+
+
+def test_spectrum(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, FloatSpectrum1D)
+        x = m.x_values
+        y = m.data
+        assert m.sel(float(x[3])) == y[3]
+        np.testing.assert_array_equal(m.sel(slice(x[3], x[7])), y[3:8])
+        with pytest.raises(ValueError):
+            m.sel(float(x[-1]) + 10 * abs(m.x_increment))
+        with pytest.raises(ValueError):
+            m.sel(slice(x[0], x[5], 2))
+        with pytest.raises(ValueError):
+            m.sel(float(x[0]), method="cubic")  # type: ignore[arg-type]
+
+
+def test_descending_axis(tmp_path: Path, write_measurement: Callable[..., Path]) -> None:
+    data = np.arange(10 * 2 * 3, dtype=np.float32).reshape(10, 2, 3)
+    path = write_measurement(
+        tmp_path / "desc.ptir", data, attrs={"XStart": 1800.0, "XIncrement": -50.0}
+    )
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, FloatHypercube3D)
+        assert m.wavenumber_slice(1600, 1700) == slice(2, 5)
+        np.testing.assert_array_equal(m.sel(slice(1600, 1700)), data[2:5])
+        np.testing.assert_array_equal(m.sel(1724), data[2])
+        np.testing.assert_allclose(m.sel(1725, method="linear"), (data[1] + data[2]) / 2)
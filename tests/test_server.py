@@ -0,0 +1,191 @@
+"""Tests for the local tile/spectrum server."""
+
+from __future__ import annotations
+
+import http.client
+import io
+import json
+import struct
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5.cli import build_parser
+from ptir5.models import FloatHypercube3D
+from ptir5.server import TileServer, make_server
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def server(
+    hyperspectra_path: Path, flptir_stack_path: Path, optir_spectrum_path: Path
+) -> Iterator[TileServer]:
+    srv = make_server([hyperspectra_path, flptir_stack_path, optir_spectrum_path], port=0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def conn(server: TileServer) -> Iterator[http.client.HTTPConnection]:
+    host, port = server.server_address[:2]
+    c = http.client.HTTPConnection(str(host), port, timeout=10)
+    yield c
+    c.close()
+
+
+def _get(c: http.client.HTTPConnection, url: str) -> tuple[int, str, bytes]:
+    c.request("GET", url)
+    r = c.getresponse()
+    return r.status, r.getheader("Content-Type", ""), r.read()
+
+
+def _json(c: http.client.HTTPConnection, url: str) -> Any:
+    status, ctype, body = _get(c, url)
+    assert status == 200, body
+    assert ctype == "application/json"
+    return json.loads(body)
+
+
+def _npy(c: http.client.HTTPConnection, url: str) -> np.ndarray[Any, Any]:
+    status, ctype, body = _get(c, url)
+    assert status == 200, body
+    assert ctype == "application/x-npy"
+    return np.load(io.BytesIO(body))
+
+
+def test_structure_routes(conn: http.client.HTTPConnection, hyperspectra_path: Path) -> None:
+    files = _json(conn, "/files")
+    assert [f["id"] for f in files] == [0, 1, 2]
+    measurements = _json(conn, "/files/0/measurements")
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert measurements[0]["guid"] == m.guid
+        assert measurements[0]["shape"] == [574, 20, 20]
+        tree = _json(conn, "/files/0/tree")
+        assert tree is None or isinstance(tree, list)
+        metadata = _json(conn, f"/files/0/measurements/{m.guid}/metadata")
+        assert metadata["Label"] == m.label
+
+
+def test_planes_spectra_and_bands(
+    conn: http.client.HTTPConnection, hyperspectra_path: Path
+) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        base = f"/files/0/measurements/{m.guid}"
+        np.testing.assert_array_equal(_npy(conn, f"{base}/image/10"), m.read_image(10))
+        tile = _npy(conn, f"{base}/image/10?x0=4&y0=2&w=5&h=3")
+        np.testing.assert_array_equal(tile, m.read_image(10)[2:5, 4:9])
+        spectrum = _npy(conn, f"{base}/spectrum?x=3&y=7")
+        np.testing.assert_array_equal(spectrum, m.read_spectrum(3, 7))
+        band = _npy(conn, f"{base}/band?wavenumber={m.x_start + 20 * m.x_increment}")
+        np.testing.assert_array_equal(band, m.read_image(20))
+        as_json = _json(conn, f"{base}/spectrum?x=0&y=0&format=json")
+        assert len(as_json["x"]) == len(as_json["y"]) == 574
+
+
+def test_png(conn: http.client.HTTPConnection, flptir_stack_path: Path) -> None:
+    with ptir5.open(flptir_stack_path) as f:
+        guid = f.measurements[0].guid
+    status, ctype, body = _get(conn, f"/files/1/measurements/{guid}/image/0?format=png&w=64&h=32")
+    assert status == 200 and ctype == "image/png"
+    assert body.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", body[16:24])
+    assert (width, height) == (64, 32)
+
+
+def test_spectrum_measurement(conn: http.client.HTTPConnection, optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        data = _npy(conn, f"/files/2/measurements/{m.guid}/spectrum")
+        np.testing.assert_array_equal(data, m.data)
+
+
+def test_errors(conn: http.client.HTTPConnection) -> None:
+    assert _get(conn, "/nope")[0] == 404
+    assert _get(conn, "/files/9/measurements")[0] == 404
+    assert _get(conn, "/files/0/measurements/not-a-guid/metadata")[0] == 404
+    guid = _json(conn, "/files/0/measurements")[0]["guid"]
+    assert _get(conn, f"/files/0/measurements/{guid}/image/9999")[0] == 400
+    assert _get(conn, f"/files/0/measurements/{guid}/spectrum")[0] == 400
+    assert _get(conn, f"/files/0/measurements/{guid}/image/0?format=gif")[0] == 400
+    # The connection is still usable after error responses.
+    assert _get(conn, "/files")[0] == 200
+
+
+def _reject_constant(name: str) -> None:
+    raise AssertionError(f"invalid JSON constant {name}")
+
+
+def test_non_finite_json(
+    conn: http.client.HTTPConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def spectrum(self: FloatHypercube3D, x: int, y: int) -> np.ndarray[Any, Any]:
+        return np.array([1.5, np.nan, np.inf, -np.inf], dtype=np.float32)
+
+    monkeypatch.setattr(FloatHypercube3D, "read_spectrum", spectrum)
+    guid = _json(conn, "/files/0/measurements")[0]["guid"]
+    _, _, body = _get(conn, f"/files/0/measurements/{guid}/spectrum?x=0&y=0&format=json")
+    # Strict parsers (a browser's JSON.parse) reject NaN and Infinity.
+    payload = json.loads(body, parse_constant=_reject_constant)
+    assert payload["y"] == [1.5, None, None, None]
+
+
+def test_read_failure_is_500(
+    conn: http.client.HTTPConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing(self: FloatHypercube3D, x: int, y: int) -> np.ndarray[Any, Any]:
+        raise OSError("disk went away")
+
+    monkeypatch.setattr(FloatHypercube3D, "read_spectrum", failing)
+    guid = _json(conn, "/files/0/measurements")[0]["guid"]
+    status, ctype, body = _get(conn, f"/files/0/measurements/{guid}/spectrum?x=0&y=0")
+    assert status == 500 and ctype == "application/json"
+    assert "disk went away" in json.loads(body)["error"]
+    assert _get(conn, "/files")[0] == 200
+
+
+def test_cache_hits(conn: http.client.HTTPConnection, server: TileServer) -> None:
+    guid = _json(conn, "/files/0/measurements")[0]["guid"]
+    url = f"/files/0/measurements/{guid}/image/5?y0=0&x0=0"
+    first = _get(conn, url)
+    with ptir5.trace() as t:
+        again = _get(conn, f"/files/0/measurements/{guid}/image/5?x0=0&y0=0")
+    assert again == first
+    assert t.count() == 0
+    assert server.cache.stats()["hits"] >= 1
+
+
+def test_per_file_limit(server: TileServer, conn: http.client.HTTPConnection) -> None:
+    server.wait_s = 0.05
+    limit = server.limits[0]
+    held = 0
+    while limit.acquire(blocking=False):
+        held += 1
+    try:
+        assert _get(conn, "/files/0/measurements")[0] == 503
+        assert _get(conn, "/files/1/measurements")[0] == 200
+    finally:
+        for _ in range(held):
+            limit.release()
+    assert _get(conn, "/files/0/measurements")[0] == 200
+
+
+def test_cli_parses_serve(hyperspectra_path: Path) -> None:
+    args = build_parser().parse_args(["serve", str(hyperspectra_path), "--port", "0"])
+    assert args.command == "serve"
+    assert args.port == 0
+    assert args.per_file == 4
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import numpy as np
+import pytest
 
 import ptir5
 from ptir5._reader import HDF5Reader
@@ -81,3 +82,27 @@ class TestSliceBasedReading:
 
             full = m._reader.read_dataset(data_path)
             np.testing.assert_array_equal(sliced, full[0, :, :])
+
+
+class TestIterTiles:
+    def test_default_tiles_cover_data(self, hyperspectra_path: Path) -> None:
+        with ptir5.open(hyperspectra_path) as f:
+            m = f.measurements[0]
+            full = m.data
+            out = np.empty_like(full)
+            for slices, tile in m.iter_tiles():
+                out[slices] = tile
+            np.testing.assert_array_equal(out, full)
+
+    def test_explicit_tile_shape(self, flptir_stack_path: Path) -> None:
+        with ptir5.open(flptir_stack_path) as f:
+            m = f.measurements[0]
+            tiles = list(m.iter_tiles((2, 128, 256, 4)))
+            assert len(tiles) == 6
+            assert tiles[-1][1].shape == (1, 128, 256, 4)
+
+    def test_bad_tile_shape_raises(self, optir_spectrum_path: Path) -> None:
+        with ptir5.open(optir_spectrum_path) as f:
+            m = f.measurements[0]
+            with pytest.raises(ValueError):
+                list(m.iter_tiles((10, 10)))
@@ -0,0 +1,171 @@
+"""Tests for streaming measurement statistics and the stats sidecar cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5 import stats as stats_mod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def nan_cube_path(tmp_path: Path, write_measurement: Callable[..., Path]) -> Path:
+    """Chunked cube whose value range grows from tile to tile, with NaN and inf."""
+    path = tmp_path / "nan_cube.ptir"
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(30, 16, 16)).astype(np.float32)
+    data *= np.linspace(0.01, 1000, 30, dtype=np.float32)[:, None, None]
+    data[3, 0, :5] = np.nan
+    data[7, 2, 2] = np.inf
+    return write_measurement(path, data, chunks=(4, 8, 8))
+
+
+def test_stats_match_numpy(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        s = m.stats(bins=32)
+        data = m.data.astype(np.float64)
+    assert isinstance(s, ptir5.MeasurementStats)
+    assert s.count == data.size
+    assert s.nan_count == 0
+    assert s.min == pytest.approx(data.min())
+    assert s.max == pytest.approx(data.max())
+    assert s.mean == pytest.approx(data.mean(), rel=1e-9)
+    assert s.std == pytest.approx(data.std(), rel=1e-9)
+    assert len(s.histogram) == 32
+    assert len(s.bin_edges) == 33
+    assert sum(s.histogram) == data.size
+    tolerance = (data.max() - data.min()) / 1000
+    assert s.percentiles[50.0] == pytest.approx(np.percentile(data, 50), abs=tolerance)
+
+
+def test_per_band_stats(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        s = m.stats()
+        data = m.data.astype(np.float64)
+    assert s.per_plane is not None
+    assert len(s.per_plane["mean"]) == 574
+    np.testing.assert_allclose(s.per_plane["mean"], data.mean(axis=(1, 2)), rtol=1e-6)
+    np.testing.assert_allclose(s.per_plane["max"], data.max(axis=(1, 2)))
+
+
+def test_spectrum_has_no_per_plane(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        assert f.measurements[0].stats().per_plane is None
+
+
+def test_nan_and_growing_range(nan_cube_path: Path) -> None:
+    with ptir5.open(nan_cube_path) as f:
+        m = f.measurements[0]
+        s = m.stats(percentiles=(10.0, 50.0, 90.0))
+        data = m.data.astype(np.float64)
+    finite = data[np.isfinite(data)]
+    assert s.nan_count == 5
+    assert s.inf_count == 1
+    assert s.count == finite.size
+    assert s.min == pytest.approx(finite.min())
+    assert s.max == pytest.approx(finite.max())
+    assert s.std == pytest.approx(finite.std(), rel=1e-9)
+    tolerance = (finite.max() - finite.min()) / 1000
+    for q in (10.0, 50.0, 90.0):
+        assert s.percentiles[q] == pytest.approx(np.percentile(finite, q), abs=tolerance)
+    assert s.per_plane is not None
+    assert s.per_plane["nan_count"][3] == 5
+
+
+def test_byte_stack_is_exact(flptir_stack_path: Path) -> None:
+    with ptir5.open(flptir_stack_path) as f:
+        m = f.measurements[0]
+        s = m.stats(bins=8)
+        data = m.data
+    assert s.exact
+    assert s.min == data.min()
+    assert s.max == data.max()
+    assert s.percentiles[50.0] == np.percentile(data, 50, method="inverted_cdf")
+    assert s.per_plane is not None
+    assert len(s.per_plane["mean"]) == data.shape[0]
+
+
+@pytest.mark.parametrize("values", [[10], [-5, 0, 7], [-128, 127]])
+def test_signed_bytes(
+    tmp_path: Path, values: list[int], write_measurement: Callable[..., Path]
+) -> None:
+    data = np.resize(np.array(values, dtype=np.int8), (6, 5, 1))
+    path = write_measurement(tmp_path / "int8.ptir", data, "CameraImage")
+    with ptir5.open(path) as f:
+        s = f.measurements[0].stats(bins=4)
+    assert s.exact
+    assert (s.min, s.max) == (min(values), max(values))
+    assert s.percentiles[50.0] == np.percentile(data, 50, method="inverted_cdf")
+    assert sum(s.histogram) == data.size
+
+
+def test_sidecar_cache(hyperspectra_path: Path, tmp_path: Path) -> None:
+    path = tmp_path / hyperspectra_path.name
+    path.write_bytes(hyperspectra_path.read_bytes())
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        first = m.stats(cache=True)
+        sidecar = path.with_name(path.name + ".stats.json")
+        assert sidecar.exists()
+
+        with ptir5.trace() as t:
+            second = m.stats(cache=True)
+        assert t.count("read_dataset_slice") == 0
+        assert second == first
+        # A different bin count is a separate entry.
+        assert len(m.stats(bins=8, cache=True).histogram) == 8
+        assert len(json.loads(sidecar.read_text())["entries"]) == 2
+
+
+def test_cache_invalidated_when_file_changes(hyperspectra_path: Path, tmp_path: Path) -> None:
+    path = tmp_path / hyperspectra_path.name
+    path.write_bytes(hyperspectra_path.read_bytes())
+    cache_dir = tmp_path / "cache"
+    with ptir5.open(path) as f:
+        f.measurements[0].stats(cache=cache_dir)
+    assert len(list(cache_dir.glob(path.name + ".*.stats.json"))) == 1
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    with ptir5.open(path) as f, ptir5.trace() as t:
+        f.measurements[0].stats(cache=cache_dir)
+    assert t.count("read_dataset_slice") > 0
+
+
+def test_shared_cache_dir_keeps_same_named_files_apart(
+    hyperspectra_path: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    paths = [tmp_path / d / hyperspectra_path.name for d in ("a", "b")]
+    for p in paths:
+        p.parent.mkdir()
+        p.write_bytes(hyperspectra_path.read_bytes())
+    st = paths[1].stat()
+    os.utime(paths[1], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    for p in paths:
+        with ptir5.open(p) as f:
+            f.measurements[0].stats(cache=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 2
+    for p in paths:
+        with ptir5.open(p) as f, ptir5.trace() as t:
+            f.measurements[0].stats(cache=cache_dir)
+        assert t.count("read_dataset_slice") == 0
+
+
+def test_adaptive_histogram_merges_exactly() -> None:
+    hist = stats_mod._AdaptiveHistogram(nbins=16)
+    hist.add(np.array([0.0, 1.0]))
+    hist.add(np.array([-50.0, 200.0]))
+    assert hist.counts.sum() == 4
+    assert hist.lo <= -50.0 < 200.0 < hist.hi
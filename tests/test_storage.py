@@ -0,0 +1,92 @@
+"""Tests for storage-layout introspection."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import h5py
+import numpy as np
+
+import ptir5
+from ptir5.repack import repack
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def test_contiguous(camera_image_path: Path) -> None:
+    with ptir5.open(camera_image_path) as f:
+        m = f.measurements[0]
+        info = m.storage_info()
+        data = m.data
+    assert isinstance(info, ptir5.StorageInfo)
+    assert info.layout == "contiguous"
+    assert info.chunks is None and info.chunk_grid == 0 and info.num_chunks == 0
+    assert info.filters == ()
+    assert info.shape == data.shape and info.dtype == "uint8"
+    assert info.logical_bytes == info.stored_bytes == data.nbytes
+    assert info.compression_ratio == 1.0
+    # The offset points at the raw array in the file.
+    assert info.offset is not None
+    raw = camera_image_path.read_bytes()[info.offset : info.offset + info.stored_bytes]
+    assert raw == data.tobytes()
+
+
+def test_chunked_and_compressed(tmp_path: Path, write_measurement: Callable[..., Path]) -> None:
+    data = np.zeros((40, 12, 10), dtype=np.float32)
+    data[:20] = 1.5
+    path = write_measurement(
+        tmp_path / "chunked.ptir", shape=data.shape, dtype=data.dtype, chunks=(8, 12, 5),
+        compression="gzip", shuffle=True,
+    )
+    with h5py.File(path, "a") as f:
+        (g,) = f["MEASUREMENTS"].values()
+        g["DATA"][:20] = data[:20]
+        g.create_dataset("MaxValue", data=np.ones((12, 10), dtype=np.float32))
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        info = m.storage_info()
+        aux = m.storage_info("MaxValue")
+    assert info.layout == "chunked"
+    assert info.chunks == (8, 12, 5)
+    assert info.filters == ("shuffle", "gzip")
+    assert info.compression == "gzip"
+    assert info.chunk_grid == 5 * 1 * 2
+    # Only the first 20 planes were written, so only 3 of 5 chunk rows exist.
+    assert info.num_chunks == 3 * 2
+    assert info.offset is None
+    assert info.logical_bytes == data.nbytes
+    assert info.stored_bytes < data.nbytes
+    assert info.compression_ratio is not None and info.compression_ratio > 1
+    assert aux.layout == "contiguous" and aux.shape == (12, 10)
+
+
+def test_storage_summary(tmp_path: Path, hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        summary = f.storage_summary()
+    assert isinstance(summary, ptir5.StorageSummary)
+    assert len(summary.datasets) == 3
+    assert summary.layouts() == {"contiguous": 3}
+    assert summary.filters() == {}
+    assert summary.file_bytes == hyperspectra_path.stat().st_size
+    assert summary.logical_bytes == sum(d.logical_bytes for d in summary.datasets)
+    assert "contiguous" in str(summary)
+    json.dumps(summary.to_dict())
+
+    dst = tmp_path / "packed.ptir"
+    repack(hyperspectra_path, dst, layout="plane", compression="gzip:4", benchmark=False)
+    with ptir5.open(dst) as f:
+        packed = f.storage_summary()
+    assert packed.layouts() == {"chunked": 3}
+    assert packed.filters() == {"shuffle": 3, "gzip": 3}
+    assert packed.num_chunks == 574 + 1 + 1
+    assert packed.logical_bytes == summary.logical_bytes
+
+
+def test_in_memory_summary(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path.read_bytes()) as f:
+        summary = f.storage_summary()
+    assert summary.file_bytes is None
+    assert len(summary.datasets) == 1
@@ -0,0 +1,83 @@
+"""Tests for I/O tracing hooks on HDF5Reader."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import ptir5
+from ptir5 import tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+GUID = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+
+def test_trace_collects_dataset_reads(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        with ptir5.trace() as t:
+            _ = m.read_spectrum(1, 2)
+            _ = m.data
+    slices = [e for e in t.events if e.op == "read_dataset_slice"]
+    fulls = [e for e in t.events if e.op == "read_dataset"]
+    assert len(slices) == 1 and len(fulls) == 1
+    assert slices[0].guid == m.guid
+    assert slices[0].elements == 574
+    assert slices[0].bytes_read == 574 * 4
+    assert fulls[0].bytes_read == 574 * 20 * 20 * 4
+    assert slices[0].chunks_touched is None  # contiguous
+    assert t.summary()["read_dataset"]["calls"] == 1
+    assert t.by_guid()[m.guid]["bytes"] == t.total_bytes
+
+
+def test_trace_attribute_loads_and_lookups(optir_spectrum_path: Path) -> None:
+    with ptir5.trace() as t, ptir5.open(optir_spectrum_path) as f:
+        _ = f.measurements[0].label
+    assert t.count("read_attrs") >= 2  # TYPE, then the metadata load
+    assert t.count("lookup") >= 1
+    assert all(e.duration_s >= 0 for e in t.events)
+
+
+def test_chunks_touched_for_chunked_dataset(
+    tmp_path: Path, write_measurement: Callable[..., Path]
+) -> None:
+    path = write_measurement(
+        tmp_path / "chunked.ptir", np.zeros((40, 16, 16), np.float32), chunks=(10, 8, 8)
+    )
+    with ptir5.open(path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        with ptir5.trace() as t:
+            m.read_spectrum(0, 0)
+            m.read_image(5)
+            _ = m.data
+    touched = [e.chunks_touched for e in t.events if e.op.startswith("read_dataset")]
+    assert touched == [4, 4, 16]
+
+
+def test_hooks_and_removal(optir_spectrum_path: Path) -> None:
+    seen: list[ptir5.IOEvent] = []
+    ptir5.add_io_hook(seen.append)
+    try:
+        with ptir5.open(optir_spectrum_path) as f:
+            _ = f.measurements[0].data
+    finally:
+        ptir5.remove_io_hook(seen.append)
+    assert any(e.op == "read_dataset" for e in seen)
+    n = len(seen)
+    with ptir5.open(optir_spectrum_path) as f:
+        _ = f.measurements[0].data
+    assert len(seen) == n
+    assert tracing._hooks == ()
+
+
+def test_chunks_touched_helper() -> None:
+    assert tracing.chunks_touched((100,), (10,), (slice(5, 25),)) == 3
+    assert tracing.chunks_touched((100,), (10,), (slice(0, 100, 50),)) == 2
+    assert tracing.chunks_touched((100, 10), (10, 10), (3,)) == 1
+    assert tracing.chunks_touched((100,), None, None) is None
+    assert tracing.guid_from_path(f"MEASUREMENTS/{GUID}/GENERATED/x/DATA") == GUID
@@ -0,0 +1,90 @@
+"""Tests for xarray conversion with physical coordinates."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import ptir5
+from ptir5._reader import HDF5Reader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+xr = pytest.importorskip("xarray")
+
+
+def test_spectrum_coords(optir_spectrum_path: Path) -> None:
+    with ptir5.open(optir_spectrum_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatSpectrum1D)
+        arr = m.to_xarray()
+        assert arr.dims == ("wavenumber",)
+        np.testing.assert_array_equal(arr["wavenumber"].values, m.x_values)
+        assert arr.attrs["Label"] == "O-PTIR0 1"
+        np.testing.assert_array_equal(arr.values, m.data)
+
+
+def test_hypercube_coords(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        arr = m.to_xarray()
+        assert arr.dims == ("wavenumber", "y", "x")
+        assert arr["x_um"].values[-1] < m.image_width_um
+        assert arr["y_um"].size == m.pixel_height
+        pixel = arr.sel(x_um=0.0, y_um=0.0, method="nearest")
+        np.testing.assert_array_equal(pixel.values, m.read_spectrum(0, 0))
+
+
+def test_sel_reads_only_needed_planes(hyperspectra_path: Path) -> None:
+    with ptir5.open(hyperspectra_path) as f:
+        m = f.measurements[0]
+        assert isinstance(m, ptir5.FloatHypercube3D)
+        arr = m.to_xarray(lazy=True)
+        calls: list[tuple[object, ...]] = []
+        original = HDF5Reader.read_dataset_slice
+
+        def spy(self: HDF5Reader, path: str, slices: tuple[object, ...]) -> object:
+            calls.append(slices)
+            return original(self, path, slices)
+
+        with patch.object(HDF5Reader, "read_dataset_slice", spy):
+            band = arr.sel(wavenumber=slice(1500, 1700))
+            assert not calls
+            values = band.values
+        assert values.shape == (100, 20, 20)
+        assert len(calls) == 1
+        first = calls[0][0]
+        assert isinstance(first, slice)
+        assert (first.start, first.stop) == (376, 476)
+        np.testing.assert_array_equal(values, m.data[376:476])
+
+
+def test_byte_stack_dims(flptir_stack_path: Path) -> None:
+    with ptir5.open(flptir_stack_path) as f:
+        arr = f.measurements[0].to_xarray(lazy=False)
+        assert arr.dims == ("frame", "y", "x", "channel")
+        assert arr.sel(wavenumber=1002.0).shape == (256, 256, 4)
+
+
+def test_dataset_includes_auxiliary(optir_image_stack_path: Path) -> None:
+    with ptir5.open(optir_image_stack_path) as f:
+        ds = f.measurements[0].to_xarray(dataset=True)
+        assert set(ds.data_vars) >= {"DATA", "Wavenumber", "Temperature"}
+        assert ds["Temperature"].dims == ("wavenumber",)
+        np.testing.assert_allclose(ds["Wavenumber"].values, ds["wavenumber"].values)
+
+
+def test_lazy_array_pickles(optir_image_path: Path) -> None:
+    with ptir5.open(optir_image_path) as f:
+        m = f.measurements[0]
+        expected = m.data[:5, :5]
+        arr = m.to_xarray()
+    clone = pickle.loads(pickle.dumps(arr))
+    np.testing.assert_array_equal(clone[:5, :5].values, expected)
+    ptir5.close_cached_files()